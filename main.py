@@ -15,30 +15,236 @@ Features:
 
 import sys
 import os
+import re
 import time
+import types
 import argparse
-import asyncio
-from typing import Dict, Any
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 from dotenv import load_dotenv
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.traceback import install
+
+# Public surface for programmatic callers (tests, scripts); everything heavy
+# stays behind lazy imports inside the action handlers
+__all__ = ["main", "parse_arguments", "run_health_check", "load_profile", "console"]
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Install rich traceback for better error display
-install(show_locals=True)
+# Add src directory to path for imports — only when running as a script from
+# a checkout; installed-package use resolves imports without the extra entry
+if not __package__:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+# Performance: rich is only imported when something is actually rendered
+_console = None
+
+# When output is piped (CI logs, `tee`, cron) or NO_COLOR is set, Rich still
+# runs its full styling pipeline before stripping the colors back out. Skip
+# it entirely for plain-string status messages in that case.
+_USE_RICH = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+_MARKUP_RE = re.compile(r"\[/?[^\]]+\]")
+
+
+def _strip_markup(msg: str) -> str:
+    """Remove Rich markup tags like [bold blue]...[/bold blue] from a string."""
+    return _MARKUP_RE.sub("", msg)
+
+
+@lru_cache(maxsize=32)
+def _header(markup: str):
+    """Cache the parsed header renderable for a markup string.
+
+    Action headers repeat verbatim on every interactive-menu pass; caching
+    the parsed rich.text.Text (or the stripped plain string on non-TTY
+    output) skips the markup parse after the first render.
+    """
+    if not _USE_RICH:
+        return _strip_markup(markup)
+    from rich.text import Text
+    return Text.from_markup(markup)
+
+
+def _get_console():
+    """Lazily construct and cache the shared Rich console."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+class _ConsoleProxy:
+    """Defers the rich.console import until the first render call.
+
+    Plain-string prints on a non-TTY (or with NO_COLOR set) bypass Rich
+    entirely: markup is stripped with a regex and the text goes straight to
+    stdout, so captured-output runs never pay for styling or the rich import.
+    """
+
+    def print(self, *args, **kwargs):
+        if not _USE_RICH and not kwargs and all(isinstance(a, str) for a in args):
+            print(*(_strip_markup(a) for a in args))
+            return
+        _get_console().print(*args, **kwargs)
+
+    def __getattr__(self, item):
+        return getattr(_get_console(), item)
+
+
+# Console instance for testing (proxy keeps call sites unchanged)
+console = _ConsoleProxy()
+
+
+class LazyLoader(types.ModuleType):
+    """Lazily import a module only on first attribute access.
+
+    Performance: heavy modules (scrapers, dashboard, profile helpers) are only
+    paid for when an action actually touches them, so fast paths like
+    --help/benchmark/health-check import strictly less.
+    """
+
+    def __init__(self, local_name: str, parent_module_globals: Dict[str, Any], name: str):
+        self._local_name = local_name
+        self._parent_module_globals = parent_module_globals
+        super().__init__(name)
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+    def _load(self):
+        """Import the target module and replace this proxy in the parent globals."""
+        module = importlib.import_module(self.__name__)
+        self._parent_module_globals[self._local_name] = module
+        self.__dict__.update(module.__dict__)
+        return module
 
-# Create console instance for testing
-console = Console()
+    def __getattr__(self, item):
+        module = self._load()
+        return getattr(module, item)
 
-# Performance: Lazy import flag for heavy modules
-_HEAVY_IMPORTS_LOADED = False
+    def __dir__(self):
+        module = self._load()
+        return dir(module)
+
+
+# Heavy modules deferred until first attribute access (see LazyLoader above)
+scraping_actions = LazyLoader("scraping_actions", globals(), "src.cli.actions.scraping_actions")
+dashboard_actions_module = LazyLoader(
+    "dashboard_actions_module", globals(), "src.cli.actions.dashboard_actions"
+)
+profile_helpers = LazyLoader("profile_helpers", globals(), "src.utils.profile_helpers")
+
+
+def load_profile(profile_name: str):
+    """Load a profile, preferring an mtime-keyed pickle cache on disk.
+
+    Repeat invocations (scripted loops, health checks) skip JSON parsing and
+    validation entirely: if the cache pickle is at least as new as the source
+    profile JSON, it is loaded directly. Any cache problem silently falls back
+    to the normal profile helpers.
+    """
+    from pathlib import Path
+
+    src_path = Path(f"profiles/{profile_name}/{profile_name}.json")
+    cache_path = src_path.parent / ".profile.cache.pkl"
+    try:
+        if src_path.exists() and cache_path.exists() and cache_path.stat().st_mtime >= src_path.stat().st_mtime:
+            import pickle
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except Exception:
+        # Corrupt/unreadable cache: ignore and reload from source
+        pass
+
+    profile = profile_helpers.load_profile(profile_name)
+    if profile:
+        try:
+            import pickle
+            with open(cache_path, "wb") as f:
+                pickle.dump(profile, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Cache write failures must never break profile loading
+            pass
+    return profile
+
+
+def _get_profile(profile_name: str) -> Optional[Dict[str, Any]]:
+    """Memoized profile resolution for repeated lookups within one process.
+
+    Tests and scripted callers invoke main() repeatedly with the same profile;
+    caching here makes every resolution after the first O(1). The memo key
+    includes the profile file's mtime, so editing a profile mid-session
+    (interactive mode) invalidates the cached dict instead of serving stale
+    data.
+    """
+    from pathlib import Path
+
+    try:
+        mtime_ns = Path(f"profiles/{profile_name}/{profile_name}.json").stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    profile = _get_profile_cached(profile_name, mtime_ns)
+    # Hand each caller its own copy: handlers mutate the profile (e.g.
+    # --keywords overrides), and a shared cached dict would leak one
+    # call's overrides into every later call for the same profile
+    return dict(profile) if profile is not None else None
+
+
+@lru_cache(maxsize=4)
+def _get_profile_cached(profile_name: str, _mtime_ns: int) -> Optional[Dict[str, Any]]:
+    profile = load_profile(profile_name)
+    if profile is None:
+        return None
+    profile = dict(profile)
+    profile["profile_name"] = profile_name
+    return profile
+
+
+@dataclass(frozen=True, slots=True)
+class CliArgs:
+    """Immutable argument bundle mirroring the argparse defaults.
+
+    Keeping the defaults here and returning CliArgs from parse_arguments
+    means programmatic main() calls and the CLI can never silently diverge.
+    """
+
+    profile: str = "Nirajan"
+    action: str = "interactive"
+    sites: Optional[str] = None
+    keywords: Optional[str] = None
+    batch: int = 10
+    days: int = 14
+    pages: int = 3
+    jobs: int = 20
+    headless: bool = False
+    verbose: bool = False
+    workers: int = 4
+    timeout: int = 30
+    retry_attempts: int = 3
+    fetch_batch_size: int = 32
+    fetch_batch_timeout: float = 5.0
+    processing_method: str = "auto"
+    external_workers: int = 6
+    jobspy_preset: str = "quality"
+    enable_eluta: bool = True
+    jobspy_only: bool = False
+    multi_site_workers: bool = False
+    hours_old: int = 336
+    max_jobs_total: Optional[int] = None
+
+
+# Actions whose handlers are known to touch the deferred heavy modules
+HEAVY_ACTIONS = {"scrape", "fast-pipeline", "process", "process-jobs", "apply", "dashboard", "interactive"}
+
+
+def _prewarm_heavy_imports():
+    """Force the LazyLoader proxies to resolve (run on a background thread)."""
+    try:
+        profile_helpers._load()
+        dashboard_actions_module._load()
+        scraping_actions._load()
+    except Exception:
+        # Failures surface later at the real call site with proper reporting
+        pass
 
 
 def ensure_auto_job_env():
@@ -77,19 +283,24 @@ def ensure_auto_job_env():
         pass
 
 
-def _ensure_imports():
-    """Lazy import heavy modules only when needed."""
-    global _HEAVY_IMPORTS_LOADED
-    if not _HEAVY_IMPORTS_LOADED:
-        global ScrapingActions, DashboardActions, load_profile
-        from src.cli.actions.scraping_actions import ScrapingActions
-        from src.cli.actions.dashboard_actions import DashboardActions
-        from src.utils.profile_helpers import load_profile
-        _HEAVY_IMPORTS_LOADED = True
+def _bounded_int(lo: int, hi: int):
+    """Build an argparse type validator for an inclusive int range.
 
+    Cheaper than choices=range(...): argparse iterates a range on every
+    validation and dumps all its members into error messages.
+    """
+    def _parse(value: str) -> int:
+        number = int(value)
+        if not lo <= number <= hi:
+            raise argparse.ArgumentTypeError(f"must be in [{lo}, {hi}]")
+        return number
 
-def parse_arguments():
-    """Parse command line arguments with Improved validation."""
+    _parse.__name__ = f"int[{lo},{hi}]"
+    return _parse
+
+
+def _build_parser():
+    """Construct the full ArgumentParser (static definition, cacheable)."""
     parser = argparse.ArgumentParser(
         description="AutoJobAgent - Job Automation System",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -113,7 +324,7 @@ Performance Optimized Examples:
     )
     parser.add_argument(
         "--action",
-        choices=["scrape", "dashboard", "interactive", "benchmark", "apply", "process", "process-jobs", "fetch-descriptions", "analyze-jobs", "generate-docs", "shutdown", "pipeline", "health-check", "fast-pipeline", "jobspy-pipeline", "legacy-process-jobs", "analyze-resume"],
+        choices=["scrape", "dashboard", "interactive", "benchmark", "apply", "process", "process-jobs", "fetch-descriptions", "analyze-jobs", "generate-docs", "shutdown", "pipeline", "health-check", "fast-pipeline", "jobspy-pipeline", "legacy-process-jobs", "analyze-resume", "browser-daemon"],
         default="interactive",
         help="Action to perform: interactive (DEFAULT: show menu), "
              "process/process-jobs (two-stage CPU+GPU processing), "
@@ -128,13 +339,15 @@ Performance Optimized Examples:
     parser.add_argument("--keywords", help="Comma-separated list of keywords")
     parser.add_argument("--batch", type=int, default=10, help="Number of jobs per batch")
     parser.add_argument("--days", type=int, default=14, choices=[7, 14, 30], help="Days to look back (7, 14, or 30)")
-    parser.add_argument("--pages", type=int, default=3, choices=range(1, 11), metavar="1-10", help="Max pages per keyword (1-10)")
-    parser.add_argument("--jobs", type=int, default=20, choices=range(5, 101), metavar="5-100", help="Max jobs per keyword (5-100)")
+    parser.add_argument("--pages", type=_bounded_int(1, 10), default=3, metavar="1-10", help="Max pages per keyword (1-10)")
+    parser.add_argument("--jobs", type=_bounded_int(5, 100), default=20, metavar="5-100", help="Max jobs per keyword (5-100)")
     parser.add_argument("--headless", action="store_true", help="Run browser in headless mode (faster)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("--workers", type=int, default=4, help="Number of worker processes (default: 4)")
     parser.add_argument("--timeout", type=int, default=30, help="Request timeout in seconds (default: 30)")
     parser.add_argument("--retry-attempts", type=int, default=3, help="Number of retry attempts (default: 3)")
+    parser.add_argument("--fetch-batch-size", type=int, default=32, help="Jobs per description-fetch micro-batch (default: 32)")
+    parser.add_argument("--fetch-batch-timeout", type=float, default=5.0, help="Max seconds the analyzer waits on a fetch batch before re-checking (default: 5)")
     
     # Fast pipeline specific options
     parser.add_argument("--processing-method", choices=["auto", "gpu", "hybrid", "rule_based"], 
@@ -150,11 +363,145 @@ Performance Optimized Examples:
     parser.add_argument("--hours-old", type=int, default=336, help="Maximum age of jobs in hours (default: 336 = 14 days)")
     parser.add_argument("--max-jobs-total", type=int, help="Override maximum total jobs for comprehensive searches")
 
-    return parser.parse_args()
+    return parser
+
+
+# Parser definition is static: build it once per process and reuse
+_parser = None
+
+
+def parse_arguments():
+    """Parse command line arguments with Improved validation.
+
+    The ~20 add_argument calls only run the first time; repeated calls
+    (tests, programmatic main() loops) reuse the already built parser.
+    """
+    global _parser
+    if _parser is None:
+        _parser = _build_parser()
+    return CliArgs(**vars(_parser.parse_args()))
+
+
+# Unix socket where the optional browser pool daemon listens
+_BROWSER_POOL_SOCKET = "/tmp/joblens-browsers.sock"
+
+
+def _browser_pool_rpc(request: Dict[str, Any], timeout: float = 0.5):
+    """Send one JSON request to the browser pool daemon; None if unavailable.
+
+    The daemon is optional: connection failures mean no pool is running and
+    callers fall back to launching browsers in-process.
+    """
+    import json
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(_BROWSER_POOL_SOCKET)
+            sock.sendall((json.dumps(request) + "\n").encode())
+            data = sock.makefile("rb").readline()
+        return json.loads(data) if data else None
+    except Exception:
+        return None
+
+
+async def _browser_daemon(pool_size: int = 2):
+    """Run a background daemon holding pre-warmed Chromium browsers.
+
+    Each browser exposes a CDP endpoint; CLI invocations acquire/release
+    endpoints over a tiny JSON RPC on a unix socket, skipping the multi-second
+    Chromium cold start per scrape.
+    """
+    import asyncio
+    import json
+    from playwright.async_api import async_playwright
+
+    if os.path.exists(_BROWSER_POOL_SOCKET):
+        os.unlink(_BROWSER_POOL_SOCKET)
+
+    async with async_playwright() as p:
+        pool = []
+        for i in range(pool_size):
+            port = 9301 + i
+            await p.chromium.launch(headless=True, args=[f"--remote-debugging-port={port}"])
+            pool.append({"endpoint": f"http://127.0.0.1:{port}", "busy": False})
+
+        console.print(f"[green]✅ Browser pool ready: {len(pool)} pre-warmed browsers[/green]")
+
+        async def handle(reader, writer):
+            try:
+                line = await reader.readline()
+                req = json.loads(line or b"{}")
+                if req.get("op") == "acquire":
+                    entry = next((e for e in pool if not e["busy"]), None)
+                    if entry:
+                        entry["busy"] = True
+                        resp = {"endpoint": entry["endpoint"]}
+                    else:
+                        resp = {"error": "pool exhausted"}
+                elif req.get("op") == "release":
+                    for entry in pool:
+                        if entry["endpoint"] == req.get("endpoint"):
+                            entry["busy"] = False
+                    resp = {"ok": True}
+                else:
+                    resp = {"error": "unknown op"}
+                writer.write((json.dumps(resp) + "\n").encode())
+                await writer.drain()
+            except Exception:
+                pass
+            finally:
+                writer.close()
+
+        server = await asyncio.start_unix_server(handle, path=_BROWSER_POOL_SOCKET)
+        console.print(f"[cyan]🔌 Listening on {_BROWSER_POOL_SOCKET} (Ctrl+C to stop)[/cyan]")
+        async with server:
+            await server.serve_forever()
+
+
+def _kill_orphan_chrome(profile_name: str) -> int:
+    """Kill leftover Chrome/Chromium processes from previous scrape runs.
+
+    Orphaned renderers from crashed Playwright sessions accumulate memory and
+    stall repeat runs. Only processes whose --user-data-dir points inside this
+    profile's directory are touched; matching the bare profile name anywhere
+    in the command line would catch unrelated browsers (e.g. a tab whose URL
+    happens to contain it). Returns the number killed.
+    """
+    killed = 0
+    profile_dir = os.path.abspath(os.path.join("profiles", profile_name))
+    try:
+        import psutil
+
+        for proc in psutil.process_iter(["name", "cmdline"]):
+            try:
+                name = (proc.info.get("name") or "").lower()
+                if "chrome" not in name and "chromium" not in name:
+                    continue
+                data_dir = next(
+                    (
+                        arg.split("=", 1)[1]
+                        for arg in (proc.info.get("cmdline") or [])
+                        if arg.startswith("--user-data-dir=")
+                    ),
+                    None,
+                )
+                if data_dir and os.path.abspath(data_dir).startswith(profile_dir):
+                    proc.kill()
+                    killed += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    except Exception:
+        # Cleanup is best-effort; never block scraping on it
+        pass
+    return killed
 
 
 async def run_optimized_scraping(profile: Dict[str, Any], args) -> bool:
     """Run optimized scraping using the Core Eluta scraper with 5-tab optimization."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -162,8 +509,9 @@ async def run_optimized_scraping(profile: Dict[str, Any], args) -> bool:
     ) as progress:
         task = progress.add_task("🚀 Starting Core Eluta scraping with 5-tab optimization...", total=None)
         try:
-            from src.scrapers.core_eluta_scraper import run_core_eluta_scraper
-            
+            from src.scrapers.unified_eluta_scraper import run_core_eluta_scraper
+            import asyncio
+
             # Build config for core scraper with 5-tab optimization
             config = {
                 "headless": args.headless,
@@ -175,10 +523,45 @@ async def run_optimized_scraping(profile: Dict[str, Any], args) -> bool:
                 "entry_level_only": False,
                 "max_extra_tabs": 5,  # 5-tab threshold optimization
                 "tab_monitoring_interval": 3,  # Monitor every 3 jobs
+                # Bound in-flight page navigations to the worker count
+                "max_concurrent": getattr(args, "workers", 4),
+                "semaphore": asyncio.BoundedSemaphore(getattr(args, "workers", 4)),
+                # Memory-pressure guards (honored by tab management downstream)
+                "idle_tab_ttl_s": 300,  # Close tabs idle longer than this
+                "free_mem_floor_mb": 500,  # Trigger cleanup below this floor
+                "kill_orphan_chrome_on_start": True,
             }
-            
+
+            if config["kill_orphan_chrome_on_start"]:
+                killed = _kill_orphan_chrome(profile["profile_name"])
+                if killed:
+                    console.print(f"[yellow]🧹 Cleaned up {killed} orphaned Chrome processes from previous runs[/yellow]")
+
+            # Prefer a pre-warmed browser from the pool daemon when one is running
+            pooled = _browser_pool_rpc({"op": "acquire"})
+            if pooled and pooled.get("endpoint"):
+                config["cdp_endpoint"] = pooled["endpoint"]
+                console.print(f"[cyan]♻️ Reusing pooled browser at {pooled['endpoint']}[/cyan]")
+
             progress.update(task, description="⚙️ Initializing Core Eluta Scraper with 5-tab optimization...")
-            jobs = await run_core_eluta_scraper(profile["profile_name"], config)
+            try:
+                jobs = await run_core_eluta_scraper(profile["profile_name"], config)
+            finally:
+                if pooled and pooled.get("endpoint"):
+                    _browser_pool_rpc({"op": "release", "endpoint": pooled["endpoint"]})
+                # Log memory pressure so repeat runs that drift toward swap are visible
+                try:
+                    import psutil
+
+                    available_mb = psutil.virtual_memory().available / (1024 * 1024)
+                    if available_mb < config["free_mem_floor_mb"]:
+                        console.print(
+                            f"[yellow]⚠️ Low free memory after scraping: {available_mb:.0f}MB "
+                            f"(floor {config['free_mem_floor_mb']}MB) — cleaning orphaned browsers[/yellow]"
+                        )
+                        _kill_orphan_chrome(profile["profile_name"])
+                except Exception:
+                    pass
             jobs_found = len(jobs) if jobs else 0
             progress.update(task, description=f"🎉 Scraping completed! Found {jobs_found} total jobs with optimized tab management")
             
@@ -198,6 +581,8 @@ async def run_optimized_scraping(profile: Dict[str, Any], args) -> bool:
 
 async def run_two_stage_processing(profile: Dict[str, Any], args) -> bool:
     """Run the two-stage job processing pipeline (NEW DEFAULT)."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -245,7 +630,11 @@ async def run_two_stage_processing(profile: Dict[str, Any], args) -> bool:
             
             progress.update(task, description="💾 Saving results to database...")
             
-            # Save results back to database
+            # Save results back to database; status updates are group-committed
+            # through the write batcher instead of one transaction per job
+            from src.core.write_batcher import WriteBatcher
+            status_batcher = WriteBatcher(db.update_job_statuses_batch)
+
             for result in results:
                 # Determine DB primary key ID for reliable status updates
                 db_row_id = None
@@ -269,14 +658,14 @@ async def run_two_stage_processing(profile: Dict[str, Any], args) -> bool:
                 
                 # Update status using primary key id when available
                 if db_row_id is not None:
-                    db.update_job_status(db_row_id, new_status)
+                    await status_batcher.submit((db_row_id, new_status))
                 else:
                     # Fallback: update via generic update if we can resolve by URL
                     try:
                         if getattr(result, 'url', None):
                             job_row = db.get_job_by_url(result.url)
                             if job_row:
-                                db.update_job_status(job_row['id'], new_status)
+                                await status_batcher.submit((job_row['id'], new_status))
                     except Exception:
                         pass
                 
@@ -304,7 +693,10 @@ async def run_two_stage_processing(profile: Dict[str, Any], args) -> bool:
                 except Exception:
                     # Silent fallback to avoid breaking pipeline on analysis save
                     pass
-            
+
+            # Make sure every queued status update hits the database
+            await status_batcher.close()
+
             jobs_processed = len(results)
             apply_count = len([r for r in results if r.recommendation == "apply"])
             review_count = len([r for r in results if r.recommendation == "review"])
@@ -327,6 +719,8 @@ async def run_two_stage_processing(profile: Dict[str, Any], args) -> bool:
 
 async def run_Improved_jobspy_pipeline(profile: Dict[str, Any], args) -> bool:
     """Run the Improved pipeline with JobSpy integration."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -395,6 +789,8 @@ async def run_Improved_jobspy_pipeline(profile: Dict[str, Any], args) -> bool:
 
 async def run_fast_pipeline(profile: Dict[str, Any], args) -> bool:
     """Run the new fast 3-phase pipeline (DEFAULT)."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -409,17 +805,28 @@ async def run_fast_pipeline(profile: Dict[str, Any], args) -> bool:
                 "eluta_pages": args.pages,
                 "eluta_jobs": args.jobs,
                 "external_workers": getattr(args, "external_workers", 6),
+                "max_concurrent": getattr(args, "external_workers", 6),
                 "processing_method": getattr(args, "processing_method", "auto"),
                 "save_to_database": True,
                 "enable_duplicate_check": True,
             }
-            
+
+            # Prefer a pre-warmed browser from the pool daemon when one is running
+            pooled = _browser_pool_rpc({"op": "acquire"})
+            if pooled and pooled.get("endpoint"):
+                pipeline_config["cdp_endpoint"] = pooled["endpoint"]
+                console.print(f"[cyan]♻️ Reusing pooled browser at {pooled['endpoint']}[/cyan]")
+
             progress.update(task, description="⚙️ Initializing Fast 3-Phase Pipeline...")
             pipeline = FastJobPipeline(profile["profile_name"], pipeline_config)
-            
+
             progress.update(task, description="🔄 Running complete pipeline (URL collection → Parallel scraping → GPU processing)...")
-            results = await pipeline.run_complete_pipeline(args.jobs)
-            
+            try:
+                results = await pipeline.run_complete_pipeline(args.jobs)
+            finally:
+                if pooled and pooled.get("endpoint"):
+                    _browser_pool_rpc({"op": "release", "endpoint": pooled["endpoint"]})
+
             jobs_found = len(results) if results else 0
             progress.update(task, description=f"🎉 Fast pipeline completed! Processed {jobs_found} jobs")
             
@@ -441,37 +848,38 @@ async def run_fast_pipeline(profile: Dict[str, Any], args) -> bool:
             return False
 
 
-def run_health_check(profile: Dict[str, Any]) -> bool:
-    """Run comprehensive system health check."""
+async def _run_health_check_async(profile: Dict[str, Any]) -> bool:
+    """Run all system health sub-checks concurrently."""
+    import asyncio
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        
+
         task = progress.add_task("🏥 Running health diagnostics...", total=None)
-        
+
         try:
             # Import health check module
             from src.health_checks.system_health_checker import SystemHealthChecker
-            
+
             health_checker = SystemHealthChecker(profile)
-            
-            progress.update(task, description="🔍 Checking database connectivity...")
-            db_health = health_checker.check_database_health()
-            
-            progress.update(task, description="🌐 Checking network connectivity...")
-            network_health = health_checker.check_network_health()
-            
-            progress.update(task, description="💾 Checking disk space...")
-            disk_health = health_checker.check_disk_space()
-            
-            progress.update(task, description="🧠 Checking memory usage...")
-            memory_health = health_checker.check_memory_usage()
-            
-            progress.update(task, description="⚙️ Checking services...")
-            service_health = health_checker.check_services()
-            
+
+            # The sub-checks are independent and mostly I/O bound (DB, DNS,
+            # service probes); overlap them so wall time is the max latency
+            # rather than the sum
+            progress.update(task, description="🔍 Running all health checks concurrently...")
+            db_health, network_health, disk_health, memory_health, service_health = await asyncio.gather(
+                asyncio.to_thread(health_checker.check_database_health),
+                asyncio.to_thread(health_checker.check_network_health),
+                asyncio.to_thread(health_checker.check_disk_space),
+                asyncio.to_thread(health_checker.check_memory_usage),
+                asyncio.to_thread(health_checker.check_services),
+            )
+
             # Compile results
             health_results = {
                 "database": db_health,
@@ -499,48 +907,86 @@ def run_health_check(profile: Dict[str, Any]) -> bool:
             ))
             
             return overall_health
-            
+
         except Exception as e:
             console.print(f"[red]❌ Health check failed: {e}[/red]")
             return False
 
 
+# One persistent event loop per process: consecutive async phases (fetch,
+# analyze, save) share resolvers, thread pools, and any cached sessions
+# instead of rebuilding them on every asyncio.run call.
+_runner = None
+
+
+def _get_runner():
+    """Lazily build the shared asyncio.Runner, preferring uvloop when present."""
+    global _runner
+    if _runner is None:
+        import asyncio
+        import atexit
+
+        loop_factory = None
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            # uvloop is optional (Linux/macOS only); stock loop works fine
+            pass
+
+        # Let the connector keep more keepalive sockets open; resource is
+        # POSIX-only and some environments forbid raising limits, so this is
+        # strictly best-effort
+        try:
+            import resource
+            soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+            target = 65536 if hard == resource.RLIM_INFINITY else min(hard, 65536)
+            if soft < target:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ImportError, ValueError, OSError):
+            pass
+
+        _runner = asyncio.Runner(loop_factory=loop_factory)
+
+        def _shutdown_runner():
+            try:
+                from src.utils.http_session import close_shared_session
+                _runner.run(close_shared_session())
+            except Exception:
+                pass
+            _runner.close()
+
+        atexit.register(_shutdown_runner)
+    return _runner
+
+
+def _run_async(coro):
+    """Run a coroutine on the shared persistent event loop."""
+    return _get_runner().run(coro)
+
+
+def run_health_check(profile: Dict[str, Any]) -> bool:
+    """Run comprehensive system health check (sync entry point)."""
+    return _run_async(_run_health_check_async(profile))
+
+
 def main(profile_name: str = "Nirajan", action: str = "interactive", **kwargs):
     """Main function for programmatic access to the CLI."""
-    import sys
-    from types import SimpleNamespace
-    
-    # Create args object from parameters
-    args = SimpleNamespace(
-        profile=profile_name,
-        action=action,
-        sites=kwargs.get('sites'),
-        keywords=kwargs.get('keywords'),
-        batch=kwargs.get('batch', 10),
-        days=kwargs.get('days', 14),
-        pages=kwargs.get('pages', 3),
-        jobs=kwargs.get('jobs', 20),
-        headless=kwargs.get('headless', False),
-        verbose=kwargs.get('verbose', False),
-        workers=kwargs.get('workers', 4),
-        timeout=kwargs.get('timeout', 30),
-        retry_attempts=kwargs.get('retry_attempts', 3)
-    )
-    
-    # Ensure imports are loaded
-    _ensure_imports()
-    
-    # Load profile
-    profile = load_profile(profile_name)
+    # Create args object from parameters (unknown kwargs are ignored, matching
+    # the old SimpleNamespace behavior)
+    known = {k: v for k, v in kwargs.items() if k in CliArgs.__dataclass_fields__}
+    args = CliArgs(profile=profile_name, action=action, **known)
+
+
+    # Load profile (heavy helpers imported lazily on first access)
+    profile = _get_profile(profile_name)
     if not profile:
         raise ValueError(f"Profile '{profile_name}' not found!")
-    
-    profile["profile_name"] = profile_name
-    
+
     # Handle action
     if action == "scrape":
         # Run scraping
-        success = asyncio.run(run_optimized_scraping(profile, args))
+        success = _run_async(run_optimized_scraping(profile, args))
         return success
     elif action == "health-check":
         return run_health_check(profile)
@@ -549,160 +995,53 @@ def main(profile_name: str = "Nirajan", action: str = "interactive", **kwargs):
         return True
 
 
-if __name__ == "__main__":
-    # Ensure the correct conda environment is used
-    ensure_auto_job_env()
-
-    # Parse command line arguments
-    args = parse_arguments()
-
-    # Fast help display without heavy imports
-    if len(sys.argv) > 1 and sys.argv[1] in ["--help", "-h", "help"]:
-        console.print("[bold blue]AutoJobAgent CLI - Power User Interface[/bold blue]")
-        console.print("\n[yellow]🎯 Interface Options:[/yellow]")
-        console.print("  🖥️  [bold]CLI Mode[/bold]: python main.py [profile] [options]  (You are here)")
-        console.print("  🌐 [bold]Dashboard[/bold]: streamlit run src/dashboard/unified_dashboard.py")
-        console.print("  🔄 [bold]Hybrid[/bold]: Use both - monitor in dashboard while running CLI")
-        
-        console.print("\n[cyan]Performance Optimized CLI Usage:[/cyan]")
-        console.print("  python main.py [profile_name] [--action ACTION] [options]")
-        
-        console.print("\n[cyan]Available Profiles:[/cyan]")
-        console.print("  - Nirajan (default)")
-        console.print("  - default")
-        console.print("  - test_profile")
-        
-        console.print("\n[cyan]Performance Optimized Examples:[/cyan]")
-        console.print("  python main.py Nirajan --action health-check         # System diagnostics")
-        console.print("  python main.py Nirajan --action scrape               # Scrape job URLs")
-        console.print("  python main.py Nirajan --action fetch-descriptions   # NEW: Fetch job descriptions only")
-        console.print("  python main.py Nirajan --action analyze-jobs         # NEW: Analyze jobs with descriptions")
-        console.print("  python main.py Nirajan --action process-jobs         # Complete processing pipeline")
-        console.print("  python main.py Nirajan --action apply                # Apply to queued jobs")
-        console.print("  python main.py Nirajan --action benchmark            # Performance testing")
-        
-        console.print("\n[green]🇨🇦 NEW: Canadian Cities JobSpy Integration:[/green]")
-        console.print("  python main.py Nirajan --action jobspy-pipeline --jobspy-preset canadian_cities")
-        console.print("  python main.py Nirajan --action jobspy-pipeline --jobspy-preset canada_comprehensive")
-        console.print("  python main.py Nirajan --action jobspy-pipeline --jobspy-preset tech_hubs")
-        console.print("  python main.py Nirajan --action jobspy-pipeline --jobspy-preset canadian_cities --max-jobs-total 1000")
-        console.print("  python main.py Nirajan --action jobspy-pipeline --jobspy-preset canada_comprehensive --jobspy-only")
-        
-        console.print("\n[green]🚀 Performance Features:[/green]")
-        console.print("  • NEW: Fast 3-phase pipeline (4-5x faster)")
-        console.print("  • Parallel external job scraping (6+ workers)")
-        console.print("  • GPU-accelerated job processing")
-        console.print("  • Lazy loading for 60% faster startup")
-        console.print("  • Memory-optimized worker pools")
-        console.print("  • Real-time performance monitoring")
-        console.print("  • Adaptive error recovery")
-        console.print("  • Automated caching system")
-        
-        console.print("\n[yellow]💡 Pro Tip:[/yellow] Use --action fast-pipeline --external-workers 8 for maximum performance!")
-        sys.exit(0)
-
-    # Get profile name from command line argument
-    profile_name = args.profile
-
-    # Handle actions that don't need heavy imports first
-    if args.action == "health-check":
-        # Run system health check (no heavy imports needed)
-        console.print("[bold blue]🏥 System Health Check[/bold blue]")
-        
-        # Create basic profile for health check
-        profile = {"profile_name": profile_name}
-        success = run_health_check(profile)
-        sys.exit(0 if success else 1)
-        
-    elif args.action == "pipeline":
-        # Direct pipeline access with minimal imports
-        console.print("[bold blue]🚀 Direct Pipeline Access[/bold blue]")
-        
-        # Create basic profile for pipeline
-        profile = {
-            "profile_name": profile_name,
-            "keywords": ["python developer", "data analyst", "software engineer"]  # default keywords
-        }
-        
-        # Override with CLI keywords if provided
-        if args.keywords:
-            profile["keywords"] = [k.strip() for k in args.keywords.split(",")]
-            
-        success = asyncio.run(run_optimized_scraping(profile, args))
-        sys.exit(0 if success else 1)
-        
-    elif args.action == "benchmark":
-        # Run performance benchmark (minimal imports needed)
-        console.print("[bold blue]⚡ Performance Benchmark[/bold blue]")
-        console.print("[cyan]Running system performance tests...[/cyan]")
-
-        try:
-            import time
-            
-            # Test basic startup time
-            start_time = time.time()
-            
-            # Try to import core database module
-            try:
-                from src.core.job_database import get_job_db
-                db = get_job_db(profile_name)
-                job_count = db.get_job_count()
-                db_time = time.time() - start_time
-                console.print(f"[green]✅ Database connection: {db_time:.3f}s[/green]")
-                console.print(f"[cyan]📊 Total jobs in database: {job_count}[/cyan]")
-            except Exception as e:
-                db_time = 0.1
-                console.print(f"[yellow]⚠️ Database check failed: {e}[/yellow]")
-
-            # Test performance monitoring import
-            start_time = time.time()
-            try:
-                from src.core.performance_monitor import PerformanceMonitor
-                monitor = PerformanceMonitor()
-                monitor_time = time.time() - start_time
-                console.print(f"[green]✅ Performance monitor: {monitor_time:.3f}s[/green]")
-            except Exception as e:
-                monitor_time = 0.05
-                console.print(f"[yellow]⚠️ Performance monitor: {monitor_time:.3f}s (basic)[/yellow]")
-
-            # Test pipeline import
-            start_time = time.time()
-            try:
-                from src.scrapers.modern_job_pipeline import ModernJobPipeline
-                pipeline_time = time.time() - start_time
-                console.print(f"[green]✅ Pipeline import: {pipeline_time:.3f}s[/green]")
-            except Exception as e:
-                pipeline_time = 0.1
-                console.print(f"[yellow]⚠️ Pipeline import: {pipeline_time:.3f}s (error)[/yellow]")
-
-            # Overall performance score
-            total_time = db_time + monitor_time + pipeline_time
-            performance_score = (
-                "Excellent" if total_time < 0.5 else "Good" if total_time < 1.0 else "Fair"
-            )
-
-            console.print(f"\n[bold green]🎯 Overall Performance: {performance_score}[/bold green]")
-            console.print(f"[cyan]⏱️ Total benchmark time: {total_time:.3f}s[/cyan]")
-
-            # System recommendations
-            if total_time > 1.0:
-                console.print(
-                    "[yellow]💡 Consider optimizing imports or checking dependencies[/yellow]"
-                )
-            else:
-                console.print("[green]💡 System performance is optimal![/green]")
-
-        except Exception as e:
-            console.print(f"[red]❌ Benchmark failed: {e}[/red]")
-            console.print("[yellow]Please check system setup and dependencies[/yellow]")
-            
-        sys.exit(0)
-
-    # Load imports only when needed for other actions (performance optimization)
-    _ensure_imports()
-
-    # Load the actual profile
-    profile = load_profile(profile_name)
+def _print_fast_help():
+    """Render the hand-rolled rich help block in one pass (no argparse)."""
+    from rich.console import Group
+
+    # A single print means one Rich layout/measure pass and one stdout write
+    console.print(Group(
+        "[bold blue]AutoJobAgent CLI - Power User Interface[/bold blue]",
+        "\n[yellow]🎯 Interface Options:[/yellow]",
+        "  🖥️  [bold]CLI Mode[/bold]: python main.py [profile] [options]  (You are here)",
+        "  🌐 [bold]Dashboard[/bold]: streamlit run src/dashboard/unified_dashboard.py",
+        "  🔄 [bold]Hybrid[/bold]: Use both - monitor in dashboard while running CLI",
+        "\n[cyan]Performance Optimized CLI Usage:[/cyan]",
+        "  python main.py [profile_name] [--action ACTION] [options]",
+        "\n[cyan]Available Profiles:[/cyan]",
+        "  - Nirajan (default)",
+        "  - default",
+        "  - test_profile",
+        "\n[cyan]Performance Optimized Examples:[/cyan]",
+        "  python main.py Nirajan --action health-check         # System diagnostics",
+        "  python main.py Nirajan --action scrape               # Scrape job URLs",
+        "  python main.py Nirajan --action fetch-descriptions   # NEW: Fetch job descriptions only",
+        "  python main.py Nirajan --action analyze-jobs         # NEW: Analyze jobs with descriptions",
+        "  python main.py Nirajan --action process-jobs         # Complete processing pipeline",
+        "  python main.py Nirajan --action apply                # Apply to queued jobs",
+        "  python main.py Nirajan --action benchmark            # Performance testing",
+        "\n[green]🇨🇦 NEW: Canadian Cities JobSpy Integration:[/green]",
+        "  python main.py Nirajan --action jobspy-pipeline --jobspy-preset canadian_cities",
+        "  python main.py Nirajan --action jobspy-pipeline --jobspy-preset canada_comprehensive",
+        "  python main.py Nirajan --action jobspy-pipeline --jobspy-preset tech_hubs",
+        "  python main.py Nirajan --action jobspy-pipeline --jobspy-preset canadian_cities --max-jobs-total 1000",
+        "  python main.py Nirajan --action jobspy-pipeline --jobspy-preset canada_comprehensive --jobspy-only",
+        "\n[green]🚀 Performance Features:[/green]",
+        "  • NEW: Fast 3-phase pipeline (4-5x faster)",
+        "  • Parallel external job scraping (6+ workers)",
+        "  • GPU-accelerated job processing",
+        "  • Lazy loading for 60% faster startup",
+        "  • Memory-optimized worker pools",
+        "  • Real-time performance monitoring",
+        "  • Adaptive error recovery",
+        "  • Automated caching system",
+        "\n[yellow]💡 Pro Tip:[/yellow] Use --action fast-pipeline --external-workers 8 for maximum performance!",
+    ))
+
+
+def _load_profile_or_exit(args, profile_name: str) -> Dict[str, Any]:
+    """Load the real profile for heavy actions, exiting with a hint if missing."""
+    profile = _get_profile(profile_name)
     if not profile:
         console.print(f"[red]Profile '{profile_name}' not found![/red]")
         console.print(
@@ -718,381 +1057,692 @@ if __name__ == "__main__":
     if args.verbose:
         console.print(f"[green]✅ Profile '{profile_name}' loaded successfully[/green]")
 
-    # Handle different actions with performance optimizations
-    if args.action == "health-check":
-        # Run system health check
-        console.print("[bold blue]🏥 System Health Check[/bold blue]")
-        success = run_health_check(profile)
-        sys.exit(0 if success else 1)
-        
-    elif args.action == "pipeline":
-        # Direct pipeline access with async execution (legacy)
-        console.print("[bold blue]🚀 Direct Pipeline Access (Legacy)[/bold blue]")
-        success = asyncio.run(run_optimized_scraping(profile, args))
-        sys.exit(0 if success else 1)
-        
-    elif args.action == "fast-pipeline":
-        # NEW: Fast 3-phase pipeline (DEFAULT)
-        console.print("[bold blue]⚡ Fast 3-Phase Pipeline (NEW DEFAULT)[/bold blue]")
-        success = asyncio.run(run_fast_pipeline(profile, args))
-        sys.exit(0 if success else 1)
-        
-    elif args.action == "jobspy-pipeline":
-        # NEW: Improved pipeline with JobSpy integration
-        console.print("[bold blue]🚀 Improved Pipeline with JobSpy Integration[/bold blue]")
-        success = asyncio.run(run_Improved_jobspy_pipeline(profile, args))
-        sys.exit(0 if success else 1)
-        
-    elif args.action == "scrape":
-        # Improved scraping with performance monitoring - NOW USES FAST PIPELINE BY DEFAULT
-        console.print("[bold blue]🔍 Improved Scraping Mode (Fast 3-Phase Pipeline)[/bold blue]")
-        
-        # Override keywords if provided
-        if args.keywords:
-            profile["keywords"] = [k.strip() for k in args.keywords.split(",")]
-            if args.verbose:
-                console.print(f"[cyan]Using custom keywords: {profile['keywords']}[/cyan]")
-
-        # Show scraping parameters
+    return profile
+
+
+def _do_browser_daemon(args, profile_name: str) -> int:
+    """Run the pre-warmed browser pool daemon (no profile needed)."""
+    console.print(_header("[bold blue]🌐 Browser Pool Daemon[/bold blue]"))
+    try:
+        _run_async(_browser_daemon(pool_size=max(1, args.workers // 2)))
+    except KeyboardInterrupt:
+        console.print("[yellow]🛑 Browser pool daemon stopped[/yellow]")
+    return 0
+
+
+def _do_health_check(args, profile_name: str) -> int:
+    """Run system health check (no heavy imports needed)."""
+    console.print(_header("[bold blue]🏥 System Health Check[/bold blue]"))
+
+    # Create basic profile for health check
+    profile = {"profile_name": profile_name}
+    success = run_health_check(profile)
+    return 0 if success else 1
+
+
+def _do_pipeline(args, profile_name: str) -> int:
+    """Direct pipeline access with minimal imports."""
+    console.print(_header("[bold blue]🚀 Direct Pipeline Access[/bold blue]"))
+
+    # Create basic profile for pipeline
+    profile = {
+        "profile_name": profile_name,
+        "keywords": ["python developer", "data analyst", "software engineer"]  # default keywords
+    }
+
+    # Override with CLI keywords if provided
+    if args.keywords:
+        profile["keywords"] = [k.strip() for k in args.keywords.split(",")]
+
+    success = _run_async(run_optimized_scraping(profile, args))
+    return 0 if success else 1
+
+
+def _run_benchmark(profile_name: str) -> int:
+    """Benchmark cold-import costs in fresh subprocesses plus warm runtime cost.
+
+    Measuring imports in subprocesses keeps the numbers honest: the first
+    in-process import would otherwise fold module-load cost into whatever
+    runtime figure happened to be measured first.
+    """
+    import subprocess
+    import time
+
+    console.print(_header("[bold blue]⚡ Performance Benchmark[/bold blue]"))
+    console.print("[cyan]Running system performance tests...[/cyan]")
+
+    targets = [
+        ("Database module", "src.core.job_database"),
+        ("Performance monitor", "src.core.performance_monitor"),
+        ("Pipeline module", "src.scrapers.modern_job_pipeline"),
+    ]
+
+    total_time = 0.0
+    for label, module_name in targets:
+        code = (
+            "import time; t = time.perf_counter(); "
+            f"import {module_name}; "
+            "print(time.perf_counter() - t)"
+        )
+        try:
+            result = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                timeout=60,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+            )
+            cold_s = float(result.stdout.strip()) if result.returncode == 0 else None
+        except Exception:
+            cold_s = None
+
+        if cold_s is None:
+            cold_s = 0.1  # Fallback timing
+            console.print(f"[yellow]⚠️ {label}: cold import failed ({cold_s:.3f}s assumed)[/yellow]")
+        else:
+            console.print(f"[green]✅ {label} cold import: {cold_s:.3f}s[/green]")
+        total_time += cold_s
+
+    # Warm runtime cost measured in this process
+    start_time = time.time()
+    try:
+        from src.core.job_database import get_job_db
+        db = get_job_db(profile_name)
+        job_count = db.get_job_count()
+        db_time = time.time() - start_time
+        console.print(f"[green]✅ Database query (warm): {db_time:.3f}s[/green]")
+        console.print(f"[cyan]📊 Total jobs in database: {job_count}[/cyan]")
+        total_time += db_time
+    except Exception as e:
+        console.print(f"[yellow]⚠️ Database check failed: {e}[/yellow]")
+
+    # Overall performance score
+    performance_score = (
+        "Excellent" if total_time < 0.5 else "Good" if total_time < 1.0 else "Fair"
+    )
+
+    # System recommendations
+    if total_time > 1.0:
+        recommendation = "[yellow]💡 Consider optimizing imports or checking dependencies[/yellow]"
+    else:
+        recommendation = "[green]💡 System performance is optimal![/green]"
+
+    # Single render pass for the summary block
+    from rich.console import Group
+    console.print(Group(
+        f"\n[bold green]🎯 Overall Performance: {performance_score}[/bold green]",
+        f"[cyan]⏱️ Total benchmark time: {total_time:.3f}s[/cyan]",
+        recommendation,
+    ))
+
+    return 0
+
+
+def _do_benchmark(args, profile_name: str) -> int:
+    """Run performance benchmark (minimal imports needed)."""
+    try:
+        return _run_benchmark(profile_name)
+    except Exception as e:
+        console.print(f"[red]❌ Benchmark failed: {e}[/red]")
+        console.print("[yellow]Please check system setup and dependencies[/yellow]")
+        return 0
+
+
+def _do_legacy_pipeline(args, profile_name: str) -> int:
+    """Direct pipeline access with async execution (legacy, real profile)."""
+    profile = _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]🚀 Direct Pipeline Access (Legacy)[/bold blue]"))
+    success = _run_async(run_optimized_scraping(profile, args))
+    return 0 if success else 1
+
+
+def _do_fast_pipeline(args, profile_name: str) -> int:
+    """NEW: Fast 3-phase pipeline (DEFAULT)."""
+    profile = _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]⚡ Fast 3-Phase Pipeline (NEW DEFAULT)[/bold blue]"))
+    success = _run_async(run_fast_pipeline(profile, args))
+    return 0 if success else 1
+
+
+def _do_jobspy_pipeline(args, profile_name: str) -> int:
+    """NEW: Improved pipeline with JobSpy integration."""
+    profile = _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]🚀 Improved Pipeline with JobSpy Integration[/bold blue]"))
+    success = _run_async(run_Improved_jobspy_pipeline(profile, args))
+    return 0 if success else 1
+
+
+def _do_scrape(args, profile_name: str) -> int:
+    """Improved scraping with performance monitoring (fast pipeline by default)."""
+    profile = _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]🔍 Improved Scraping Mode (Fast 3-Phase Pipeline)[/bold blue]"))
+
+    # Override keywords if provided
+    if args.keywords:
+        profile["keywords"] = [k.strip() for k in args.keywords.split(",")]
         if args.verbose:
-            console.print(f"[yellow]📅 Scraping Parameters:[/yellow]")
-            console.print(f"  Days: {args.days}")
-            console.print(f"  Pages per keyword: {args.pages}")
-            console.print(f"  Jobs per keyword: {args.jobs}")
-            console.print(f"  External workers: {getattr(args, 'external_workers', 6)}")
-            console.print(f"  Processing method: {getattr(args, 'processing_method', 'auto')}")
+            console.print(f"[cyan]Using custom keywords: {profile['keywords']}[/cyan]")
+
+    # Show scraping parameters
+    if args.verbose:
+        console.print(f"[yellow]📅 Scraping Parameters:[/yellow]")
+        console.print(f"  Days: {args.days}")
+        console.print(f"  Pages per keyword: {args.pages}")
+        console.print(f"  Jobs per keyword: {args.jobs}")
+        console.print(f"  External workers: {getattr(args, 'external_workers', 6)}")
+        console.print(f"  Processing method: {getattr(args, 'processing_method', 'auto')}")
+
+    # Use fast 3-phase pipeline by default (4-5x faster)
+    success = _run_async(run_fast_pipeline(profile, args))
+
+    if success:
+        console.print("[green]✅ Scraping completed successfully![/green]")
+        console.print("[cyan]💡 Check the dashboard for results: http://localhost:8501[/cyan]")
+    else:
+        console.print("[yellow]⚠️ Scraping completed with limited results[/yellow]")
+
+    return 0
+
+
+@lru_cache(maxsize=4)
+def _dashboard_actions(profile_name: str):
+    """One DashboardActions per profile; __init__ opens handlers/log state."""
+    profile = _get_profile(profile_name) or {"profile_name": profile_name}
+    return dashboard_actions_module.DashboardActions(profile)
+
+
+def _do_dashboard(args, profile_name: str) -> int:
+    """Start dashboard only."""
+    _load_profile_or_exit(args, profile_name)
+    dashboard_actions = _dashboard_actions(profile_name)
+    dashboard_actions.auto_start_dashboard_action()
+    # Browser opening is handled by dashboard_actions, no need to open again here
+    return 0
 
-        # Use fast 3-phase pipeline by default (4-5x faster)
-        success = asyncio.run(run_fast_pipeline(profile, args))
+
+def _do_apply(args, profile_name: str) -> int:
+    """Run automated job applications."""
+    _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]🤖 Automated Job Application[/bold blue]"))
+    console.print("[cyan]Applying to jobs from database with Configurable form filling...[/cyan]")
+
+    try:
+        from src.ats.Improved_universal_applier import apply_to_jobs_from_database
+
+        # Get max applications from batch size
+        max_applications = args.batch if args.batch else 5
+
+        console.print(f"[cyan]📊 Max applications: {max_applications}[/cyan]")
+        console.print(f"[cyan]👤 Profile: {profile_name}[/cyan]")
+
+        # Run applications
+        summary = _run_async(apply_to_jobs_from_database(profile_name, max_applications))
+
+        # Display results
+        if summary["successful"] > 0:
+            console.print(
+                f"[bold green]🎉 Successfully applied to {summary['successful']} jobs![/bold green]"
+            )
+
+        if summary["manual_required"] > 0:
+            console.print(
+                f"[yellow]📝 {summary['manual_required']} applications require manual completion[/yellow]"
+            )
+
+        if summary["failed"] > 0:
+            console.print(f"[red]❌ {summary['failed']} applications failed[/red]")
+
+        console.print(f"[cyan]📊 Success rate: {summary.get('success_rate', 0):.1f}%[/cyan]")
+
+    except Exception as e:
+        console.print(f"[red]❌ Application process failed: {e}[/red]")
+        console.print(
+            "[yellow]Please ensure you have jobs in the database and valid documents[/yellow]"
+        )
+
+    return 0
+
+
+def _do_process_jobs(args, profile_name: str) -> int:
+    """Two-stage job processing (NEW DEFAULT)."""
+    profile = _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]🔄 Two-Stage Job Processing (NEW DEFAULT)[/bold blue]"))
+    try:
+        # Use the two-stage processor as the default processing method
+        success = _run_async(run_two_stage_processing(profile, args))
 
         if success:
-            console.print("[green]✅ Scraping completed successfully![/green]")
+            console.print("[green]✅ Two-stage processing completed successfully![/green]")
             console.print("[cyan]💡 Check the dashboard for results: http://localhost:8501[/cyan]")
         else:
-            console.print("[yellow]⚠️ Scraping completed with limited results[/yellow]")
+            console.print("[yellow]⚠️ Two-stage processing completed with limited results[/yellow]")
 
-    elif args.action == "dashboard":
-        # Start dashboard only
-        dashboard_actions = DashboardActions(profile)
-        dashboard_started = dashboard_actions.auto_start_dashboard_action()
-        # Browser opening is handled by dashboard_actions, no need to open again here
-        sys.exit(0)  # Exit after starting dashboard to prevent falling through to interactive mode
-            
-    elif args.action == "benchmark":
-        # Run performance benchmark
-        console.print("[bold blue]⚡ Performance Benchmark[/bold blue]")
-        console.print("[cyan]Running system performance tests...[/cyan]")
+    except Exception as e:
+        console.print(f"[red]❌ Two-stage processing failed: {e}[/red]")
+        console.print("[yellow]💡 Try running with --verbose for more details[/yellow]")
 
-        try:
-            import time
-            from src.core.job_database import get_job_db
+    return 0
 
-            # Test database connection
-            start_time = time.time()
-            db = get_job_db(profile_name)
-            job_count = db.get_job_count()
-            db_time = time.time() - start_time
 
-            console.print(f"[green]✅ Database connection: {db_time:.3f}s[/green]")
-            console.print(f"[cyan]📊 Total jobs in database: {job_count}[/cyan]")
+@dataclass(slots=True)
+class _FetchTotals:
+    """Running totals for the description-fetch stage."""
 
+    total_descriptions_fetched: int = 0
+    success_rate: float = 0.0
 
-            # Test data loading performance
-            start_time = time.time()
-            try:
-                # Try to import dashboard components
-                from src.dashboard.components.data_loader import load_job_data
-                df = load_job_data(profile_name)
-                load_time = time.time() - start_time
-                console.print(f"[green]✅ Data loading: {load_time:.3f}s[/green]")
-                console.print(f"[cyan]📈 Loaded {len(df)} jobs[/cyan]")
-            except ImportError:
-                load_time = 0.1  # Fallback timing
-                console.print("[yellow]⚠️ Dashboard components not available for benchmark[/yellow]")
-
-            # Test metrics calculation
-            start_time = time.time()
-            try:
-                from src.dashboard.components.metrics import render_metrics
-                # Instead of returning metrics, just call render_metrics (Streamlit)
-                render_metrics(df if 'df' in locals() else None)
-                metrics_time = time.time() - start_time
-                console.print(f"[green]✅ Metrics calculation: {metrics_time:.3f}s[/green]")
-            except (ImportError, NameError):
-                metrics_time = 0.05  # Fallback timing
-                console.print("[yellow]⚠️ Metrics calculation skipped (dashboard not available)[/yellow]")
-
-            # Overall performance score
-            total_time = db_time + load_time + metrics_time
-            performance_score = (
-                "Excellent" if total_time < 1.0 else "Good" if total_time < 2.0 else "Fair"
-            )
 
-            console.print(f"\n[bold green]🎯 Overall Performance: {performance_score}[/bold green]")
-            console.print(f"[cyan]⏱️ Total benchmark time: {total_time:.3f}s[/cyan]")
+@dataclass(slots=True)
+class _ProcessTotals:
+    """Running totals for the analysis stage."""
 
-            # System recommendations
-            if total_time > 2.0:
-                console.print(
-                    "[yellow]💡 Consider optimizing database queries or reducing data size[/yellow]"
-                )
+    total_jobs_analyzed: int = 0
+    total_jobs_queued: int = 0
+    success_rate: float = 0.0
+
+
+async def _process_jobs_pipeline(
+    profile_name: str, limit, batch_size: int, batch_timeout: float = 5.0
+) -> Dict[str, Any]:
+    """Overlap description fetching and job analysis through a bounded queue.
+
+    The fetcher pushes the size of each completed micro-batch into the queue
+    so analysis starts as soon as the first descriptions land, instead of
+    waiting for the whole fetch stage to finish. The analyzer waits at most
+    batch_timeout seconds for the next batch before re-checking whether the
+    fetcher is done, so a stalled fetch can never hang the analysis stage.
+    """
+    import asyncio
+    from src.orchestration.description_fetcher_orchestrator import process_scraped_jobs_with_orchestrator
+    from src.orchestration.job_processor_orchestrator import process_jobs_with_orchestrator
+
+    queue: "asyncio.Queue" = asyncio.Queue(maxsize=32)
+    fetch_totals = _FetchTotals()
+    process_totals = _ProcessTotals()
+
+    async def fetch_into_queue():
+        remaining = limit
+        while remaining is None or remaining > 0:
+            chunk = batch_size if remaining is None else min(batch_size, remaining)
+            stats = await process_scraped_jobs_with_orchestrator(profile_name, chunk)
+            fetched = stats.get("total_descriptions_fetched", 0)
+            fetch_totals.total_descriptions_fetched += fetched
+            fetch_totals.success_rate = stats.get("success_rate", fetch_totals.success_rate)
+            if fetched == 0:
+                # Nothing left to fetch; stop instead of spinning
+                break
+            await queue.put(fetched)
+            if remaining is not None:
+                remaining -= chunk
+
+    async def analyze_from_queue(fetch_task):
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=batch_timeout)
+            except asyncio.TimeoutError:
+                if fetch_task.done() and queue.empty():
+                    break
+                continue
+            stats = await process_jobs_with_orchestrator(profile_name, item)
+            process_totals.total_jobs_analyzed += stats.get("total_jobs_analyzed", 0)
+            process_totals.total_jobs_queued += stats.get("total_jobs_queued", 0)
+            process_totals.success_rate = stats.get("success_rate", process_totals.success_rate)
+
+    fetch_task = asyncio.create_task(fetch_into_queue())
+    analyze_task = asyncio.create_task(analyze_from_queue(fetch_task))
+    await asyncio.gather(fetch_task, analyze_task)
+    return {"fetch": fetch_totals, "process": process_totals}
+
+
+def _do_legacy_process_jobs(args, profile_name: str) -> int:
+    """Legacy job processing via the two orchestrators, pipelined."""
+    _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]🔄 Legacy Job Processing (Orchestrator)[/bold blue]"))
+    try:
+
+        console.print("[cyan]📋 Pipelining description fetching and batch analysis...[/cyan]")
+        limit = args.batch if args.batch else None
+        batch_size = getattr(args, "fetch_batch_size", 32)
+        batch_timeout = getattr(args, "fetch_batch_timeout", 5.0)
+        stats = _run_async(_process_jobs_pipeline(profile_name, limit, batch_size, batch_timeout))
+
+        fetch_stats = stats["fetch"]
+        process_stats = stats["process"]
+        if fetch_stats.total_descriptions_fetched > 0:
+            console.print(f"[green]✅ Successfully fetched {fetch_stats.total_descriptions_fetched} descriptions![/green]")
+            console.print(f"[green]📝 Success rate: {fetch_stats.success_rate:.1f}%[/green]")
+
+            if process_stats.total_jobs_analyzed > 0:
+                console.print(f"[green]✅ Successfully analyzed {process_stats.total_jobs_analyzed} jobs![/green]")
+                console.print(f"[green]📝 {process_stats.total_jobs_queued} jobs queued for application[/green]")
+                console.print(f"[green]📊 Success rate: {process_stats.success_rate:.1f}%[/green]")
             else:
-                console.print("[green]💡 System performance is optimal![/green]")
+                console.print("[yellow]⚠️ No jobs were analyzed.[/yellow]")
+        else:
+            console.print("[yellow]⚠️ No descriptions were fetched. Check if you have scraped jobs in database.[/yellow]")
 
-        except Exception as e:
-            console.print(f"[red]❌ Benchmark failed: {e}[/red]")
-            console.print("[yellow]Please check database connection and data availability[/yellow]")
-            
-    elif args.action == "apply":
-        # Run automated job applications
-        console.print("[bold blue]🤖 Automated Job Application[/bold blue]")
-        console.print("[cyan]Applying to jobs from database with Configurable form filling...[/cyan]")
+    except ImportError as e:
+        console.print(f"[red]❌ Legacy orchestrator not available: {e}[/red]")
+        console.print("[yellow]💡 Use --action fast-pipeline or --action jobspy-pipeline instead[/yellow]")
+        console.print("[cyan]  python main.py Nirajan --action fast-pipeline --external-workers 6[/cyan]")
+        console.print("[cyan]  python main.py Nirajan --action jobspy-pipeline --jobspy-preset quality[/cyan]")
+    except Exception as e:
+        console.print(f"[red]❌ Job processing failed: {e}[/red]")
 
-        try:
-            import asyncio
-            from src.ats.Improved_universal_applier import apply_to_jobs_from_database
+    return 0
 
-            # Get max applications from batch size
-            max_applications = args.batch if args.batch else 5
 
-            console.print(f"[cyan]📊 Max applications: {max_applications}[/cyan]")
-            console.print(f"[cyan]👤 Profile: {profile_name}[/cyan]")
+def _do_fetch_descriptions(args, profile_name: str) -> int:
+    """Fetch job descriptions only."""
+    _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]🌐 Fetching Job Descriptions Only[/bold blue]"))
+    try:
+        from src.orchestration.simple_job_orchestrator import fetch_descriptions_only
 
-            # Run applications
-            summary = asyncio.run(apply_to_jobs_from_database(profile_name, max_applications))
+        # Fetch descriptions for scraped jobs
+        limit = args.batch if args.batch else None
+        stats = _run_async(fetch_descriptions_only(profile_name, limit))
 
-            # Display results
-            if summary["successful"] > 0:
-                console.print(
-                    f"[bold green]🎉 Successfully applied to {summary['successful']} jobs![/bold green]"
-                )
+        console.print(f"[green]✅ Description fetching completed in {stats['processing_time']:.1f}s[/green]")
+        console.print("[cyan]💡 Jobs now have status 'description_saved' and are ready for analysis[/cyan]")
 
-            if summary["manual_required"] > 0:
-                console.print(
-                    f"[yellow]📝 {summary['manual_required']} applications require manual completion[/yellow]"
-                )
+    except ImportError as e:
+        console.print(f"[red]❌ Legacy orchestrator not available: {e}[/red]")
+        console.print("[yellow]💡 Use --action fast-pipeline for complete pipeline instead[/yellow]")
+        console.print("[cyan]  python main.py Nirajan --action fast-pipeline --external-workers 6[/cyan]")
+    except Exception as e:
+        console.print(f"[red]❌ Description fetching failed: {e}[/red]")
 
-            if summary["failed"] > 0:
-                console.print(f"[red]❌ {summary['failed']} applications failed[/red]")
+    return 0
 
-            console.print(f"[cyan]📊 Success rate: {summary.get('success_rate', 0):.1f}%[/cyan]")
 
-        except Exception as e:
-            console.print(f"[red]❌ Application process failed: {e}[/red]")
-            console.print(
-                "[yellow]Please ensure you have jobs in the database and valid documents[/yellow]"
-            )
-            
-    elif args.action in ["process", "process-jobs"]:
-        console.print("[bold blue]🔄 Two-Stage Job Processing (NEW DEFAULT)[/bold blue]")
-        try:
-            # Use the two-stage processor as the default processing method
-            success = asyncio.run(run_two_stage_processing(profile, args))
-            
-            if success:
-                console.print("[green]✅ Two-stage processing completed successfully![/green]")
-                console.print("[cyan]💡 Check the dashboard for results: http://localhost:8501[/cyan]")
-            else:
-                console.print("[yellow]⚠️ Two-stage processing completed with limited results[/yellow]")
-                
-        except Exception as e:
-            console.print(f"[red]❌ Two-stage processing failed: {e}[/red]")
-            console.print("[yellow]💡 Try running with --verbose for more details[/yellow]")
-            
-    elif args.action == "legacy-process-jobs":
-        console.print("[bold blue]🔄 Legacy Job Processing (Orchestrator)[/bold blue]")
-        try:
-            from src.orchestration.description_fetcher_orchestrator import process_scraped_jobs_with_orchestrator
-            from src.orchestration.job_processor_orchestrator import process_jobs_with_orchestrator
-            
-            # Step 1: Fetch descriptions with 10-worker orchestrator
-            console.print("[cyan]📋 Step 1: Fetching job descriptions with 10 workers...[/cyan]")
-            limit = args.batch if args.batch else None
-            fetch_stats = asyncio.run(process_scraped_jobs_with_orchestrator(profile_name, limit))
-            
-            if fetch_stats["total_descriptions_fetched"] > 0:
-                console.print(f"[green]✅ Successfully fetched {fetch_stats['total_descriptions_fetched']} descriptions![/green]")
-                console.print(f"[green]📝 Success rate: {fetch_stats['success_rate']:.1f}%[/green]")
-                
-                # Step 2: Process jobs with batch analysis
-                console.print("[cyan]🧠 Step 2: Analyzing jobs with batch processing...[/cyan]")
-                batch_size = args.batch if args.batch else 20
-                process_stats = asyncio.run(process_jobs_with_orchestrator(profile_name, batch_size))
-                
-                if process_stats["total_jobs_analyzed"] > 0:
-                    console.print(f"[green]✅ Successfully analyzed {process_stats['total_jobs_analyzed']} jobs![/green]")
-                    console.print(f"[green]📝 {process_stats['total_jobs_queued']} jobs queued for application[/green]")
-                    console.print(f"[green]📊 Success rate: {process_stats['success_rate']:.1f}%[/green]")
-                else:
-                    console.print("[yellow]⚠️ No jobs were analyzed.[/yellow]")
-            else:
-                console.print("[yellow]⚠️ No descriptions were fetched. Check if you have scraped jobs in database.[/yellow]")
-                
-        except ImportError as e:
-            console.print(f"[red]❌ Legacy orchestrator not available: {e}[/red]")
-            console.print("[yellow]💡 Use --action fast-pipeline or --action jobspy-pipeline instead[/yellow]")
-            console.print("[cyan]  python main.py Nirajan --action fast-pipeline --external-workers 6[/cyan]")
-            console.print("[cyan]  python main.py Nirajan --action jobspy-pipeline --jobspy-preset quality[/cyan]")
-        except Exception as e:
-            console.print(f"[red]❌ Job processing failed: {e}[/red]")
-            
-    elif args.action == "fetch-descriptions":
-        console.print("[bold blue]🌐 Fetching Job Descriptions Only[/bold blue]")
-        try:
-            from src.orchestration.simple_job_orchestrator import fetch_descriptions_only
-            
-            # Fetch descriptions for scraped jobs
-            limit = args.batch if args.batch else None
-            stats = asyncio.run(fetch_descriptions_only(profile_name, limit))
-            
-            console.print(f"[green]✅ Description fetching completed in {stats['processing_time']:.1f}s[/green]")
-            console.print("[cyan]💡 Jobs now have status 'description_saved' and are ready for analysis[/cyan]")
-                
-        except ImportError as e:
-            console.print(f"[red]❌ Legacy orchestrator not available: {e}[/red]")
-            console.print("[yellow]💡 Use --action fast-pipeline for complete pipeline instead[/yellow]")
-            console.print("[cyan]  python main.py Nirajan --action fast-pipeline --external-workers 6[/cyan]")
-        except Exception as e:
-            console.print(f"[red]❌ Description fetching failed: {e}[/red]")
-            
-    elif args.action == "analyze-jobs":
-        console.print("[bold blue]🧠 Analyzing Jobs with Descriptions[/bold blue]")
-        try:
-            from src.orchestration.simple_job_orchestrator import analyze_jobs_with_descriptions
-            
-            # Analyze jobs that have descriptions
-            limit = args.batch if args.batch else None
-            stats = asyncio.run(analyze_jobs_with_descriptions(profile_name, limit))
-            
-            if stats["jobs_processed"] > 0:
-                console.print(f"[green]✅ Successfully analyzed {stats['jobs_processed']} jobs![/green]")
-                console.print(f"[green]📝 {stats['jobs_queued']} jobs queued for application[/green]")
-            else:
-                console.print("[yellow]⚠️ No jobs were analyzed. Run --action fetch-descriptions first.[/yellow]")
-                
-        except ImportError as e:
-            console.print(f"[red]❌ Legacy orchestrator not available: {e}[/red]")
-            console.print("[yellow]💡 Use --action process-jobs for complete two-stage processing instead[/yellow]")
-            console.print("[cyan]  python main.py Nirajan --action process-jobs --processing-method rule_based[/cyan]")
-        except Exception as e:
-            console.print(f"[red]❌ Job analysis failed: {e}[/red]")
-            
-    elif args.action == "analyze-resume":
-        console.print("[bold blue]📄 Analyzing Resume and Profile[/bold blue]")
+def _do_analyze_jobs(args, profile_name: str) -> int:
+    """Analyze jobs that already have descriptions."""
+    _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]🧠 Analyzing Jobs with Descriptions[/bold blue]"))
+    try:
+        from src.orchestration.simple_job_orchestrator import analyze_jobs_with_descriptions
+
+        # Analyze jobs that have descriptions
+        limit = args.batch if args.batch else None
+        stats = _run_async(analyze_jobs_with_descriptions(profile_name, limit))
+
+        if stats["jobs_processed"] > 0:
+            console.print(f"[green]✅ Successfully analyzed {stats['jobs_processed']} jobs![/green]")
+            console.print(f"[green]📝 {stats['jobs_queued']} jobs queued for application[/green]")
+        else:
+            console.print("[yellow]⚠️ No jobs were analyzed. Run --action fetch-descriptions first.[/yellow]")
+
+    except ImportError as e:
+        console.print(f"[red]❌ Legacy orchestrator not available: {e}[/red]")
+        console.print("[yellow]💡 Use --action process-jobs for complete two-stage processing instead[/yellow]")
+        console.print("[cyan]  python main.py Nirajan --action process-jobs --processing-method rule_based[/cyan]")
+    except Exception as e:
+        console.print(f"[red]❌ Job analysis failed: {e}[/red]")
+
+    return 0
+
+
+def _do_analyze_resume(args, profile_name: str) -> int:
+    """Analyze resume and suggest profile improvements."""
+    _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]📄 Analyzing Resume and Profile[/bold blue]"))
+    try:
+        from src.services.simple_resume_analyzer import SimpleResumeAnalyzer
+
+        analyzer = SimpleResumeAnalyzer()
+        profile_dir = f"profiles/{profile_name}"
+
+        # Analyze the profile and resume
+        results = analyzer.analyze_profile_resume_match(profile_dir)
+
+        if 'error' in results:
+            console.print(f"[red]❌ Error: {results['error']}[/red]")
+            return 1
+
+        # Build the whole report once and render it in a single pass instead
+        # of one styled print per line/skill
+        from rich.console import Group
+
+        summary = results['match_summary']
+        lines = [
+            "[green]✅ Analysis Complete![/green]",
+            f"[cyan]📁 Profile: {results['profile_analyzed']}[/cyan]",
+            f"[cyan]📄 Resume: {results['resume_analyzed']}[/cyan]",
+            "\n[bold]📊 Summary:[/bold]",
+            f"  • Resume has {summary['total_resume_skills']} technical skills",
+            f"  • Profile has {summary['skills_in_profile']} skills",
+            f"  • Found {summary['new_skills_found']} new skills to add",
+            f"  • Recommended {summary['skills_to_add']} additional skills",
+        ]
+
+        suggestions = results['suggestions']
+
+        if suggestions.get('new_skills_from_resume'):
+            lines.append("\n[bold green]💡 New Skills Found in Resume:[/bold green]")
+            lines.extend(f"  • {skill}" for skill in suggestions['new_skills_from_resume'][:10])
+
+        if suggestions.get('recommended_additions'):
+            lines.append("\n[bold blue]🔧 Recommended Related Technologies:[/bold blue]")
+            lines.extend(f"  • {tech}" for tech in suggestions['recommended_additions'][:5])
+
+        if suggestions.get('experience_level_update'):
+            lines.append("\n[bold yellow]📈 Experience Level Update:[/bold yellow]")
+            lines.append(f"  Resume suggests: {suggestions['experience_level_update']}")
+
+        console.print(Group(*lines))
+
+        # Save results
+        output_file = f"profiles/{profile_name}/resume_analysis.json"
         try:
-            from src.services.simple_resume_analyzer import SimpleResumeAnalyzer
-            
-            analyzer = SimpleResumeAnalyzer()
-            profile_dir = f"profiles/{profile_name}"
-            
-            # Analyze the profile and resume
-            results = analyzer.analyze_profile_resume_match(profile_dir)
-            
-            if 'error' in results:
-                console.print(f"[red]❌ Error: {results['error']}[/red]")
-                sys.exit(1)
-            
-            # Display results
-            console.print(f"[green]✅ Analysis Complete![/green]")
-            console.print(f"[cyan]📁 Profile: {results['profile_analyzed']}[/cyan]")
-            console.print(f"[cyan]📄 Resume: {results['resume_analyzed']}[/cyan]")
-            
-            summary = results['match_summary']
-            console.print(f"\n[bold]📊 Summary:[/bold]")
-            console.print(f"  • Resume has {summary['total_resume_skills']} technical skills")
-            console.print(f"  • Profile has {summary['skills_in_profile']} skills")
-            console.print(f"  • Found {summary['new_skills_found']} new skills to add")
-            console.print(f"  • Recommended {summary['skills_to_add']} additional skills")
-            
-            suggestions = results['suggestions']
-            
-            if suggestions.get('new_skills_from_resume'):
-                console.print(f"\n[bold green]💡 New Skills Found in Resume:[/bold green]")
-                for skill in suggestions['new_skills_from_resume'][:10]:
-                    console.print(f"  • {skill}")
-                    
-            if suggestions.get('recommended_additions'):
-                console.print(f"\n[bold blue]🔧 Recommended Related Technologies:[/bold blue]")
-                for tech in suggestions['recommended_additions'][:5]:
-                    console.print(f"  • {tech}")
-                    
-            if suggestions.get('experience_level_update'):
-                console.print(f"\n[bold yellow]📈 Experience Level Update:[/bold yellow]")
-                console.print(f"  Resume suggests: {suggestions['experience_level_update']}")
-                
-            # Save results
-            output_file = f"profiles/{profile_name}/resume_analysis.json"
+            import orjson
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        except ImportError:
             import json
             with open(output_file, 'w') as f:
                 json.dump(results, f, indent=2)
-            console.print(f"\n[green]💾 Full analysis saved to: {output_file}[/green]")
-            
-        except Exception as e:
-            console.print(f"[red]❌ Resume analysis failed: {e}[/red]")
-            
-    elif args.action == "generate-docs":
-        console.print("[bold blue]📄 Generating Automated Documents[/bold blue]")
+        console.print(f"\n[green]💾 Full analysis saved to: {output_file}[/green]")
+
+    except Exception as e:
+        console.print(f"[red]❌ Resume analysis failed: {e}[/red]")
+
+    return 0
+
+
+def _do_generate_docs(args, profile_name: str) -> int:
+    """Generate automated documents."""
+    profile = _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]📄 Generating Automated Documents[/bold blue]"))
+    try:
+        # Use GeminiResumeGenerator directly (services.document_generator does not exist)
+        from src.gemini_resume_generator import GeminiResumeGenerator
+        generator = GeminiResumeGenerator(profile)
+
+        console.print("[cyan]🤖 Starting worker-based document generation...[/cyan]")
+        console.print(f"[cyan]👤 Profile: {profile_name}[/cyan]")
+        console.print("[cyan]📝 Generating: 4 resumes + 4 cover letters (8 total documents)[/cyan]")
+
+        # Use worker-based generation
+        if hasattr(generator, 'generate_documents_with_workers'):
+            generator.generate_documents_with_workers(max_workers=args.workers)
+        else:
+            generator.generate_documents()  # Fallback method
+
+        console.print("[green]✅ Documents generated successfully.[/green]")
+        console.print("[cyan]💡 Check your profile folder for generated documents[/cyan]")
+
+    except ImportError as e:
+        console.print(f"[red]❌ Document generator not available: {e}[/red]")
+        console.print("[yellow]💡 Generate documents manually or via the dashboard[/yellow]")
+    except Exception as e:
+        console.print(f"[red]❌ An error occurred during document generation: {e}[/red]")
+
+    return 0
+
+
+def _do_shutdown(args, profile_name: str) -> int:
+    """Shut down the dashboard."""
+    _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold yellow]🛑 Shutting down dashboard...[/bold yellow]"))
+    dashboard_actions = _dashboard_actions(profile_name)
+    dashboard_actions.shutdown_dashboard_action()
+    return 0
+
+
+async def _wait_dashboard_ready(url: str, timeout: float = 5.0) -> bool:
+    """Poll the dashboard URL until it responds, up to timeout seconds.
+
+    Returns as soon as Streamlit answers instead of sleeping a fixed two
+    seconds; a warm dashboard typically responds in well under half that.
+    """
+    import asyncio
+    import aiohttp
+    from src.utils.http_session import get_shared_session
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    session = await get_shared_session()
+    while loop.time() < deadline:
         try:
-            # Use GeminiResumeGenerator directly (services.document_generator does not exist)
-            from src.gemini_resume_generator import GeminiResumeGenerator
-            generator = GeminiResumeGenerator(profile)
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=0.3)) as resp:
+                if resp.status < 500:
+                    return True
+        except Exception:
+            pass
+        await asyncio.sleep(0.1)
+    return False
 
-            console.print("[cyan]🤖 Starting worker-based document generation...[/cyan]")
-            console.print(f"[cyan]👤 Profile: {profile_name}[/cyan]")
-            console.print("[cyan]📝 Generating: 4 resumes + 4 cover letters (8 total documents)[/cyan]")
 
-            # Use worker-based generation
-            if hasattr(generator, 'generate_documents_with_workers'):
-                generator.generate_documents_with_workers(max_workers=args.workers)
-            else:
-                generator.generate_documents()  # Fallback method
+async def _init_interactive(profile: Dict[str, Any]):
+    """Construct the dashboard actions and CLI menu concurrently.
 
-            console.print("[green]✅ Documents generated successfully.[/green]")
-            console.print("[cyan]💡 Check your profile folder for generated documents[/cyan]")
+    Both constructors are independent and may touch disk (log files, cached
+    jobs), so building them in worker threads overlaps their startup cost.
+    """
+    import asyncio
 
-        except Exception as e:
-            console.print(f"[red]❌ An error occurred during document generation: {e}[/red]")
-            
-    elif args.action == "shutdown":
-        console.print("[bold yellow]🛑 Shutting down dashboard...[/bold yellow]")
-        dashboard_actions = DashboardActions(profile)
-        dashboard_actions.shutdown_dashboard_action()
-        
-    else:
-        # Interactive mode (default) - Dashboard + CLI hybrid mode
-        console.print("[bold blue]🚀 AutoJobAgent Hybrid Control Center[/bold blue]")
-        console.print("[cyan]Starting dashboard as watch tower + persistent CLI...[/cyan]")
-        
-        # Start dashboard automatically in background
-        dashboard_actions = DashboardActions(profile)
+    def _make_menu():
+        from src.cli.menu.main_menu import MainMenu
+        return MainMenu(profile)
+
+    async with asyncio.TaskGroup() as tg:
+        dash_task = tg.create_task(
+            asyncio.to_thread(dashboard_actions_module.DashboardActions, profile)
+        )
+        menu_task = tg.create_task(asyncio.to_thread(_make_menu))
+    return dash_task.result(), menu_task.result()
+
+
+def _do_interactive(args, profile_name: str) -> int:
+    """Interactive mode (default) - Dashboard + CLI hybrid mode."""
+    profile = _load_profile_or_exit(args, profile_name)
+    console.print(_header("[bold blue]🚀 AutoJobAgent Hybrid Control Center[/bold blue]"))
+    console.print("[cyan]Starting dashboard as watch tower + persistent CLI...[/cyan]")
+
+    # Build dashboard actions and the menu in parallel, then start the
+    # dashboard in the background (async spawn overlaps the process boot
+    # with the readiness poll instead of a fixed sleep)
+    main_menu = None
+    try:
+        dashboard_actions, main_menu = _run_async(_init_interactive(profile))
+    except Exception:
+        dashboard_actions = dashboard_actions_module.DashboardActions(profile)
+    try:
+        dashboard_started = _run_async(dashboard_actions.auto_start_dashboard_action_async())
+    except Exception:
         dashboard_started = dashboard_actions.auto_start_dashboard_action()
-        
-        if dashboard_started:
-            import webbrowser
-            console.print("[green]✅ Dashboard (Watch Tower) started successfully![/green]")
-            console.print("[cyan]🌐 Opening dashboard in browser as monitoring center...[/cyan]")
-            console.print("[yellow]🎛️ Dashboard Watch Tower Features:[/yellow]")
-            console.print("  • 👁️ Real-time job scraping monitoring")
-            console.print("  • 📈 Performance metrics and analytics")
-            console.print("  • 🎯 Visual job filtering and browsing")
-            console.print("  • 🔄 Service status monitoring")
-            console.print("")
-            console.print("[bold green]💡 Dashboard is your monitoring watch tower![/bold green]")
-            console.print("[bold cyan]🖥️ CLI remains active for direct commands![/bold cyan]")
-            webbrowser.open(f"http://localhost:8501/")
-            
-            # Small delay to let dashboard fully load
-            import time
-            time.sleep(2)
-            
-            console.print("\n[bold]🖥️ CLI Interactive Mode Active[/bold]")
-            console.print("[cyan]Use CLI for direct commands while monitoring via dashboard[/cyan]")
-            console.print("[yellow]Tip: Keep dashboard open in browser for real-time monitoring[/yellow]")
-        else:
-            console.print("[red]❌ Failed to start dashboard watch tower[/red]")
-            console.print("[yellow]Continuing with CLI-only mode...[/yellow]")
-        
-        # Always show CLI menu for hybrid control
+
+    if dashboard_started:
+        import webbrowser
+        console.print("[green]✅ Dashboard (Watch Tower) started successfully![/green]")
+        console.print("[cyan]🌐 Opening dashboard in browser as monitoring center...[/cyan]")
+        console.print("[yellow]🎛️ Dashboard Watch Tower Features:[/yellow]")
+        console.print("  • 👁️ Real-time job scraping monitoring")
+        console.print("  • 📈 Performance metrics and analytics")
+        console.print("  • 🎯 Visual job filtering and browsing")
+        console.print("  • 🔄 Service status monitoring")
+        console.print("")
+        console.print("[bold green]💡 Dashboard is your monitoring watch tower![/bold green]")
+        console.print("[bold cyan]🖥️ CLI remains active for direct commands![/bold cyan]")
+        webbrowser.open(f"http://localhost:8501/")
+
+        # Wait only as long as the dashboard actually needs to come up
+        try:
+            _run_async(_wait_dashboard_ready("http://localhost:8501/"))
+        except Exception:
+            # Probe is best-effort; the menu works regardless
+            pass
+
+        console.print("\n[bold]🖥️ CLI Interactive Mode Active[/bold]")
+        console.print("[cyan]Use CLI for direct commands while monitoring via dashboard[/cyan]")
+        console.print("[yellow]Tip: Keep dashboard open in browser for real-time monitoring[/yellow]")
+    else:
+        console.print("[red]❌ Failed to start dashboard watch tower[/red]")
+        console.print("[yellow]Continuing with CLI-only mode...[/yellow]")
+
+    # Always show CLI menu for hybrid control; the async variant keeps the
+    # shared loop free for background tasks while waiting on input
+    if main_menu is None:
         from src.cli.menu.main_menu import MainMenu
         main_menu = MainMenu(profile)
+    try:
+        _run_async(main_menu.run_interactive_mode_async(args))
+    except AttributeError:
         main_menu.run_interactive_mode(args)
+    return 0
+
+
+# Action dispatch table: each handler owns its imports and profile loading,
+# so an action only pays for its own dependency tree
+ACTIONS: Dict[str, Callable[[CliArgs, str], int]] = {
+    "health-check": _do_health_check,
+    "pipeline": _do_pipeline,
+    "benchmark": _do_benchmark,
+    "fast-pipeline": _do_fast_pipeline,
+    "jobspy-pipeline": _do_jobspy_pipeline,
+    "scrape": _do_scrape,
+    "dashboard": _do_dashboard,
+    "apply": _do_apply,
+    "process": _do_process_jobs,
+    "process-jobs": _do_process_jobs,
+    "legacy-process-jobs": _do_legacy_process_jobs,
+    "fetch-descriptions": _do_fetch_descriptions,
+    "analyze-jobs": _do_analyze_jobs,
+    "analyze-resume": _do_analyze_resume,
+    "generate-docs": _do_generate_docs,
+    "shutdown": _do_shutdown,
+    "browser-daemon": _do_browser_daemon,
+    "interactive": _do_interactive,
+}
+
+
+if __name__ == "__main__":
+    # Ensure the correct conda environment is used
+    ensure_auto_job_env()
+
+    # Fast help display: skip argparse construction entirely for --help/-h
+    if len(sys.argv) > 1 and sys.argv[1] in ["--help", "-h", "help"]:
+        _print_fast_help()
+        sys.exit(0)
+
+    # Parse command line arguments
+    args = parse_arguments()
+
+    # Rich tracebacks are only worth their import cost when debugging
+    if args.verbose:
+        from rich.traceback import install
+        install(show_locals=True)
+
+    # Heavy actions will need the deferred modules anyway: start loading them
+    # on a background thread so the import cost overlaps profile loading and
+    # progress setup instead of serializing in front of them
+    # (the import lock makes any overlapping import in the handler block
+    # until the prewarm finishes, so no join is needed)
+    if args.action in HEAVY_ACTIONS:
+        import threading
+        threading.Thread(target=_prewarm_heavy_imports, daemon=True).start()
+
+    # Dispatch through the action table (interactive is the default)
+    handler = ACTIONS.get(args.action, _do_interactive)
+    sys.exit(handler(args, args.profile) or 0)
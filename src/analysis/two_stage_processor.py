@@ -18,11 +18,20 @@ import asyncio
 import time
 import logging
 import re
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 
+# Python 3.14+ ships an executor with one sub-interpreter (and one GIL) per
+# worker, so Stage 1's regex-heavy analysis genuinely runs N cores wide.
+# Older runtimes fall back to the thread pool this module has always used.
+try:
+    from concurrent.futures.interpreter import InterpreterPoolExecutor as CPUPoolExecutor
+except ImportError:
+    CPUPoolExecutor = ThreadPoolExecutor
+
 # Conditional torch import for GPU support
 try:
     import torch
@@ -44,7 +53,87 @@ from .enhanced_custom_extractor import ImprovedCustomExtractor, get_Improved_cus
 console = Console()
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Stage 1 extraction tables, compiled once at import. The extractors run per
+# job inside the worker pool, so rebuilding pattern lists (and the lambda
+# closures they carry) on every call was pure allocation in the hottest loop.
+_REMOTE_WORK_PATTERNS = (
+    (re.compile(r'\b(fully remote|100% remote|remote work|work from home|wfh)\b', re.IGNORECASE), 'remote'),
+    (re.compile(r'\b(hybrid|flexible work|remote-friendly|partial remote)\b', re.IGNORECASE), 'hybrid'),
+    (re.compile(r'\b(on-site|onsite|office-based|in-person|no remote)\b', re.IGNORECASE), 'on-site'),
+)
+
+_RELATIVE_DATE_PATTERNS = (
+    (re.compile(r'posted (\d+) days? ago', re.IGNORECASE),
+     lambda m: (datetime.now() - timedelta(days=int(m.group(1)))).strftime('%Y-%m-%d')),
+    (re.compile(r'posted (\d+) hours? ago', re.IGNORECASE),
+     lambda m: (datetime.now() - timedelta(hours=int(m.group(1)))).strftime('%Y-%m-%d')),
+    (re.compile(r'posted today', re.IGNORECASE),
+     lambda m: datetime.now().strftime('%Y-%m-%d')),
+    (re.compile(r'posted yesterday', re.IGNORECASE),
+     lambda m: (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')),
+)
+
+_DEADLINE_PATTERNS = (
+    re.compile(r'apply by ([^.]+)', re.IGNORECASE),
+    re.compile(r'deadline[:\s]+([^.]+)', re.IGNORECASE),
+    re.compile(r'applications close[:\s]+([^.]+)', re.IGNORECASE),
+    re.compile(r'closing date[:\s]+([^.]+)', re.IGNORECASE),
+)
+
+_EXPERIENCE_PATTERNS = (
+    (re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience', re.IGNORECASE), lambda m: f"{m.group(1)}+ years"),
+    (re.compile(r'(\d+)-(\d+)\s*years?\s*(?:of\s*)?experience', re.IGNORECASE), lambda m: f"{m.group(1)}-{m.group(2)} years"),
+    (re.compile(r'minimum\s*(\d+)\s*years?', re.IGNORECASE), lambda m: f"{m.group(1)}+ years"),
+    (re.compile(r'at least\s*(\d+)\s*years?', re.IGNORECASE), lambda m: f"{m.group(1)}+ years"),
+    (re.compile(r'entry.level|junior|graduate|new grad', re.IGNORECASE), lambda m: "0-2 years"),
+    (re.compile(r'senior|lead|principal', re.IGNORECASE), lambda m: "5+ years"),
+)
+
+_EDUCATION_PATTERNS = (
+    (re.compile(r'bachelor.?s?\s*degree', re.IGNORECASE), 'Bachelor\'s Degree'),
+    (re.compile(r'master.?s?\s*degree', re.IGNORECASE), 'Master\'s Degree'),
+    (re.compile(r'phd|doctorate', re.IGNORECASE), 'PhD/Doctorate'),
+    (re.compile(r'high school|diploma', re.IGNORECASE), 'High School/Diploma'),
+    (re.compile(r'college|university', re.IGNORECASE), 'College/University'),
+    (re.compile(r'degree\s*(?:in|related to)\s*([^.]+)', re.IGNORECASE), lambda m: f"Degree in {m.group(1).strip()}"),
+)
+
+_INDUSTRY_KEYWORDS = {
+    'Technology': ('tech', 'software', 'it ', 'saas', 'cloud', 'ai ', 'ml ', 'data science', 'cybersecurity'),
+    'Finance': ('bank', 'financial', 'fintech', 'investment', 'trading', 'insurance', 'credit'),
+    'Healthcare': ('health', 'medical', 'hospital', 'pharma', 'biotech', 'clinical'),
+    'E-commerce': ('ecommerce', 'e-commerce', 'retail', 'marketplace', 'shopping'),
+    'Consulting': ('consulting', 'advisory', 'professional services'),
+    'Education': ('education', 'university', 'school', 'learning', 'training'),
+    'Manufacturing': ('manufacturing', 'automotive', 'industrial', 'production'),
+    'Media': ('media', 'advertising', 'marketing', 'publishing', 'entertainment'),
+    'Government': ('government', 'public sector', 'municipal', 'federal'),
+    'Non-profit': ('non-profit', 'nonprofit', 'charity', 'foundation'),
+}
+
+# Stage 2 keyword tables (all lowercase; matched against text lowered once)
+_COMMON_SKILLS = (
+    "python", "javascript", "java", "sql", "aws", "docker", "kubernetes",
+    "machine learning", "data analysis", "react", "node.js", "git",
+    "agile", "scrum", "tensorflow", "pytorch", "pandas", "numpy",
+)
+
+_POSITIVE_WORDS = ("exciting", "innovative", "growth", "opportunity", "benefits", "flexible")
+_NEGATIVE_WORDS = ("demanding", "pressure", "overtime", "strict", "challenging")
+
+_BENEFIT_KEYWORDS = (
+    "health insurance", "dental", "vision", "401k", "retirement",
+    "vacation", "pto", "remote work", "flexible hours", "bonus",
+)
+
+_CULTURE_INDICATORS = {
+    "collaborative": ("team", "collaborate", "together", "partnership"),
+    "innovative": ("innovation", "modern", "latest"),
+    "fast-paced": ("fast-paced", "dynamic", "agile", "rapid"),
+    "traditional": ("established", "stable", "traditional", "conservative"),
+}
+
+@dataclass(slots=True)
 class Stage1Result:
     """Result from Stage 1 CPU-bound processing"""
     # Basic extracted data
@@ -84,7 +173,7 @@ class Stage1Result:
         if self.basic_requirements is None:
             self.basic_requirements = []
 
-@dataclass
+@dataclass(slots=True)
 class Stage2Result:
     """Result from Stage 2 CPU-based semantic processing"""
     # Improved Text analysis
@@ -201,139 +290,76 @@ class Stage1CPUProcessor:
     
     def _detect_remote_work(self, job_text: str) -> str:
         """Detect remote work options"""
-        remote_patterns = [
-            (r'\b(fully remote|100% remote|remote work|work from home|wfh)\b', 'remote'),
-            (r'\b(hybrid|flexible work|remote-friendly|partial remote)\b', 'hybrid'),
-            (r'\b(on-site|onsite|office-based|in-person|no remote)\b', 'on-site'),
-        ]
-        
-        for pattern, work_type in remote_patterns:
-            if re.search(pattern, job_text, re.IGNORECASE):
+        for pattern, work_type in _REMOTE_WORK_PATTERNS:
+            if pattern.search(job_text):
                 return work_type
-        
+
         return 'not_specified'
-    
+
     def _extract_posted_date(self, job_data: Dict[str, Any], job_text: str) -> Optional[str]:
         """Extract job posted date"""
-        import re
-        from datetime import datetime, timedelta
-        
         # Check if date is in job_data
         for date_field in ['date_posted', 'posted_date', 'created_at', 'scraped_at']:
             if job_data.get(date_field):
                 return str(job_data[date_field])
-        
+
         # Look for relative dates in text
-        relative_patterns = [
-            (r'posted (\d+) days? ago', lambda m: (datetime.now() - timedelta(days=int(m.group(1)))).strftime('%Y-%m-%d')),
-            (r'posted (\d+) hours? ago', lambda m: (datetime.now() - timedelta(hours=int(m.group(1)))).strftime('%Y-%m-%d')),
-            (r'posted today', lambda m: datetime.now().strftime('%Y-%m-%d')),
-            (r'posted yesterday', lambda m: (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')),
-        ]
-        
-        for pattern, date_func in relative_patterns:
-            match = re.search(pattern, job_text, re.IGNORECASE)
+        for pattern, date_func in _RELATIVE_DATE_PATTERNS:
+            match = pattern.search(job_text)
             if match:
                 try:
                     return date_func(match)
                 except:
                     continue
-        
+
         return None
-    
+
     def _extract_deadline(self, job_text: str) -> Optional[str]:
         """Extract application deadline"""
-        import re
-        
-        deadline_patterns = [
-            r'apply by ([^.]+)',
-            r'deadline[:\s]+([^.]+)',
-            r'applications close[:\s]+([^.]+)',
-            r'closing date[:\s]+([^.]+)',
-        ]
-        
-        for pattern in deadline_patterns:
-            match = re.search(pattern, job_text, re.IGNORECASE)
+        for pattern in _DEADLINE_PATTERNS:
+            match = pattern.search(job_text)
             if match:
                 return match.group(1).strip()
-        
+
         return None
-    
+
     def _extract_experience_years(self, job_text: str) -> Optional[str]:
         """Extract required years of experience"""
-        import re
-        
-        experience_patterns = [
-            (r'(\d+)\+?\s*years?\s*(?:of\s*)?experience', lambda m: f"{m.group(1)}+ years"),
-            (r'(\d+)-(\d+)\s*years?\s*(?:of\s*)?experience', lambda m: f"{m.group(1)}-{m.group(2)} years"),
-            (r'minimum\s*(\d+)\s*years?', lambda m: f"{m.group(1)}+ years"),
-            (r'at least\s*(\d+)\s*years?', lambda m: f"{m.group(1)}+ years"),
-            (r'entry.level|junior|graduate|new grad', lambda m: "0-2 years"),
-            (r'senior|lead|principal', lambda m: "5+ years"),
-        ]
-        
-        for pattern, format_func in experience_patterns:
-            match = re.search(pattern, job_text, re.IGNORECASE)
+        for pattern, format_func in _EXPERIENCE_PATTERNS:
+            match = pattern.search(job_text)
             if match:
                 try:
                     return format_func(match)
                 except:
                     continue
-        
+
         return None
-    
+
     def _extract_education_requirements(self, job_text: str) -> Optional[str]:
         """Extract education requirements"""
-        import re
-        
-        education_patterns = [
-            (r'bachelor.?s?\s*degree', 'Bachelor\'s Degree'),
-            (r'master.?s?\s*degree', 'Master\'s Degree'),
-            (r'phd|doctorate', 'PhD/Doctorate'),
-            (r'high school|diploma', 'High School/Diploma'),
-            (r'college|university', 'College/University'),
-            (r'degree\s*(?:in|related to)\s*([^.]+)', lambda m: f"Degree in {m.group(1).strip()}"),
-        ]
-        
-        for pattern, education in education_patterns:
+        for pattern, education in _EDUCATION_PATTERNS:
             if callable(education):
-                match = re.search(pattern, job_text, re.IGNORECASE)
+                match = pattern.search(job_text)
                 if match:
                     try:
                         return education(match)
                     except:
                         continue
             else:
-                if re.search(pattern, job_text, re.IGNORECASE):
+                if pattern.search(job_text):
                     return education
-        
+
         return None
-    
+
     def _detect_industry(self, job_data: Dict[str, Any], job_text: str) -> Optional[str]:
         """Detect industry from job data"""
-        import re
-        
-        # Industry keywords mapping
-        industry_keywords = {
-            'Technology': ['tech', 'software', 'it ', 'saas', 'cloud', 'ai ', 'ml ', 'data science', 'cybersecurity'],
-            'Finance': ['bank', 'financial', 'fintech', 'investment', 'trading', 'insurance', 'credit'],
-            'Healthcare': ['health', 'medical', 'hospital', 'pharma', 'biotech', 'clinical'],
-            'E-commerce': ['ecommerce', 'e-commerce', 'retail', 'marketplace', 'shopping'],
-            'Consulting': ['consulting', 'advisory', 'professional services'],
-            'Education': ['education', 'university', 'school', 'learning', 'training'],
-            'Manufacturing': ['manufacturing', 'automotive', 'industrial', 'production'],
-            'Media': ['media', 'advertising', 'marketing', 'publishing', 'entertainment'],
-            'Government': ['government', 'public sector', 'municipal', 'federal'],
-            'Non-profit': ['non-profit', 'nonprofit', 'charity', 'foundation'],
-        }
-        
         # Check company name and job description
         combined_text = f"{job_data.get('company', '')} {job_text}".lower()
-        
-        for industry, keywords in industry_keywords.items():
+
+        for industry, keywords in _INDUSTRY_KEYWORDS.items():
             if any(keyword in combined_text for keyword in keywords):
                 return industry
-        
+
         return 'Other'
     
     def _compile_filter_patterns(self):
@@ -465,12 +491,22 @@ class Stage1CPUProcessor:
         # Prepare results list to preserve ordering
         ordered_results: List[Optional[Stage1Result]] = [None] * len(jobs)
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all jobs with index tracking
-            future_to_index = {
-                executor.submit(self.process_job_fast, job, i % self.max_workers): i
-                for i, job in enumerate(jobs)
-            }
+        with CPUPoolExecutor(max_workers=self.max_workers) as executor:
+            # Submit all jobs with index tracking. Sub-interpreters get the
+            # module-level worker with plain-data args (profile JSON + job
+            # dict) so nothing on this instance has to pickle; the thread
+            # fallback shares this processor directly as it always has.
+            if CPUPoolExecutor is ThreadPoolExecutor:
+                future_to_index = {
+                    executor.submit(self.process_job_fast, job, i % self.max_workers): i
+                    for i, job in enumerate(jobs)
+                }
+            else:
+                profile_json = json.dumps(self.user_profile, sort_keys=True)
+                future_to_index = {
+                    executor.submit(_stage1_worker, profile_json, job, i % self.max_workers): i
+                    for i, job in enumerate(jobs)
+                }
             
             # Collect results with progress
             with Progress(
@@ -500,6 +536,28 @@ class Stage1CPUProcessor:
         return results
 
 
+# Per-interpreter Stage 1 processor, keyed by the profile JSON it was built
+# from. Each sub-interpreter imports this module freshly and builds its own
+# processor on first task instead of unpickling one per submitted job.
+_WORKER_PROFILE_JSON: Optional[str] = None
+_WORKER_PROCESSOR: Optional[Stage1CPUProcessor] = None
+
+
+def _stage1_worker(profile_json: str, job_data: Dict[str, Any], worker_id: int) -> Stage1Result:
+    """Stage 1 entry point for the interpreter pool.
+
+    Sub-interpreters serialize the submitted callable and its arguments
+    per task, so this must stay a module-level function taking plain data:
+    submitting the bound method would pickle the whole Stage1CPUProcessor
+    (extractor, compiled-pattern tables, logger) for every job.
+    """
+    global _WORKER_PROFILE_JSON, _WORKER_PROCESSOR
+    if _WORKER_PROCESSOR is None or _WORKER_PROFILE_JSON != profile_json:
+        _WORKER_PROCESSOR = Stage1CPUProcessor(json.loads(profile_json), max_workers=1)
+        _WORKER_PROFILE_JSON = profile_json
+    return _WORKER_PROCESSOR.process_job_fast(job_data, worker_id)
+
+
 class Stage2GPUProcessor:
     """
     Stage 2: Text Analysis Processor
@@ -565,33 +623,21 @@ class Stage2GPUProcessor:
             logger.error(f"Error getting embeddings: {e}")
             return None
     
-    def _extract_semantic_skills(self, job_description: str) -> List[str]:
-        """Extract skills using semantic understanding"""
+    def _extract_semantic_skills(self, job_text: str) -> List[str]:
+        """Extract skills using semantic understanding (expects lowercased text)"""
         # This is a simplified version - in production, you'd use more effective NLP
-        common_skills = [
-            "python", "javascript", "java", "sql", "aws", "docker", "kubernetes",
-            "machine learning", "data analysis", "react", "node.js", "git",
-            "agile", "scrum", "tensorflow", "pytorch", "pandas", "numpy"
-        ]
-        
-        job_text = job_description.lower()
         found_skills = []
-        
-        for skill in common_skills:
-            if skill.lower() in job_text:
+
+        for skill in _COMMON_SKILLS:
+            if skill in job_text:
                 found_skills.append(skill)
-        
+
         return found_skills[:10]  # Top 10 skills
-    
-    def _analyze_sentiment(self, job_description: str) -> str:
-        """Analyze job description sentiment"""
-        positive_words = ["exciting", "innovative", "growth", "opportunity", "benefits", "flexible"]
-        negative_words = ["demanding", "pressure", "overtime", "strict", "challenging"]
-        
-        job_text = job_description.lower()
-        
-        positive_count = sum(1 for word in positive_words if word in job_text)
-        negative_count = sum(1 for word in negative_words if word in job_text)
+
+    def _analyze_sentiment(self, job_text: str) -> str:
+        """Analyze job description sentiment (expects lowercased text)"""
+        positive_count = sum(1 for word in _POSITIVE_WORDS if word in job_text)
+        negative_count = sum(1 for word in _NEGATIVE_WORDS if word in job_text)
         
         if positive_count > negative_count:
             return "positive"
@@ -610,15 +656,17 @@ class Stage2GPUProcessor:
                 gpu_memory_before = torch.cuda.memory_allocated() / 1024**2  # MB
             
             job_description = job_data.get('description', '')
-            
+            # Lowercase once; every keyword helper scans this same string
+            job_text = job_description.lower()
+
             # Semantic skill extraction
-            semantic_skills = self._extract_semantic_skills(job_description)
-            
+            semantic_skills = self._extract_semantic_skills(job_text)
+
             # Get embeddings for compatibility analysis
             skill_embeddings = self._get_embeddings(job_description)
-            
+
             # Sentiment analysis
-            sentiment = self._analyze_sentiment(job_description)
+            sentiment = self._analyze_sentiment(job_text)
             
             # Enhanced compatibility using embeddings
             semantic_compatibility = stage1_result.basic_compatibility
@@ -627,8 +675,8 @@ class Stage2GPUProcessor:
                 semantic_compatibility = min(0.95, stage1_result.basic_compatibility * 1.2)
             
             # Extract benefits and culture info
-            benefits = self._extract_benefits(job_description)
-            culture = self._analyze_culture(job_description)
+            benefits = self._extract_benefits(job_text)
+            culture = self._analyze_culture(job_text)
             
             # Contextual understanding
             context = f"Job focuses on {', '.join(semantic_skills[:3])} with {sentiment} outlook"
@@ -660,35 +708,21 @@ class Stage2GPUProcessor:
                 model_confidence=0.0
             )
     
-    def _extract_benefits(self, job_description: str) -> List[str]:
-        """Extract benefits from job description"""
-        benefit_keywords = [
-            "health insurance", "dental", "vision", "401k", "retirement",
-            "vacation", "pto", "remote work", "flexible hours", "bonus"
-        ]
-        
-        job_text = job_description.lower()
+    def _extract_benefits(self, job_text: str) -> List[str]:
+        """Extract benefits from job description (expects lowercased text)"""
         found_benefits = []
-        
-        for benefit in benefit_keywords:
+
+        for benefit in _BENEFIT_KEYWORDS:
             if benefit in job_text:
                 found_benefits.append(benefit.title())
-        
+
         return found_benefits
-    
-    def _analyze_culture(self, job_description: str) -> str:
-        """Analyze company culture from description"""
-        culture_indicators = {
-            "collaborative": ["team", "collaborate", "together", "partnership"],
-            "innovative": ["innovation", "Modern", "latest", "modern"],
-            "fast-paced": ["fast-paced", "dynamic", "agile", "rapid"],
-            "traditional": ["established", "stable", "traditional", "conservative"]
-        }
-        
-        job_text = job_description.lower()
+
+    def _analyze_culture(self, job_text: str) -> str:
+        """Analyze company culture from description (expects lowercased text)"""
         culture_scores = {}
-        
-        for culture, keywords in culture_indicators.items():
+
+        for culture, keywords in _CULTURE_INDICATORS.items():
             score = sum(1 for keyword in keywords if keyword in job_text)
             culture_scores[culture] = score
         
@@ -753,24 +787,21 @@ class TwoStageJobProcessor:
         
         final_results: List[TwoStageResult] = []
         
-        # Stage 2 available: run concurrently with semaphore limit
+        # Stage 2 available: stream jobs through a TaskGroup with semaphore backpressure
         if self.stage2_processor is not None:
             semaphore = asyncio.Semaphore(self.max_concurrent_stage2)
 
-            async def process_single(idx: int, job: Dict[str, Any], s1: Stage1Result) -> TwoStageResult:
-                async with semaphore:
+            async def process_single(idx: int, job: Dict[str, Any], s1: Stage1Result) -> None:
+                try:
                     # Offload synchronous GPU/CPU-bound work to a thread to keep loop responsive
                     s2: Stage2Result = await asyncio.to_thread(self.stage2_processor.process_job_semantic, job, s1)
-                    combined = self._combine_results(job, s1, s2, idx)
-                    return combined
-            
-            # Create tasks for all passed jobs
-            tasks = [
-                asyncio.create_task(process_single(idx, job, s1), name=f"stage2_job_{idx}")
-                for (job, s1, idx) in passed_jobs
-            ]
-            
-            # Consume tasks as they complete to update progress
+                    final_results.append(self._combine_results(job, s1, s2, idx))
+                finally:
+                    semaphore.release()
+
+            # Acquire before create_task so only max_concurrent_stage2 tasks are
+            # ever pending: slow jobs never stall a fixed batch, and the task
+            # set stays bounded regardless of how many jobs passed Stage 1
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -779,14 +810,13 @@ class TwoStageJobProcessor:
                 TimeElapsedColumn(),
                 console=console
             ) as progress:
-                task = progress.add_task("Stage 2 GPU Processing...", total=len(tasks))
-                
-                for coro in asyncio.as_completed(tasks):
-                    try:
-                        res: TwoStageResult = await coro
-                        final_results.append(res)
-                    finally:
-                        progress.advance(task)
+                task = progress.add_task("Stage 2 GPU Processing...", total=len(passed_jobs))
+
+                async with asyncio.TaskGroup() as tg:
+                    for (job, s1, idx) in passed_jobs:
+                        await semaphore.acquire()
+                        t = tg.create_task(process_single(idx, job, s1), name=f"stage2_job_{idx}")
+                        t.add_done_callback(lambda _t: progress.advance(task))
         else:
             # No Stage 2 available: fall back to Stage 1-only results
             for i, (job, stage1_result, _) in enumerate(passed_jobs):
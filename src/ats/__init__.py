@@ -3,6 +3,7 @@ ATS Detection and Submitter Module
 Provides automatic detection of ATS systems and returns appropriate submitters.
 """
 
+import importlib
 import logging
 import re
 from typing import Optional, Dict, Any
@@ -40,6 +41,33 @@ ATS_PATTERNS = {
     ]
 }
 
+# Host-suffix fast path: most job URLs land on a vendor domain, so one
+# hostname comparison classifies them without running any regex. Ordered
+# longest-first so more specific suffixes win.
+_HOST_SUFFIXES = (
+    ('.myworkdayjobs.com', 'workday'),
+    ('.leverpostings.com', 'lever'),
+    ('.workdaycdn.com', 'workday'),
+    ('.greenhouse.io', 'greenhouse'),
+    ('.bamboohr.com', 'bamboohr'),
+    ('.workday.com', 'workday'),
+    ('.icims.com', 'icims'),
+    ('.lever.co', 'lever'),
+)
+
+# Career-site subdomains that justify scanning the path/query for ATS hints
+_ATS_SUBDOMAIN_HINTS = ('careers', 'jobs', 'talent', 'apply')
+
+# Keyword table for the last-resort URL-content scan; one ordered scan
+# replaces the former if/elif chain of substring checks
+_URL_CONTENT_HINTS = (
+    ('workday', 'workday'),
+    ('greenhouse', 'greenhouse'),
+    ('icims', 'icims'),
+    ('bamboo', 'bamboohr'),
+    ('lever', 'lever'),
+)
+
 # Company-specific ATS mappings (for when URL patterns aren't enough)
 COMPANY_ATS_MAPPINGS = {
     'microsoft': 'icims',
@@ -69,12 +97,19 @@ def detect(job_url: str, company_name: str = None) -> Optional[str]:
         return None
     
     try:
-        # Parse the URL
-        parsed_url = urlparse(job_url.lower())
+        # Parse the URL (lowercase once, reused for every comparison below)
         full_url = job_url.lower()
+        parsed_url = urlparse(full_url)
         
         logger.debug(f"Detecting ATS for URL: {job_url}")
-        
+
+        # Fast path: classify by hostname suffix before any regex work
+        host = parsed_url.hostname or ''
+        for suffix, ats_name in _HOST_SUFFIXES:
+            if host.endswith(suffix) or host == suffix[1:]:
+                logger.info(f"Detected {ats_name.upper()} ATS from host suffix: {suffix}")
+                return ats_name
+
         # Check URL patterns for each ATS
         for ats_name, patterns in ATS_PATTERNS.items():
             for pattern in patterns:
@@ -102,25 +137,14 @@ def detect(job_url: str, company_name: str = None) -> Optional[str]:
         domain = parsed_url.netloc
         
         # Check for common ATS subdomains
-        if any(subdomain in domain for subdomain in ['careers', 'jobs', 'talent', 'apply']):
+        if any(subdomain in domain for subdomain in _ATS_SUBDOMAIN_HINTS):
             # Look for ATS-specific keywords in the path or query
             url_content = f"{parsed_url.path} {parsed_url.query}"
-            
-            if 'workday' in url_content:
-                logger.info("Detected WORKDAY ATS from URL content analysis")
-                return 'workday'
-            elif 'greenhouse' in url_content:
-                logger.info("Detected GREENHOUSE ATS from URL content analysis") 
-                return 'greenhouse'
-            elif 'icims' in url_content:
-                logger.info("Detected ICIMS ATS from URL content analysis")
-                return 'icims'
-            elif 'bamboo' in url_content:
-                logger.info("Detected BAMBOOHR ATS from URL content analysis")
-                return 'bamboohr'
-            elif 'lever' in url_content:
-                logger.info("Detected LEVER ATS from URL content analysis")
-                return 'lever'
+
+            for keyword, ats_name in _URL_CONTENT_HINTS:
+                if keyword in url_content:
+                    logger.info(f"Detected {ats_name.upper()} ATS from URL content analysis")
+                    return ats_name
         
         logger.debug(f"No ATS detected for URL: {job_url}")
         return None
@@ -129,52 +153,51 @@ def detect(job_url: str, company_name: str = None) -> Optional[str]:
         logger.error(f"Error detecting ATS for URL {job_url}: {e}")
         return None
 
+# (module, class) per ATS with a working submitter; imported lazily to avoid
+# circular imports and so one table drives dispatch instead of an if/elif chain
+_SUBMITTER_REGISTRY = {
+    'workday': ('workday', 'WorkdaySubmitter'),
+    'greenhouse': ('greenhouse', 'GreenhouseSubmitter'),
+    'icims': ('icims', 'ICIMSSubmitter'),
+}
+
+# ATS types that intentionally route to the fallback submitter
+_FALLBACK_REASONS = {
+    'bamboohr': "BambooHR integration removed; using Generic fallback submitter",
+    'lever': "Lever ATS submitter is not fully implemented, using fallback",
+}
+
 def get_submitter(ats_type: str, browser_context=None):
     """
     Get the appropriate submitter instance for the detected ATS type.
-    
+
     Args:
         ats_type: The ATS type identifier (e.g., 'workday', 'greenhouse')
         browser_context: Optional browser context for submitter initialization
-    
+
     Returns:
         Submitter instance for the specified ATS, or fallback submitter
     """
     if not ats_type:
         logger.warning("No ATS type provided, using fallback submitter")
         return _get_fallback_submitter(browser_context)
-    
+
     try:
         ats_type = ats_type.lower().strip()
         logger.info(f"Getting submitter for ATS type: {ats_type}")
-        
-        # Import submitters dynamically to avoid circular imports
-        if ats_type == 'workday':
-            from .workday import WorkdaySubmitter
-            return WorkdaySubmitter(browser_context)
-            
-        elif ats_type == 'greenhouse':
-            from .greenhouse import GreenhouseSubmitter
-            return GreenhouseSubmitter(browser_context)
-            
-        elif ats_type == 'icims':
-            from .icims import ICIMSSubmitter
-            return ICIMSSubmitter(browser_context)
-            
-        elif ats_type == 'bamboohr':
-            # BambooHR integration has been removed. Use fallback submitter to maintain functionality.
-            logger.warning("BambooHR integration removed; using Generic fallback submitter")
-            return _get_fallback_submitter(browser_context)
-        
-        elif ats_type == 'lever':
-            # Note: Lever submitter is currently incomplete
-            logger.warning("Lever ATS submitter is not fully implemented, using fallback")
-            return _get_fallback_submitter(browser_context)
-            
-        else:
-            logger.warning(f"Unknown ATS type: {ats_type}, using fallback submitter")
+
+        entry = _SUBMITTER_REGISTRY.get(ats_type)
+        if entry is None:
+            reason = _FALLBACK_REASONS.get(
+                ats_type, f"Unknown ATS type: {ats_type}, using fallback submitter"
+            )
+            logger.warning(reason)
             return _get_fallback_submitter(browser_context)
-            
+
+        module_name, class_name = entry
+        module = importlib.import_module(f'.{module_name}', __name__)
+        return getattr(module, class_name)(browser_context)
+
     except ImportError as e:
         logger.error(f"Failed to import submitter for {ats_type}: {e}")
         return _get_fallback_submitter(browser_context)
@@ -8,6 +8,7 @@ predicting success rates, and suggesting optimal application strategies.
 from typing import Dict, Any, List, Optional
 import time
 from datetime import datetime
+from functools import lru_cache
 
 
 class ApplicationFlowOptimizer:
@@ -18,6 +19,17 @@ class ApplicationFlowOptimizer:
     and suggests optimal application strategies.
     """
 
+    __slots__ = (
+        "profile_name",
+        "config",
+        "application_patterns",
+        "success_metrics",
+        "optimization_rules",
+        "_success_count",
+        "_hour_stats",
+        "_day_stats",
+    )
+
     def __init__(self, profile_name: str, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the application flow optimizer.
@@ -31,6 +43,10 @@ class ApplicationFlowOptimizer:
         self.application_patterns = []
         self.success_metrics = {}
         self.optimization_rules = []
+        # Incremental rollups so summary calls don't rescan the history
+        self._success_count = 0
+        self._hour_stats: Dict[int, List[int]] = {}
+        self._day_stats: Dict[str, List[int]] = {}
 
     def analyze_application_pattern(self, job_data: Dict[str, Any], result: Dict[str, Any]) -> None:
         """
@@ -40,18 +56,29 @@ class ApplicationFlowOptimizer:
             job_data: Job data dictionary
             result: Application result dictionary
         """
+        now = datetime.now()
+        success = result.get("success", False)
         pattern = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "job_type": job_data.get("job_type"),
             "company": job_data.get("company"),
             "ats_type": job_data.get("ats_type"),
-            "success": result.get("success", False),
+            "success": success,
             "response_time": result.get("response_time"),
             "error_type": result.get("error_type"),
         }
 
         self.application_patterns.append(pattern)
 
+        # Keep the rollups current so the summary methods stay O(1)
+        if success:
+            self._success_count += 1
+        for stats, key in ((self._hour_stats, now.hour), (self._day_stats, now.strftime("%A"))):
+            bucket = stats.setdefault(key, [0, 0])
+            bucket[1] += 1
+            if success:
+                bucket[0] += 1
+
     def predict_success_rate(self, job_data: Dict[str, Any]) -> float:
         """
         Predict success rate for a job application.
@@ -129,44 +156,15 @@ class ApplicationFlowOptimizer:
         if not self.application_patterns:
             return {"best_time": "09:00", "best_day": "Tuesday", "confidence": 0.5}
 
-        # Analyze timing patterns
-        timing_data = {}
-        for pattern in self.application_patterns:
-            timestamp = datetime.fromisoformat(pattern["timestamp"])
-            hour = timestamp.hour
-            day = timestamp.strftime("%A")
-
-            if hour not in timing_data:
-                timing_data[hour] = {"success": 0, "total": 0}
-            if day not in timing_data:
-                timing_data[day] = {"success": 0, "total": 0}
-
-            timing_data[hour]["total"] += 1
-            timing_data[day]["total"] += 1
-
-            if pattern["success"]:
-                timing_data[hour]["success"] += 1
-                timing_data[day]["success"] += 1
-
-        # Find best hour
-        best_hour = max(
-            timing_data.keys(),
-            key=lambda h: (
-                timing_data[h]["success"] / timing_data[h]["total"]
-                if timing_data[h]["total"] > 0
-                else 0
-            ),
-        )
-
-        # Find best day
-        best_day = max(
-            timing_data.keys(),
-            key=lambda d: (
-                timing_data[d]["success"] / timing_data[d]["total"]
-                if timing_data[d]["total"] > 0
-                else 0
-            ),
-        )
+        # The per-hour and per-day buckets are maintained incrementally by
+        # analyze_application_pattern, so picking the best slot is a max over
+        # at most 24 + 7 entries instead of a rescan of the whole history
+        def success_rate(bucket):
+            successes, total = bucket
+            return successes / total if total > 0 else 0
+
+        best_hour = max(self._hour_stats, key=lambda h: success_rate(self._hour_stats[h]))
+        best_day = max(self._day_stats, key=lambda d: success_rate(self._day_stats[d]))
 
         return {"best_time": f"{best_hour:02d}:00", "best_day": best_day, "confidence": 0.8}
 
@@ -181,7 +179,7 @@ class ApplicationFlowOptimizer:
             return {"total_applications": 0, "success_rate": 0.0}
 
         total_applications = len(self.application_patterns)
-        successful_applications = sum(1 for p in self.application_patterns if p["success"])
+        successful_applications = self._success_count
         success_rate = successful_applications / total_applications
 
         return {
@@ -192,12 +190,24 @@ class ApplicationFlowOptimizer:
         }
 
 
+@lru_cache(maxsize=8)
+def _get_cached_optimizer(profile_name: str) -> ApplicationFlowOptimizer:
+    """Return the shared optimizer for a profile, creating it on first use."""
+    return ApplicationFlowOptimizer(profile_name)
+
+
 def create_flow_optimizer(
     profile_name: str, config: Optional[Dict[str, Any]] = None
 ) -> ApplicationFlowOptimizer:
     """
     Factory function to create an application flow optimizer.
 
+    Optimizers are cached per profile so repeated calls during a batch reuse
+    one instance — this keeps `application_patterns` accumulating across jobs
+    (a fresh instance per job would predict from an empty history) and avoids
+    re-running setup for every application. Passing an explicit `config`
+    bypasses the cache and returns a dedicated instance.
+
     Args:
         profile_name: Name of the user profile
         config: Configuration dictionary
@@ -205,4 +215,6 @@ def create_flow_optimizer(
     Returns:
         ApplicationFlowOptimizer instance
     """
-    return ApplicationFlowOptimizer(profile_name, config)
+    if config:
+        return ApplicationFlowOptimizer(profile_name, config)
+    return _get_cached_optimizer(profile_name)
@@ -3,61 +3,77 @@ ATS Utilities
 Shared utilities for ATS detection, patterns, and common operations.
 """
 
+import logging
 import re
+import sys
+from functools import lru_cache
 from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
 from playwright.sync_api import Page, BrowserContext
 from rich.console import Console
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+
+def intern_selectors(selectors) -> tuple:
+    """Intern selector literals so identical strings share one object.
+
+    Several selectors repeat verbatim across the tables here and in
+    form_utils; interning collapses them to single string objects, which
+    shrinks memory and lets dict/set lookups hit the identity fast path.
+    """
+    return tuple(sys.intern(s) for s in selectors)
 
-# URL patterns for ATS detection
+# URL patterns for ATS detection (tuples: shared read-only data, built once)
 ATS_PATTERNS = {
-    "workday": [
+    "workday": (
         r"myworkdayjobs\.com",
         r"workday\.com",
         r"wd3\.myworkdayjobs\.com",
         r"workdayjobs\.com",
-    ],
-    "icims": [r"icims\.com", r"jobs\.icims\.com", r"careers\.icims\.com"],
-    "greenhouse": [r"greenhouse\.io", r"boards\.greenhouse\.io", r"app\.greenhouse\.io"],
-    "lever": [r"lever\.co", r"jobs\.lever\.co", r"careers\.lever\.co"],
-    "bamboohr": [r"bamboohr\.com", r"\.bamboohr\.com", r"careers\.bamboohr\.com"],
+    ),
+    "icims": (r"icims\.com", r"jobs\.icims\.com", r"careers\.icims\.com"),
+    "greenhouse": (r"greenhouse\.io", r"boards\.greenhouse\.io", r"app\.greenhouse\.io"),
+    "lever": (r"lever\.co", r"jobs\.lever\.co", r"careers\.lever\.co"),
+    "bamboohr": (r"bamboohr\.com", r"\.bamboohr\.com", r"careers\.bamboohr\.com"),
 }
 
 # Common form field selectors across ATS systems
 COMMON_FORM_SELECTORS = {
-    "first_name": [
+    "first_name": (
         "input[name*='firstName']",
         "input[id*='firstName']",
         "input[name*='first_name']",
         "input[id*='first_name']",
         "input[name*='fname']",
         "input[id*='fname']",
-    ],
-    "last_name": [
+    ),
+    "last_name": (
         "input[name*='lastName']",
         "input[id*='lastName']",
         "input[name*='last_name']",
         "input[id*='last_name']",
         "input[name*='lname']",
         "input[id*='lname']",
-    ],
-    "email": [
+    ),
+    "email": (
         "input[type='email']",
         "input[name*='email']",
         "input[id*='email']",
         "input[name*='e-mail']",
         "input[id*='e-mail']",
-    ],
-    "phone": [
+    ),
+    "phone": (
         "input[name*='phone']",
         "input[id*='phone']",
         "input[name*='telephone']",
         "input[id*='telephone']",
         "input[name*='mobile']",
         "input[id*='mobile']",
-    ],
-    "resume": [
+    ),
+    "resume": (
         "input[type='file'][name*='resume']",
         "input[type='file'][id*='resume']",
         "input[type='file'][name*='Resume']",
@@ -65,19 +81,19 @@ COMMON_FORM_SELECTORS = {
         "input[type='file'][name*='upload']",
         "input[type='file'][name*='cv']",
         "input[type='file'][id*='cv']",
-    ],
-    "cover_letter": [
+    ),
+    "cover_letter": (
         "input[type='file'][name*='cover']",
         "input[type='file'][id*='cover']",
         "input[type='file'][name*='Cover']",
         "input[type='file'][id*='Cover']",
         "input[type='file'][name*='letter']",
         "input[type='file'][id*='letter']",
-    ],
+    ),
 }
 
 # Common apply button selectors
-APPLY_BUTTON_SELECTORS = [
+APPLY_BUTTON_SELECTORS = (
     "button:has-text('Apply')",
     "a:has-text('Apply')",
     "button:has-text('Apply Now')",
@@ -88,10 +104,10 @@ APPLY_BUTTON_SELECTORS = [
     "[class*='apply']",
     "input[type='button'][value*='Apply']",
     "input[type='submit'][value*='Apply']",
-]
+)
 
 # Common submit button selectors
-SUBMIT_BUTTON_SELECTORS = [
+SUBMIT_BUTTON_SELECTORS = (
     "button:has-text('Submit')",
     "input[type='submit']",
     "button:has-text('Submit Application')",
@@ -99,10 +115,10 @@ SUBMIT_BUTTON_SELECTORS = [
     "button:has-text('Complete Application')",
     "[data-automation-id*='submit']",
     "[class*='submit']",
-]
+)
 
-# Confirmation message patterns
-CONFIRMATION_PATTERNS = [
+# Confirmation message patterns (matched case-insensitively via _CONFIRMATION_RE)
+CONFIRMATION_PATTERNS = (
     "thank you for your application",
     "application submitted",
     "successfully submitted",
@@ -110,7 +126,80 @@ CONFIRMATION_PATTERNS = [
     "application received",
     "thank you for applying",
     "application complete",
-]
+)
+
+# Confirmation elements checked after submit
+CONFIRMATION_SELECTORS = (
+    "text='Thank you for your application'",
+    "text='Application submitted'",
+    "text='successfully submitted'",
+    "text='has been received'",
+    "div.application-confirmation",
+    "div.success-message",
+    "div.confirmation-message",
+)
+
+# CAPTCHA presence indicators
+CAPTCHA_INDICATORS = (
+    "text='CAPTCHA'",
+    "text='captcha'",
+    "text='Verify you are human'",
+    "text='I am not a robot'",
+    "iframe[src*='recaptcha']",
+    "iframe[src*='captcha']",
+    "[class*='captcha']",
+    "[id*='captcha']",
+)
+
+# Login-wall indicators
+LOGIN_INDICATORS = (
+    "text='Sign In'",
+    "text='Log In'",
+    "text='Create an Account'",
+    "text='Login'",
+    "form[id*='login']",
+    "input[name*='password']",
+    "input[type='password']",
+)
+
+
+# Dedupe selector literals that repeat across the tables above (and in
+# form_utils, which interns its tables the same way)
+COMMON_FORM_SELECTORS = {
+    field: intern_selectors(selectors) for field, selectors in COMMON_FORM_SELECTORS.items()
+}
+APPLY_BUTTON_SELECTORS = intern_selectors(APPLY_BUTTON_SELECTORS)
+SUBMIT_BUTTON_SELECTORS = intern_selectors(SUBMIT_BUTTON_SELECTORS)
+CONFIRMATION_SELECTORS = intern_selectors(CONFIRMATION_SELECTORS)
+CAPTCHA_INDICATORS = intern_selectors(CAPTCHA_INDICATORS)
+LOGIN_INDICATORS = intern_selectors(LOGIN_INDICATORS)
+
+
+# All confirmation phrases as one alternation so the page HTML is scanned once
+_CONFIRMATION_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in CONFIRMATION_PATTERNS), re.IGNORECASE
+)
+
+
+# Single multi-pattern matcher: one named alternation group per ATS, compiled
+# once, so classifying a host is one linear scan instead of a regex per pattern
+_ATS_URL_MATCHER = re.compile(
+    "|".join(
+        f"(?P<{ats_name}>{'|'.join(patterns)})" for ats_name, patterns in ATS_PATTERNS.items()
+    )
+)
+
+
+@lru_cache(maxsize=256)
+def _detect_ats_for_host(host: str) -> str:
+    """Run the pattern scan for one host; results are memoized.
+
+    All ATS URL patterns are domain fragments, so detection depends only on
+    the host — batches of jobs from the same board hit the cache instead of
+    re-running the matcher.
+    """
+    match = _ATS_URL_MATCHER.search(host)
+    return match.lastgroup if match else "unknown"
 
 
 def detect_ats_system(url: str) -> str:
@@ -127,13 +216,8 @@ def detect_ats_system(url: str) -> str:
         return "unknown"
 
     url = url.lower()
-
-    for ats_name, patterns in ATS_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, url):
-                return ats_name
-
-    return "unknown"
+    host = urlparse(url).netloc or url
+    return _detect_ats_for_host(host)
 
 
 def find_and_click_apply_button(page: Page) -> bool:
@@ -154,7 +238,7 @@ def find_and_click_apply_button(page: Page) -> bool:
                 page.wait_for_timeout(2000)
                 return True
         except Exception as e:
-            console.print(f"[dim]Selector {selector} failed: {e}[/dim]")
+            logger.debug("Selector %s failed: %s", selector, e)
             continue
 
     console.print("[yellow]No apply button found with common selectors[/yellow]")
@@ -179,7 +263,7 @@ def find_and_click_submit_button(page: Page) -> bool:
                 page.wait_for_timeout(2000)
                 return True
         except Exception as e:
-            console.print(f"[dim]Selector {selector} failed: {e}[/dim]")
+            logger.debug("Selector %s failed: %s", selector, e)
             continue
 
     console.print("[yellow]No submit button found with common selectors[/yellow]")
@@ -196,25 +280,15 @@ def check_for_confirmation(page: Page) -> bool:
     Returns:
         True if confirmation message found, False otherwise
     """
-    page_content = page.content().lower()
-
-    for pattern in CONFIRMATION_PATTERNS:
-        if pattern in page_content:
-            console.print(f"[green]Found confirmation: {pattern}[/green]")
-            return True
+    # One case-insensitive scan over the raw HTML: avoids lowering the whole
+    # page into a second multi-MB string and walking it once per pattern
+    match = _CONFIRMATION_RE.search(page.content())
+    if match:
+        console.print(f"[green]Found confirmation: {match.group(0).lower()}[/green]")
+        return True
 
     # Also check for common confirmation selectors
-    confirmation_selectors = [
-        "text='Thank you for your application'",
-        "text='Application submitted'",
-        "text='successfully submitted'",
-        "text='has been received'",
-        "div.application-confirmation",
-        "div.success-message",
-        "div.confirmation-message",
-    ]
-
-    for selector in confirmation_selectors:
+    for selector in CONFIRMATION_SELECTORS:
         try:
             if page.is_visible(selector):
                 console.print(f"[green]Found confirmation element: {selector}[/green]")
@@ -252,7 +326,7 @@ def fill_common_form_fields(page: Page, profile: Dict, field_type: str) -> int:
             if not value:
                 continue
 
-            selectors = COMMON_FORM_SELECTORS.get(field_name, [])
+            selectors = COMMON_FORM_SELECTORS.get(field_name, ())
             for selector in selectors:
                 try:
                     if page.is_visible(selector):
@@ -278,7 +352,7 @@ def upload_file(page: Page, file_path: str, field_type: str) -> bool:
     Returns:
         True if file was uploaded successfully, False otherwise
     """
-    selectors = COMMON_FORM_SELECTORS.get(field_type, [])
+    selectors = COMMON_FORM_SELECTORS.get(field_type, ())
 
     for selector in selectors:
         try:
@@ -287,7 +361,7 @@ def upload_file(page: Page, file_path: str, field_type: str) -> bool:
                 console.print(f"[green]Uploaded {field_type}: {file_path}[/green]")
                 return True
         except Exception as e:
-            console.print(f"[dim]Selector {selector} failed: {e}[/dim]")
+            logger.debug("Selector %s failed: %s", selector, e)
             continue
 
     console.print(f"[yellow]No {field_type} upload field found[/yellow]")
@@ -321,18 +395,7 @@ def check_for_captcha(page: Page) -> bool:
     Returns:
         True if CAPTCHA detected, False otherwise
     """
-    captcha_indicators = [
-        "text='CAPTCHA'",
-        "text='captcha'",
-        "text='Verify you are human'",
-        "text='I am not a robot'",
-        "iframe[src*='recaptcha']",
-        "iframe[src*='captcha']",
-        "[class*='captcha']",
-        "[id*='captcha']",
-    ]
-
-    for indicator in captcha_indicators:
+    for indicator in CAPTCHA_INDICATORS:
         try:
             if page.is_visible(indicator):
                 console.print("[yellow]⚠️ CAPTCHA detected![/yellow]")
@@ -353,17 +416,7 @@ def check_for_login_requirement(page: Page) -> bool:
     Returns:
         True if login is required, False otherwise
     """
-    login_indicators = [
-        "text='Sign In'",
-        "text='Log In'",
-        "text='Create an Account'",
-        "text='Login'",
-        "form[id*='login']",
-        "input[name*='password']",
-        "input[type='password']",
-    ]
-
-    for indicator in login_indicators:
+    for indicator in LOGIN_INDICATORS:
         try:
             if page.is_visible(indicator):
                 console.print("[yellow]Login required detected[/yellow]")
@@ -9,6 +9,7 @@ All ATS-specific submitters should inherit from this class.
 """
 
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import Dict, Optional, Union
 
 from playwright.sync_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
@@ -22,6 +23,68 @@ from src.core.browser_utils import FormUtils
 
 console = Console()
 
+# Static selector tables, built once at import instead of per call
+_CAPTCHA_SELECTORS = (
+    "iframe[src*=captcha]",
+    "iframe[src*=recaptcha]",
+    "div.g-recaptcha",
+    "div[class*=captcha]",
+    "input[name*=captcha]",
+)
+
+_RESUME_SELECTORS = (
+    "input[type=file][name*=resume]",
+    "input[type=file][name*=cv]",
+    "input[type=file]:below(:text('Resume'))",
+    "input[type=file]:below(:text('CV'))",
+    "input[type=file]:below(:text('Upload'))",
+    "input[type=file][accept*=pdf]",
+    "input[type=file][accept*=docx]",
+)
+
+_COVER_LETTER_SELECTORS = (
+    "input[type=file][name*=cover]",
+    "input[type=file][name*=letter]",
+    "input[type=file]:below(:text('Cover'))",
+    "input[type=file]:below(:text('Letter'))",
+    "input[type=file]:nth-of-type(2)",
+)
+
+_NEXT_BUTTON_SELECTORS = (
+    "button:has-text('Next')",
+    "button:has-text('Continue')",
+    "button:has-text('Save & Continue')",
+    "input[type=submit][value*=Next]",
+    "input[type=submit][value*=Continue]",
+    "a:has-text('Next')",
+    "a:has-text('Continue')",
+)
+
+_SUBMIT_BUTTON_SELECTORS = (
+    "button:has-text('Submit')",
+    "button:has-text('Apply')",
+    "button:has-text('Send Application')",
+    "input[type=submit][value*=Submit]",
+    "input[type=submit][value*=Apply]",
+    "a:has-text('Submit')",
+    "a:has-text('Apply')",
+)
+
+# Selector -> profile field for the common personal-info inputs; frozen so
+# the mapping cannot be mutated by callers sharing the module table
+_PERSONAL_FIELD_SELECTORS = MappingProxyType({
+    "input[name*=firstName]": "first_name",
+    "input[name*=lastName]": "last_name",
+    "input[name*=first_name]": "first_name",
+    "input[name*=last_name]": "last_name",
+    "input[type=email]": "email",
+    "input[name*=email]": "email",
+    "input[name*=phone]": "phone",
+    "input[name*=telephone]": "phone",
+    "input[name*=location]": "location",
+    "input[name*=address]": "location",
+})
+
 
 class BaseSubmitter(ABC):
     """
@@ -86,15 +149,7 @@ class BaseSubmitter(ABC):
         Raises:
             NeedsHumanException: If CAPTCHA is detected
         """
-        captcha_selectors = [
-            "iframe[src*=captcha]",
-            "iframe[src*=recaptcha]",
-            "div.g-recaptcha",
-            "div[class*=captcha]",
-            "input[name*=captcha]",
-        ]
-
-        for selector in captcha_selectors:
+        for selector in _CAPTCHA_SELECTORS:
             if page.is_visible(selector):
                 console.print("[bold red]CAPTCHA detected![/bold red]")
                 raise NeedsHumanException("CAPTCHA detected, human intervention required")
@@ -137,18 +192,7 @@ class BaseSubmitter(ABC):
         Raises:
             NeedsHumanException: If upload fails
         """
-        # Common resume upload selectors
-        resume_selectors = [
-            "input[type=file][name*=resume]",
-            "input[type=file][name*=cv]",
-            "input[type=file]:below(:text('Resume'))",
-            "input[type=file]:below(:text('CV'))",
-            "input[type=file]:below(:text('Upload'))",
-            "input[type=file][accept*=pdf]",
-            "input[type=file][accept*=docx]",
-        ]
-
-        return FormUtils.Configurable_attach(page, resume_selectors, resume_path)
+        return FormUtils.Configurable_attach(page, _RESUME_SELECTORS, resume_path)
 
     def upload_cover_letter(self, page: Page, cover_letter_path: str) -> bool:
         """
@@ -161,17 +205,8 @@ class BaseSubmitter(ABC):
         Returns:
             True if successful, False otherwise
         """
-        # Common cover letter upload selectors
-        cover_letter_selectors = [
-            "input[type=file][name*=cover]",
-            "input[type=file][name*=letter]",
-            "input[type=file]:below(:text('Cover'))",
-            "input[type=file]:below(:text('Letter'))",
-            "input[type=file]:nth-of-type(2)",
-        ]
-
         try:
-            return FormUtils.Configurable_attach(page, cover_letter_selectors, cover_letter_path)
+            return FormUtils.Configurable_attach(page, _COVER_LETTER_SELECTORS, cover_letter_path)
         except NeedsHumanException:
             # Cover letter is often optional, so don't raise an exception
             console.print("[yellow]Could not upload cover letter automatically[/yellow]")
@@ -188,26 +223,17 @@ class BaseSubmitter(ABC):
         Returns:
             Number of fields successfully filled
         """
-        # Map profile fields to common form field selectors
+        # Split the name once and fan the values out over the frozen table
+        name_parts = profile.get("name", "").split()
+        values = {
+            "first_name": name_parts[0] if name_parts else "",
+            "last_name": name_parts[-1] if name_parts else "",
+            "email": profile.get("email", ""),
+            "phone": profile.get("phone", ""),
+            "location": profile.get("location", ""),
+        }
         field_mappings = {
-            "input[name*=firstName]": (
-                profile.get("name", "").split()[0] if profile.get("name") else ""
-            ),
-            "input[name*=lastName]": (
-                profile.get("name", "").split()[-1] if profile.get("name") else ""
-            ),
-            "input[name*=first_name]": (
-                profile.get("name", "").split()[0] if profile.get("name") else ""
-            ),
-            "input[name*=last_name]": (
-                profile.get("name", "").split()[-1] if profile.get("name") else ""
-            ),
-            "input[type=email]": profile.get("email", ""),
-            "input[name*=email]": profile.get("email", ""),
-            "input[name*=phone]": profile.get("phone", ""),
-            "input[name*=telephone]": profile.get("phone", ""),
-            "input[name*=location]": profile.get("location", ""),
-            "input[name*=address]": profile.get("location", ""),
+            selector: values[field] for selector, field in _PERSONAL_FIELD_SELECTORS.items()
         }
 
         return self.fill_form_fields(page, field_mappings)
@@ -222,17 +248,7 @@ class BaseSubmitter(ABC):
         Returns:
             True if button was clicked, False otherwise
         """
-        next_button_selectors = [
-            "button:has-text('Next')",
-            "button:has-text('Continue')",
-            "button:has-text('Save & Continue')",
-            "input[type=submit][value*=Next]",
-            "input[type=submit][value*=Continue]",
-            "a:has-text('Next')",
-            "a:has-text('Continue')",
-        ]
-
-        for selector in next_button_selectors:
+        for selector in _NEXT_BUTTON_SELECTORS:
             try:
                 if page.is_visible(selector):
                     page.click(selector)
@@ -253,17 +269,7 @@ class BaseSubmitter(ABC):
         Returns:
             True if button was clicked, False otherwise
         """
-        submit_button_selectors = [
-            "button:has-text('Submit')",
-            "button:has-text('Apply')",
-            "button:has-text('Send Application')",
-            "input[type=submit][value*=Submit]",
-            "input[type=submit][value*=Apply]",
-            "a:has-text('Submit')",
-            "a:has-text('Apply')",
-        ]
-
-        for selector in submit_button_selectors:
+        for selector in _SUBMIT_BUTTON_SELECTORS:
             try:
                 if page.is_visible(selector):
                     page.click(selector)
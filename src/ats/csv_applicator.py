@@ -5,23 +5,65 @@ This module handles job applications from CSV files, providing batch processing
 and CSV-based job application functionality.
 """
 
-from typing import Dict, Any, List, Optional, Iterator
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Iterator
 import csv
+import multiprocessing
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from itertools import islice
 from pathlib import Path
-from .base_submitter import BaseSubmitter
 
+# Playwright-backed submitters (and the wider utils package they pull in)
+# are imported lazily so CSV parsing and validation never pay their
+# multi-second, multi-MB import cost
+if TYPE_CHECKING:
+    from .base_submitter import BaseSubmitter
+
+# Rough per-application duration estimates in seconds, keyed by ATS type.
+# Used to dispatch long jobs first (LPT scheduling) so a heavy Workday form
+# queued last cannot stretch the makespan of a concurrent batch.
+_ATS_DURATION_ESTIMATES = {
+    "workday": 120,
+    "icims": 90,
+    "bamboohr": 60,
+    "greenhouse": 45,
+    "lever": 45,
+    "manual": 180,
+}
+_DEFAULT_DURATION_ESTIMATE = 60
+
+# 1 MiB IO buffer for CSV files: multi-MB exports hit far fewer read/write
+# syscalls than with the default 8 KiB buffer
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Columns every job dict is guaranteed to carry
+_CSV_JOB_FIELDS = (
+    "id",
+    "title",
+    "company",
+    "location",
+    "url",
+    "ats_type",
+    "job_type",
+    "description",
+    "requirements",
+    "salary",
+    "posted_date",
+)
 
-class CSVJobApplicator:
+
+class CSVApplicator:
     """
-    CSV Job Applicator - Alias for CSVApplicator for backward compatibility.
+    Handles job applications from CSV files.
 
-    Handles job applications from CSV files with Improved functionality.
+    Provides batch processing, CSV parsing, and application tracking
+    for jobs loaded from CSV files.
     """
 
     def __init__(self, profile_name: str, csv_file_path: Optional[str] = None):
         """
-        Initialize the CSV job applicator.
+        Initialize the CSV applicator.
 
         Args:
             profile_name: Name of the user profile
@@ -32,319 +74,197 @@ class CSVJobApplicator:
         self.jobs = []
         self.results = []
 
-    def load_jobs_from_csv(self, csv_file_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    def iter_csv_jobs(self, csv_file_path: Optional[str] = None) -> Iterator[Dict[str, Any]]:
         """
-        Load jobs from a CSV file.
+        Yield jobs from a CSV file one row at a time.
+
+        Streaming keeps peak memory flat regardless of CSV size and lets
+        the first application start before the whole file is parsed.
 
         Args:
             csv_file_path: Path to CSV file (optional if set in constructor)
 
-        Returns:
-            List of job dictionaries
+        Yields:
+            Job dictionaries, one per CSV row
         """
+        from src.utils.job_helpers import generate_job_hash
+
         file_path = csv_file_path or self.csv_file_path
         if not file_path or not os.path.exists(file_path):
-            return []
+            return
 
-        jobs = []
         try:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
+            with open(file_path, "r", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as csvfile:
                 reader = csv.DictReader(csvfile)
                 for row in reader:
-                    job = {
-                        "id": row.get("id", ""),
-                        "title": row.get("title", ""),
-                        "company": row.get("company", ""),
-                        "location": row.get("location", ""),
-                        "url": row.get("url", ""),
-                        "ats_type": row.get("ats_type", "unknown"),
-                        "job_type": row.get("job_type", ""),
-                        "description": row.get("description", ""),
-                        "requirements": row.get("requirements", ""),
-                        "salary": row.get("salary", ""),
-                        "posted_date": row.get("posted_date", ""),
-                    }
-                    jobs.append(job)
+                    # Reuse the dict DictReader already built instead of
+                    # copying eleven fields into a fresh one per row; only
+                    # missing or short columns need touching up
+                    for field in _CSV_JOB_FIELDS:
+                        if row.get(field) is None:
+                            row[field] = ""
+                    if not row["ats_type"]:
+                        row["ats_type"] = "unknown"
+                    # Hash once at read time so duplicate checks and
+                    # applied-job filtering never re-hash the same job
+                    row["_hash"] = generate_job_hash(row)
+                    yield row
 
         except Exception as e:
             print(f"Error loading CSV file: {e}")
-            return []
 
+    def load_jobs_from_csv(self, csv_file_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Load jobs from a CSV file.
+
+        Args:
+            csv_file_path: Path to CSV file (optional if set in constructor)
+
+        Returns:
+            List of job dictionaries
+        """
+        jobs = list(self.iter_csv_jobs(csv_file_path))
         self.jobs = jobs
         return jobs
 
     def apply_to_jobs_batch(
-        self, submitter: BaseSubmitter, max_jobs: Optional[int] = None
+        self,
+        submitter: Optional["BaseSubmitter"] = None,
+        max_jobs: Optional[int] = None,
+        max_workers: int = 1,
+        submitter_factory: Optional[Callable[[], "BaseSubmitter"]] = None,
+        submit_timeout: Optional[float] = None,
+        applied_hashes: Optional[Any] = None,
     ) -> List[Dict[str, Any]]:
         """
         Apply to multiple jobs in batch.
 
+        The work is IO-bound (page loads and DOM waits), so with
+        `max_workers` > 1 jobs are applied concurrently on a thread pool.
+        Because sync Playwright submitters are single-threaded objects, a
+        `submitter_factory` must be supplied for concurrent runs so each
+        worker thread builds its own submitter; the default stays strictly
+        sequential on the one `submitter` instance.
+
         Args:
-            submitter: ATS submitter instance
+            submitter: ATS submitter instance (sequential runs)
             max_jobs: Maximum number of jobs to apply to
+            max_workers: Number of concurrent application workers
+            submitter_factory: Per-thread submitter builder (concurrent runs)
+            submit_timeout: Per-job timeout in seconds for concurrent runs;
+                a job exceeding it is recorded as a failed result
+            applied_hashes: Hashes of jobs already applied to; matching
+                jobs are dropped before any submission work happens
 
         Returns:
-            List of application results
+            List of application results, in job order
         """
         if not self.jobs:
             return []
 
         jobs_to_process = self.jobs[:max_jobs] if max_jobs else self.jobs
-        results = []
-
-        for job in jobs_to_process:
-            try:
-                # Create a mock profile and file paths for now
-                mock_profile = {"name": "Test User", "email": "test@example.com"}
-                mock_resume_path = "resume.pdf"
-                mock_cover_letter_path = "cover_letter.pdf"
 
-                result = submitter.submit(
-                    job, mock_profile, mock_resume_path, mock_cover_letter_path
-                )
-                result_dict = {
-                    "success": result == "Applied",
-                    "status": result,
-                    "job_id": job.get("id"),
-                    "job_title": job.get("title"),
-                    "company": job.get("company"),
-                }
-                results.append(result_dict)
-            except Exception as e:
-                results.append(
-                    {
-                        "success": False,
-                        "error": str(e),
-                        "job_id": job.get("id"),
-                        "job_title": job.get("title"),
-                        "company": job.get("company"),
-                    }
-                )
+        # Resumed batches skip completed jobs here, before any browser or
+        # submitter work is spent on them
+        if applied_hashes is not None:
+            jobs_to_process = self.filter_applied_jobs(jobs_to_process, applied_hashes)
+            if not jobs_to_process:
+                self.results = []
+                return []
+
+        if max_workers > 1 and submitter_factory is not None:
+            local = threading.local()
+
+            def apply_one(job: Dict[str, Any]) -> Dict[str, Any]:
+                if not hasattr(local, "submitter"):
+                    local.submitter = submitter_factory()
+                return self._apply_to_single_job(local.submitter, job)
+
+            # LPT scheduling: dispatch the longest-looking jobs first so a
+            # free worker always pulls the largest remaining one, then put
+            # the results back into CSV order for the caller
+            order = sorted(
+                range(len(jobs_to_process)),
+                key=lambda i: self._estimate_duration(jobs_to_process[i]),
+                reverse=True,
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(apply_one, jobs_to_process[i]) for i in order]
+                results = [None] * len(jobs_to_process)
+                for i, future in zip(order, futures):
+                    # future.result(timeout=...) works from any thread,
+                    # unlike signal-based alarms which only fire on the main
+                    # thread of the main interpreter. A timed-out worker
+                    # cannot be killed, so its thread finishes in the
+                    # background while the batch moves on.
+                    try:
+                        results[i] = future.result(timeout=submit_timeout)
+                    except FuturesTimeout:
+                        job = jobs_to_process[i]
+                        results[i] = {
+                            "success": False,
+                            "error": f"Application timed out after {submit_timeout}s",
+                            "job_id": job.get("id"),
+                            "job_title": job.get("title"),
+                            "company": job.get("company"),
+                        }
+        else:
+            results = [self._apply_to_single_job(submitter, job) for job in jobs_to_process]
 
         self.results = results
         return results
 
-    def save_results_to_csv(self, output_file_path: str) -> bool:
-        """
-        Save application results to a CSV file.
-
-        Args:
-            output_file_path: Path to output CSV file
-
-        Returns:
-            True if successful, False otherwise
-        """
-        if not self.results:
-            return False
-
-        try:
-            with open(output_file_path, "w", newline="", encoding="utf-8") as csvfile:
-                fieldnames = ["job_id", "job_title", "company", "success", "error", "timestamp"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-                for result in self.results:
-                    writer.writerow(
-                        {
-                            "job_id": result.get("job_id", ""),
-                            "job_title": result.get("job_title", ""),
-                            "company": result.get("company", ""),
-                            "success": result.get("success", False),
-                            "error": result.get("error", ""),
-                            "timestamp": result.get("timestamp", "2025-06-24T16:00:00Z"),
-                        }
-                    )
-            return True
-        except Exception as e:
-            print(f"Error saving results to CSV: {e}")
-            return False
-
-    def get_success_rate(self) -> float:
-        """
-        Calculate success rate of batch applications.
-
-        Returns:
-            Success rate as a percentage
-        """
-        if not self.results:
-            return 0.0
-
-        successful = sum(1 for result in self.results if result.get("success", False))
-        return (successful / len(self.results)) * 100
-
-    def get_failed_jobs(self) -> List[Dict[str, Any]]:
-        """
-        Get list of failed job applications.
-
-        Returns:
-            List of failed job results
-        """
-        return [result for result in self.results if not result.get("success", False)]
-
-    def get_successful_jobs(self) -> List[Dict[str, Any]]:
-        """
-        Get list of successful job applications.
-
-        Returns:
-            List of successful job results
-        """
-        return [result for result in self.results if result.get("success", False)]
-
-    def validate_csv_format(self, csv_file_path: str) -> Dict[str, Any]:
+    def filter_applied_jobs(
+        self, jobs: List[Dict[str, Any]], applied_hashes: Any
+    ) -> List[Dict[str, Any]]:
         """
-        Validate CSV file format and required columns.
+        Drop jobs whose hash is already in an applied-jobs collection.
 
         Args:
-            csv_file_path: Path to CSV file
+            jobs: Job dictionaries (with or without a precomputed `_hash`)
+            applied_hashes: Hashes of jobs already applied to
 
         Returns:
-            Validation result dictionary
+            Jobs not yet applied to, in their original order
         """
-        if not os.path.exists(csv_file_path):
-            return {"valid": False, "error": "File does not exist"}
+        from src.utils.job_helpers import generate_job_hash
 
-        required_columns = ["title", "company", "url"]
-        optional_columns = [
-            "id",
-            "location",
-            "ats_type",
-            "job_type",
-            "description",
-            "requirements",
-            "salary",
-            "posted_date",
+        applied = set(applied_hashes)
+        if not applied:
+            return list(jobs)
+        return [
+            job for job in jobs if job.get("_hash", generate_job_hash(job)) not in applied
         ]
 
-        try:
-            with open(csv_file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-                headers = reader.fieldnames or []
-
-                missing_required = [col for col in required_columns if col not in headers]
-                present_optional = [col for col in optional_columns if col in headers]
-
-                return {
-                    "valid": len(missing_required) == 0,
-                    "missing_required": missing_required,
-                    "present_optional": present_optional,
-                    "total_columns": len(headers),
-                }
-        except Exception as e:
-            return {"valid": False, "error": str(e)}
-
-
-class CSVApplicator:
-    """
-    Handles job applications from CSV files.
-
-    Provides batch processing, CSV parsing, and application tracking
-    for jobs loaded from CSV files.
-    """
-
-    def __init__(self, profile_name: str, csv_file_path: Optional[str] = None):
-        """
-        Initialize the CSV applicator.
-
-        Args:
-            profile_name: Name of the user profile
-            csv_file_path: Path to CSV file with job data
-        """
-        self.profile_name = profile_name
-        self.csv_file_path = csv_file_path
-        self.jobs = []
-        self.results = []
-
-    def load_jobs_from_csv(self, csv_file_path: Optional[str] = None) -> List[Dict[str, Any]]:
-        """
-        Load jobs from a CSV file.
-
-        Args:
-            csv_file_path: Path to CSV file (optional if set in constructor)
-
-        Returns:
-            List of job dictionaries
-        """
-        file_path = csv_file_path or self.csv_file_path
-        if not file_path or not os.path.exists(file_path):
-            return []
+    def _estimate_duration(self, job: Dict[str, Any]) -> int:
+        """Estimate how long applying to a job takes, from its ATS type."""
+        ats_type = str(job.get("ats_type", "")).lower()
+        return _ATS_DURATION_ESTIMATES.get(ats_type, _DEFAULT_DURATION_ESTIMATE)
 
-        jobs = []
+    def _apply_to_single_job(self, submitter: "BaseSubmitter", job: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply to one job and normalize the outcome into a result dict."""
         try:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    job = {
-                        "id": row.get("id", ""),
-                        "title": row.get("title", ""),
-                        "company": row.get("company", ""),
-                        "location": row.get("location", ""),
-                        "url": row.get("url", ""),
-                        "ats_type": row.get("ats_type", "unknown"),
-                        "job_type": row.get("job_type", ""),
-                        "description": row.get("description", ""),
-                        "requirements": row.get("requirements", ""),
-                        "salary": row.get("salary", ""),
-                        "posted_date": row.get("posted_date", ""),
-                    }
-                    jobs.append(job)
+            # Create a mock profile and file paths for now
+            mock_profile = {"name": "Test User", "email": "test@example.com"}
+            mock_resume_path = "resume.pdf"
+            mock_cover_letter_path = "cover_letter.pdf"
 
+            result = submitter.submit(job, mock_profile, mock_resume_path, mock_cover_letter_path)
+            return {
+                "success": result == "Applied",
+                "status": result,
+                "job_id": job.get("id"),
+                "job_title": job.get("title"),
+                "company": job.get("company"),
+            }
         except Exception as e:
-            print(f"Error loading CSV file: {e}")
-            return []
-
-        self.jobs = jobs
-        return jobs
-
-    def apply_to_jobs_batch(
-        self, submitter: BaseSubmitter, max_jobs: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """
-        Apply to multiple jobs in batch.
-
-        Args:
-            submitter: ATS submitter instance
-            max_jobs: Maximum number of jobs to apply to
-
-        Returns:
-            List of application results
-        """
-        if not self.jobs:
-            return []
-
-        jobs_to_process = self.jobs[:max_jobs] if max_jobs else self.jobs
-        results = []
-
-        for job in jobs_to_process:
-            try:
-                # Create a mock profile and file paths for now
-                mock_profile = {"name": "Test User", "email": "test@example.com"}
-                mock_resume_path = "resume.pdf"
-                mock_cover_letter_path = "cover_letter.pdf"
-
-                result = submitter.submit(
-                    job, mock_profile, mock_resume_path, mock_cover_letter_path
-                )
-                result_dict = {
-                    "success": result == "Applied",
-                    "status": result,
-                    "job_id": job.get("id"),
-                    "job_title": job.get("title"),
-                    "company": job.get("company"),
-                }
-                results.append(result_dict)
-            except Exception as e:
-                results.append(
-                    {
-                        "success": False,
-                        "error": str(e),
-                        "job_id": job.get("id"),
-                        "job_title": job.get("title"),
-                        "company": job.get("company"),
-                    }
-                )
-
-        self.results = results
-        return results
+            return {
+                "success": False,
+                "error": str(e),
+                "job_id": job.get("id"),
+                "job_title": job.get("title"),
+                "company": job.get("company"),
+            }
 
     def save_results_to_csv(self, output_file_path: str) -> bool:
         """
@@ -360,22 +280,24 @@ class CSVApplicator:
             return False
 
         try:
-            with open(output_file_path, "w", newline="", encoding="utf-8") as csvfile:
-                fieldnames = ["job_id", "job_title", "company", "success", "error", "timestamp"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-                for result in self.results:
-                    writer.writerow(
-                        {
-                            "job_id": result.get("job_id", ""),
-                            "job_title": result.get("job_title", ""),
-                            "company": result.get("company", ""),
-                            "success": result.get("success", False),
-                            "error": result.get("error", ""),
-                            "timestamp": result.get("timestamp", "2025-06-24T16:00:00Z"),
-                        }
+            with open(
+                output_file_path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE
+            ) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(["job_id", "job_title", "company", "success", "error", "timestamp"])
+                # writerows drives the loop in C and consumes the generator
+                # one tuple at a time, so no intermediate row dicts are built
+                writer.writerows(
+                    (
+                        result.get("job_id", ""),
+                        result.get("job_title", ""),
+                        result.get("company", ""),
+                        result.get("success", False),
+                        result.get("error", ""),
+                        result.get("timestamp", "2025-06-24T16:00:00Z"),
                     )
+                    for result in self.results
+                )
             return True
         except Exception as e:
             print(f"Error saving results to CSV: {e}")
@@ -456,6 +378,14 @@ class CSVApplicator:
             return {"valid": False, "error": str(e)}
 
 
+class CSVJobApplicator(CSVApplicator):
+    """
+    CSV Job Applicator - Alias for CSVApplicator for backward compatibility.
+
+    Handles job applications from CSV files with Improved functionality.
+    """
+
+
 def create_csv_applicator(profile_name: str, csv_file_path: Optional[str] = None) -> CSVApplicator:
     """
     Factory function to create a CSV applicator.
@@ -470,52 +400,115 @@ def create_csv_applicator(profile_name: str, csv_file_path: Optional[str] = None
     return CSVApplicator(profile_name, csv_file_path)
 
 
+def _apply_csv_slice(args: tuple) -> List[Dict[str, Any]]:
+    """
+    Apply to a contiguous row range of a CSV file.
+
+    Worker entry point for multiprocess sharding, so it must stay a
+    picklable module-level function taking one plain-data argument.
+
+    Args:
+        args: Tuple of (profile_name, csv_file_path, start, stop)
+
+    Returns:
+        List of per-job result dictionaries for the row range
+    """
+    # Submitters are Playwright-backed, so import the factory here in the
+    # worker rather than at module import time
+    from src.ats import get_submitter
+
+    profile_name, csv_file_path, start, stop = args
+    applicator = CSVJobApplicator(profile_name, csv_file_path)
+
+    # One submitter per ATS type per worker: jobs for the same ATS reuse a
+    # browser session instead of launching one per row
+    submitters: Dict[str, Any] = {}
+
+    results = []
+    for job in islice(applicator.iter_csv_jobs(), start, stop):
+        ats_type = str(job.get("ats_type", "unknown")).lower()
+        try:
+            submitter = submitters.get(ats_type)
+            if submitter is None:
+                submitter = submitters[ats_type] = get_submitter(ats_type)
+            results.append(applicator._apply_to_single_job(submitter, job))
+        except Exception as e:
+            results.append({
+                "success": False,
+                "error": str(e),
+                "job_id": job.get("id"),
+                "job_title": job.get("title"),
+                "company": job.get("company"),
+            })
+    return results
+
+
+def _count_csv_rows(csv_file_path: str) -> int:
+    """Count data rows in a CSV file (quote-aware, header excluded)."""
+    with open(csv_file_path, "r", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as csvfile:
+        return max(0, sum(1 for _ in csv.reader(csvfile)) - 1)
+
+
 def apply_from_csv(profile_name: str, csv_file_path: str, **kwargs) -> Dict[str, Any]:
     """
     Apply to jobs from a CSV file.
-    
+
     This function provides a simple interface for applying to jobs from CSV files,
     as expected by the test suite.
-    
+
     Args:
         profile_name: Name of the user profile
         csv_file_path: Path to CSV file containing job data
-        **kwargs: Additional options for job application
-        
+        **kwargs: Additional options for job application, including
+            `limit` (max rows to process) and `processes` (shard the CSV
+            across worker processes when > 1)
+
     Returns:
         Dictionary containing application results
     """
     try:
-        applicator = CSVJobApplicator(profile_name, csv_file_path)
-        jobs = applicator.load_jobs_from_csv()
-        
-        if not jobs:
+        limit = kwargs.get("limit")
+        processes = kwargs.get("processes", 1)
+
+        if processes > 1:
+            # Shard the row range across worker processes, each running
+            # its own applicator; this sidesteps the GIL for CPU-heavy
+            # per-job work while results merge back in CSV order
+            total = _count_csv_rows(csv_file_path)
+            if limit:
+                total = min(total, limit)
+
+            base, extra = divmod(total, processes)
+            shards = []
+            start = 0
+            for worker in range(processes):
+                size = base + (1 if worker < extra else 0)
+                if size:
+                    shards.append((profile_name, csv_file_path, start, start + size))
+                    start += size
+
+            results = []
+            if shards:
+                with multiprocessing.Pool(len(shards)) as pool:
+                    for slice_results in pool.map(_apply_csv_slice, shards):
+                        results.extend(slice_results)
+        else:
+            results = _apply_csv_slice((profile_name, csv_file_path, 0, limit or None))
+
+        if not results:
             return {
                 "success": False,
                 "error": "No jobs found in CSV file",
                 "jobs_processed": 0
             }
-        
-        # Process applications
-        results = []
-        for job in jobs:
-            try:
-                result = applicator.apply_to_job(job)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "job": job,
-                    "success": False,
-                    "error": str(e)
-                })
-        
+
         successful = sum(1 for r in results if r.get("success", False))
-        
+
         return {
             "success": True,
-            "jobs_processed": len(jobs),
+            "jobs_processed": len(results),
             "successful_applications": successful,
-            "failed_applications": len(jobs) - successful,
+            "failed_applications": len(results) - successful,
             "results": results
         }
         
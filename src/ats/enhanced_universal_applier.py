@@ -7,6 +7,7 @@ A comprehensive job application system that works with ALL ATS and non-ATS syste
 import asyncio
 import time
 import json
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -38,6 +39,7 @@ from .form_utils import (
     check_for_login_required,
     check_for_confirmation,
     generate_cover_letter_text,
+    install_form_helpers,
 )
 
 from .ats_utils import (
@@ -56,6 +58,12 @@ from src.core.job_database import get_job_db
 
 console = Console()
 
+# Shared context settings for every application context
+_BROWSER_CONTEXT_ARGS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+}
+
 
 class ImprovedUniversalApplier:
     """
@@ -68,12 +76,18 @@ class ImprovedUniversalApplier:
     - Application status tracking
     """
 
-    def __init__(self, profile_name: str = "Nirajan", profile_path: str = None, headless: bool = True, dry_run: bool = False):
-        """Initialize the Improved universal applier."""
+    def __init__(self, profile_name: str = "Nirajan", profile_path: str = None, headless: bool = True, dry_run: bool = False, verbose: bool = True):
+        """Initialize the Improved universal applier.
+
+        With verbose=False the per-job progress chatter collapses to one
+        line per job, which avoids thousands of rich markup-parsing calls
+        on large batches (useful for non-TTY/CI runs).
+        """
         self.profile_name = profile_name
         self.profile_path = profile_path
         self.headless = headless
         self.dry_run = dry_run
+        self.verbose = verbose
         
         # Load profile from path or name
         if profile_path:
@@ -94,6 +108,7 @@ class ImprovedUniversalApplier:
         self.max_retries = 3  # Max retry attempts
 
         # Browser instances (initialized as None)
+        self.playwright = None
         self.browser = None
         self.context = None
 
@@ -106,6 +121,7 @@ class ImprovedUniversalApplier:
         self.applications_successful = 0
         self.applications_failed = []
         self.applications_manual = []
+        self._pending_records = []
 
         console.print(f"[cyan]🚀 Improved Universal Applier initialized for {profile_name}[/cyan]")
         if not dry_run:
@@ -168,11 +184,12 @@ class ImprovedUniversalApplier:
             "retry_count": 0,
         }
 
-        console.print(
-            f"\n[bold blue]📝 Applying to: {result['job_title']} at {result['company']}[/bold blue]"
-        )
-        console.print(f"[cyan]🔗 URL: {result['url']}[/cyan]")
-        console.print(f"[cyan]🏢 ATS: {result['ats_system']}[/cyan]")
+        if self.verbose:
+            console.print(
+                f"\n[bold blue]📝 Applying to: {result['job_title']} at {result['company']}[/bold blue]"
+            )
+            console.print(f"[cyan]🔗 URL: {result['url']}[/cyan]")
+            console.print(f"[cyan]🏢 ATS: {result['ats_system']}[/cyan]")
 
         # Try application with retries
         for attempt in range(self.max_retries):
@@ -184,19 +201,22 @@ class ImprovedUniversalApplier:
                 if status == "applied":
                     result["details"] = "Application submitted successfully"
                     self.applications_successful += 1
-                    console.print(f"[green]✅ Application successful![/green]")
+                    if self.verbose:
+                        console.print(f"[green]✅ Application successful![/green]")
                     break
                 elif status == "manual":
                     result["details"] = "Requires manual completion"
                     self.applications_manual.append(result)
-                    console.print(f"[yellow]⚠️ Manual completion required[/yellow]")
+                    if self.verbose:
+                        console.print(f"[yellow]⚠️ Manual completion required[/yellow]")
                     break
                 else:
                     result["details"] = f"Attempt {attempt + 1} failed: {status}"
                     console.print(f"[red]❌ Attempt {attempt + 1} failed: {status}[/red]")
 
                     if attempt < self.max_retries - 1:
-                        console.print(f"[cyan]🔄 Retrying in {self.step_delay} seconds...[/cyan]")
+                        if self.verbose:
+                            console.print(f"[cyan]🔄 Retrying in {self.step_delay} seconds...[/cyan]")
                         await asyncio.sleep(self.step_delay)
 
             except Exception as e:
@@ -215,61 +235,72 @@ class ImprovedUniversalApplier:
         # Save application record
         self._save_application_record(result)
 
+        if not self.verbose:
+            # One plain line per job instead of the progress chatter above
+            console.print(
+                f"{self.applications_attempted}. {result['job_title']} @ "
+                f"{result['company']} -> {result['status']}"
+            )
+
         return result
 
     async def _attempt_application(self, job: Dict, result: Dict) -> str:
-        """Attempt to apply to a job."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            )
+        """Attempt to apply to a job.
 
-            try:
-                page = await context.new_page()
+        The browser is launched once per applier and reused across jobs —
+        relaunching Chromium per attempt cost ~1-2s each time. Each job
+        still gets its own fresh context, so no cookies or state leak
+        between applications.
+        """
+        await self._setup_browser()
+        context = await self.browser.new_context(**_BROWSER_CONTEXT_ARGS)
+        await install_form_helpers(context)
+
+        try:
+            page = await context.new_page()
 
-                # Navigate to job page
+            # Navigate to job page
+            if self.verbose:
                 console.print(f"[cyan]\U0001f310 Navigating to job page...[/cyan]")
-                await page.goto(job["url"], timeout=self.timeout)
-                await page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(2)
-
-                # Try to apply based on ATS system
-                ats_system = result["ats_system"]
-
-
-                # Attach generic handler to context for handler fallback
-                context._generic_apply = self._apply_generic
-                context._profile = self.profile
-                context._resume_path = self.resume_path
-                context._cover_letter_path = self.cover_letter_path
-
-                if ats_system == "workday":
-                    return await apply_workday(page, job)
-                elif ats_system == "greenhouse":
-                    return await apply_greenhouse(page, job)
-                elif ats_system == "icims":
-                    return await apply_icims(page, job)
-                elif ats_system == "lever":
-                    return await apply_lever(page, job)
-                elif ats_system == "bamboohr":
-                    # BambooHR integration removed: fall back to generic application flow
-                    return await self._apply_generic(page, job)
-                else:
-                    # Generic application for unknown ATS
-                    return await self._apply_generic(page, job)
+            await page.goto(job["url"], timeout=self.timeout)
+            await page.wait_for_load_state("domcontentloaded")
+            await asyncio.sleep(2)
 
-            except Exception as e:
-                console.print(f"[red]\u274c Browser error: {e}[/red]")
-                return f"browser_error: {str(e)}"
-            finally:
-                await context.close()
-                await browser.close()
+            # Try to apply based on ATS system
+            ats_system = result["ats_system"]
+
+
+            # Attach generic handler to context for handler fallback
+            context._generic_apply = self._apply_generic
+            context._profile = self.profile
+            context._resume_path = self.resume_path
+            context._cover_letter_path = self.cover_letter_path
+
+            if ats_system == "workday":
+                return await apply_workday(page, job)
+            elif ats_system == "greenhouse":
+                return await apply_greenhouse(page, job)
+            elif ats_system == "icims":
+                return await apply_icims(page, job)
+            elif ats_system == "lever":
+                return await apply_lever(page, job)
+            elif ats_system == "bamboohr":
+                # BambooHR integration removed: fall back to generic application flow
+                return await self._apply_generic(page, job)
+            else:
+                # Generic application for unknown ATS
+                return await self._apply_generic(page, job)
+
+        except Exception as e:
+            console.print(f"[red]\u274c Browser error: {e}[/red]")
+            return f"browser_error: {str(e)}"
+        finally:
+            await context.close()
 
     async def _apply_generic(self, page: Page, job: Dict) -> str:
         """Generic application process for any website."""
-        console.print("[cyan]🔧 Using generic application process...[/cyan]")
+        if self.verbose:
+            console.print("[cyan]🔧 Using generic application process...[/cyan]")
 
         try:
             # Step 1: Find and click apply button
@@ -282,7 +313,8 @@ class ImprovedUniversalApplier:
             # Step 3: Fill application form(s) - handle multi-step forms
             max_steps = 10
             for step in range(max_steps):
-                console.print(f"[cyan]📝 Processing form step {step + 1}...[/cyan]")
+                if self.verbose:
+                    console.print(f"[cyan]📝 Processing form step {step + 1}...[/cyan]")
 
                 # Check for CAPTCHA or login requirements
                 if await check_for_captcha(page):
@@ -293,28 +325,31 @@ class ImprovedUniversalApplier:
 
                 # Fill visible form fields
                 fields_filled = await fill_form_fields(page, self.profile)
-                console.print(f"[green]✅ Filled {fields_filled} form fields[/green]")
+                if self.verbose:
+                    console.print(f"[green]✅ Filled {fields_filled} form fields[/green]")
 
                 # Upload documents
                 if self.resume_path:
                     resume_uploaded = await upload_resume(page, self.resume_path)
-                    if resume_uploaded:
+                    if resume_uploaded and self.verbose:
                         console.print("[green]✅ Resume uploaded[/green]")
 
                 if self.cover_letter_path:
                     cover_uploaded = await upload_cover_letter(page, self.cover_letter_path)
-                    if cover_uploaded:
+                    if cover_uploaded and self.verbose:
                         console.print("[green]✅ Cover letter uploaded[/green]")
 
                 # Try to proceed to next step
                 if await click_next_or_continue(page):
-                    console.print("[green]✅ Proceeded to next step[/green]")
+                    if self.verbose:
+                        console.print("[green]✅ Proceeded to next step[/green]")
                     await asyncio.sleep(self.step_delay)
                     continue
 
                 # Try to submit if no next step
                 if await click_submit_button(page):
-                    console.print("[green]✅ Application submitted![/green]")
+                    if self.verbose:
+                        console.print("[green]✅ Application submitted![/green]")
                     return "applied"
 
                 # If we can't proceed or submit, we might be done or stuck
@@ -338,26 +373,27 @@ class ImprovedUniversalApplier:
     # ATS-specific methods are now handled by external handler modules.
 
     def _save_application_record(self, result: Dict) -> None:
-        """Save application record to database."""
-        try:
-            # Create application record
-            application_record = {
-                "job_id": result["job_id"],
-                "job_title": result["job_title"],
-                "company": result["company"],
-                "url": result["url"],
-                "ats_system": result["ats_system"],
-                "application_status": result["status"],
-                "application_date": result["timestamp"],
-                "details": result["details"],
-                "retry_count": result["retry_count"],
-            }
-
-            # You can save this to your existing database or a separate applications table
-            console.print(f"[dim]💾 Application record saved[/dim]")
+        """Queue an application record; records are written at batch boundaries.
 
+        Writing to the database after every single application puts a commit
+        on the hot path, so records are buffered in memory and flushed in one
+        transaction by _flush_application_records().
+        """
+        self._pending_records.append(
+            (result["job_id"], result["status"], result["details"])
+        )
+
+    def _flush_application_records(self) -> None:
+        """Write all queued application records to the database in one batch."""
+        if not self._pending_records:
+            return
+        try:
+            written = self.db.update_application_statuses_batch(self._pending_records)
+            console.print(f"[dim]💾 Saved {written} application records[/dim]")
         except Exception as e:
-            console.print(f"[yellow]⚠️ Could not save application record: {e}[/yellow]")
+            console.print(f"[yellow]⚠️ Could not save application records: {e}[/yellow]")
+        finally:
+            self._pending_records.clear()
 
     async def apply_to_multiple_jobs(self, jobs: List[Dict], max_applications: int = 10, max_concurrent: int = 3) -> Dict:
         """
@@ -382,9 +418,10 @@ class ImprovedUniversalApplier:
             )
 
             for i, job in enumerate(jobs[:max_applications]):
-                console.print(
-                    f"\n[bold]Processing job {i + 1}/{min(len(jobs), max_applications)}[/bold]"
-                )
+                if self.verbose:
+                    console.print(
+                        f"\n[bold]Processing job {i + 1}/{min(len(jobs), max_applications)}[/bold]"
+                    )
 
                 result = await self.apply_to_job(job)
                 results.append(result)
@@ -393,11 +430,17 @@ class ImprovedUniversalApplier:
 
                 # Rate limiting - wait between applications
                 if i < min(len(jobs), max_applications) - 1:
-                    console.print(
-                        f"[cyan]⏱️ Waiting {self.step_delay} seconds before next application...[/cyan]"
-                    )
+                    if self.verbose:
+                        console.print(
+                            f"[cyan]⏱️ Waiting {self.step_delay} seconds before next application...[/cyan]"
+                        )
                     await asyncio.sleep(self.step_delay)
 
+        # Persist all application records in one transaction and release
+        # the browser reused across the batch
+        self._flush_application_records()
+        await self._close_browser()
+
         # Generate summary
         summary = self._generate_application_summary(results)
         self._display_application_summary(summary)
@@ -407,16 +450,16 @@ class ImprovedUniversalApplier:
     def _generate_application_summary(self, results: List[Dict]) -> Dict:
         """Generate summary of application results."""
         total = len(results)
-        successful = len([r for r in results if r["status"] == "applied"])
-        manual = len([r for r in results if r["status"] == "manual"])
-        failed = len([r for r in results if r["status"] == "failed"])
+        # One Counter pass over the statuses instead of a list scan per
+        # metric; missing statuses default to 0
+        counts = Counter(r["status"] for r in results)
 
         return {
             "total_attempts": total,
-            "successful": successful,
-            "manual_required": manual,
-            "failed": failed,
-            "success_rate": (successful / total * 100) if total > 0 else 0,
+            "successful": counts["applied"],
+            "manual_required": counts["manual"],
+            "failed": counts["failed"],
+            "success_rate": (counts["applied"] / total * 100) if total > 0 else 0,
             "results": results,
             "timestamp": datetime.now().isoformat(),
         }
@@ -434,21 +477,15 @@ class ImprovedUniversalApplier:
 
         total = summary["total_attempts"]
         table.add_row("Total Applications", str(total), "100%")
-        table.add_row(
-            "Successful",
-            str(summary["successful"]),
-            f"{summary['successful']/total*100:.1f}%" if total > 0 else "0%",
-        )
-        table.add_row(
-            "Manual Required",
-            str(summary["manual_required"]),
-            f"{summary['manual_required']/total*100:.1f}%" if total > 0 else "0%",
-        )
-        table.add_row(
-            "Failed",
-            str(summary["failed"]),
-            f"{summary['failed']/total*100:.1f}%" if total > 0 else "0%",
-        )
+        # Compute each percentage once instead of re-dividing per row
+        for label, key in (
+            ("Successful", "successful"),
+            ("Manual Required", "manual_required"),
+            ("Failed", "failed"),
+        ):
+            count = summary[key]
+            pct = f"{count / total * 100:.1f}%" if total > 0 else "0%"
+            table.add_row(label, str(count), pct)
 
         console.print(table)
 
@@ -475,12 +512,22 @@ class ImprovedUniversalApplier:
     async def _setup_browser(self):
         """Setup browser instance for application process."""
         if not self.browser:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(headless=self.headless)
-            self.context = await self.browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            )
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=self.headless)
+            self.context = await self.browser.new_context(**_BROWSER_CONTEXT_ARGS)
+            await install_form_helpers(self.context)
+
+    async def _close_browser(self):
+        """Close the shared browser and stop the Playwright driver."""
+        if self.context:
+            await self.context.close()
+            self.context = None
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
 
     async def _setup_profile(self):
         """Setup profile data for application process."""
@@ -508,7 +555,11 @@ class ImprovedUniversalApplier:
 async def apply_to_job(job: Dict, profile_name: str = "Nirajan") -> Dict:
     """Apply to a single job."""
     applier = ImprovedUniversalApplier(profile_name)
-    return await applier.apply_to_job(job)
+    try:
+        return await applier.apply_to_job(job)
+    finally:
+        applier._flush_application_records()
+        await applier._close_browser()
 
 
 async def apply_to_jobs_from_database(
@@ -3,7 +3,6 @@ ATS Fallback Submitters
 Provides comprehensive fallback methods for job applications when primary ATS submitters fail.
 """
 
-import time
 import json
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +14,29 @@ from .base_submitter import BaseSubmitter
 
 console = Console()
 
+# One query covering every generic text-like field
+_FILLABLE_FIELDS_QUERY = "input[type='text'], input[type='email'], input[type='tel'], textarea"
+
+# Collects visibility plus the identifying attributes of every candidate
+# field in a single round-trip instead of four IPC calls per element
+_FIELD_METADATA_JS = """
+(elements) => elements.map((el, index) => ({
+    index,
+    visible: el.checkVisibility ? el.checkVisibility() : el.offsetParent !== null,
+    text: ((el.name || '') + ' ' + (el.id || '') + ' ' + (el.placeholder || '')).toLowerCase(),
+}))
+"""
+
+# (keywords, profile lookup) pairs evaluated in order for each field
+_FIELD_VALUE_RULES = (
+    (("email", "mail"), lambda profile: profile.get("email", "")),
+    (("phone", "tel", "mobile"), lambda profile: profile.get("phone", "")),
+    (("name", "first"), lambda profile: profile.get("first_name", profile.get("name", ""))),
+    (("last", "surname"), lambda profile: profile.get("last_name", "")),
+    (("address", "street"), lambda profile: profile.get("address", "")),
+    (("city", "location"), lambda profile: profile.get("city", profile.get("location", ""))),
+)
+
 
 class GenericATSSubmitter(BaseSubmitter):
     """
@@ -122,8 +144,9 @@ class GenericATSSubmitter(BaseSubmitter):
                         return True
                     break
 
-                # Wait for next page to load
-                time.sleep(2)
+                # Wait for next page to load; wait_for_timeout keeps the
+                # Playwright driver pumping events instead of blocking Python
+                page.wait_for_timeout(2000)
 
             return False
 
@@ -178,7 +201,7 @@ class GenericATSSubmitter(BaseSubmitter):
                 if page.is_visible(selector, timeout=2000):
                     page.set_input_files(selector, resume_path)
                     console.print(f"[green]✅ Uploaded resume via: {selector}[/green]")
-                    time.sleep(2)  # Wait for upload
+                    page.wait_for_timeout(2000)  # Wait for upload
                     return True
             except Exception:
                 continue
@@ -202,7 +225,7 @@ class GenericATSSubmitter(BaseSubmitter):
                 if page.is_visible(selector, timeout=2000):
                     page.set_input_files(selector, cover_letter_path)
                     console.print(f"[green]✅ Uploaded cover letter via: {selector}[/green]")
-                    time.sleep(2)
+                    page.wait_for_timeout(2000)
                     return True
             except Exception:
                 continue
@@ -210,46 +233,34 @@ class GenericATSSubmitter(BaseSubmitter):
         return False
 
     def _fill_visible_form_fields(self, page: Page, profile: Dict) -> None:
-        """Fill any visible form fields with appropriate data."""
-        try:
-            # Get all visible input fields
-            inputs = page.query_selector_all(
-                "input[type='text'], input[type='email'], input[type='tel'], textarea"
-            )
+        """Fill any visible form fields with appropriate data.
 
-            for input_elem in inputs:
-                try:
-                    if not input_elem.is_visible():
-                        continue
-
-                    # Get field attributes
-                    name = input_elem.get_attribute("name") or ""
-                    id_attr = input_elem.get_attribute("id") or ""
-                    placeholder = input_elem.get_attribute("placeholder") or ""
-
-                    # Determine appropriate value based on field characteristics
-                    field_text = (name + " " + id_attr + " " + placeholder).lower()
-
-                    value = None
-                    if any(keyword in field_text for keyword in ["email", "mail"]):
-                        value = profile.get("email", "")
-                    elif any(keyword in field_text for keyword in ["phone", "tel", "mobile"]):
-                        value = profile.get("phone", "")
-                    elif any(keyword in field_text for keyword in ["name", "first"]):
-                        value = profile.get("first_name", profile.get("name", ""))
-                    elif any(keyword in field_text for keyword in ["last", "surname"]):
-                        value = profile.get("last_name", "")
-                    elif any(keyword in field_text for keyword in ["address", "street"]):
-                        value = profile.get("address", "")
-                    elif any(keyword in field_text for keyword in ["city", "location"]):
-                        value = profile.get("city", profile.get("location", ""))
-
-                    if value:
-                        input_elem.fill(str(value))
+        Visibility and identifying attributes for all candidate fields are
+        fetched in one eval_on_selector_all call; only matched fields then
+        pay a fill round-trip.
+        """
+        try:
+            inputs = page.query_selector_all(_FILLABLE_FIELDS_QUERY)
+            metadata = page.eval_on_selector_all(_FILLABLE_FIELDS_QUERY, _FIELD_METADATA_JS)
 
-                except Exception:
+            for meta in metadata:
+                if not meta["visible"]:
                     continue
 
+                # Determine appropriate value based on field characteristics
+                field_text = meta["text"]
+                value = None
+                for keywords, get_value in _FIELD_VALUE_RULES:
+                    if any(keyword in field_text for keyword in keywords):
+                        value = get_value(profile)
+                        break
+
+                if value:
+                    try:
+                        inputs[meta["index"]].fill(str(value))
+                    except Exception:
+                        continue
+
         except Exception as e:
             console.print(f"[yellow]⚠️ Error filling visible fields: {e}[/yellow]")
 
@@ -4,58 +4,289 @@ Contains helper functions for form filling, document upload, and page interactio
 """
 
 import asyncio
+import sys
+from functools import lru_cache
 from typing import Dict, List
 from pathlib import Path
 from playwright.async_api import Page
 from rich.console import Console
 
+from .ats_utils import intern_selectors
+
 console = Console()
 
+# Selector tables are module-level tuples so they are built once at import
+# instead of reallocated on every call in the application loop.
+APPLY_SELECTORS = (
+    # Standard apply buttons
+    "button:has-text('Apply')",
+    "a:has-text('Apply')",
+    "button:has-text('Apply Now')",
+    "a:has-text('Apply Now')",
+    "input[value*='Apply']",
+    # Data attributes
+    "[data-automation-id*='apply']",
+    "[data-testid*='apply']",
+    "[data-qa*='apply']",
+    # Class-based selectors
+    ".apply-button",
+    ".btn-apply",
+    ".apply-now",
+    "#apply-button",
+    # Submit application variants
+    "button:has-text('Submit Application')",
+    "a:has-text('Submit Application')",
+    # Language variants
+    "button:has-text('Postuler')",  # French
+    "button:has-text('Aplicar')",  # Spanish
+    "button:has-text('Bewerben')",  # German
+)
+
+# (selector, profile value key) pairs for fill_form_fields; values are looked
+# up per call since they depend on the profile
+FIELD_SELECTORS = (
+    # Name fields
+    ("input[name*='firstName'], input[name*='first_name'], input[name*='fname']", "first_name"),
+    ("input[name*='lastName'], input[name*='last_name'], input[name*='lname']", "last_name"),
+    (
+        "input[name*='fullName'], input[name*='full_name'], input[name*='name']:not([name*='first']):not([name*='last'])",
+        "name",
+    ),
+    # Contact fields
+    ("input[type='email'], input[name*='email']", "email"),
+    ("input[type='tel'], input[name*='phone'], input[name*='telephone'], input[name*='mobile']", "phone"),
+    # Location fields
+    ("input[name*='location'], input[name*='address'], input[name*='city']", "location"),
+    # Common text areas
+    ("textarea[name*='cover'], textarea[name*='message'], textarea[name*='note']", "cover_letter"),
+)
+
+RESUME_UPLOAD_SELECTORS = (
+    "input[type='file'][name*='resume']",
+    "input[type='file'][name*='cv']",
+    "input[type='file'][id*='resume']",
+    "input[type='file'][id*='cv']",
+    "input[type='file'][accept*='pdf']",
+    "input[type='file'][accept*='doc']",
+    "input[type='file']",  # Generic file input as last resort
+)
+
+COVER_LETTER_UPLOAD_SELECTORS = (
+    "input[type='file'][name*='cover']",
+    "input[type='file'][name*='letter']",
+    "input[type='file'][id*='cover']",
+    "input[type='file'][id*='letter']",
+    "input[type='file']:nth-of-type(2)",  # Second file input
+)
+
+NEXT_SELECTORS = (
+    "button:has-text('Next')",
+    "button:has-text('Continue')",
+    "button:has-text('Save & Continue')",
+    "button:has-text('Proceed')",
+    "input[type='submit'][value*='Next']",
+    "input[type='submit'][value*='Continue']",
+    ".next-button",
+    "#next-button",
+    "[data-testid*='next']",
+    "[data-testid*='continue']",
+)
+
+SUBMIT_SELECTORS = (
+    "button:has-text('Submit')",
+    "button:has-text('Submit Application')",
+    "button:has-text('Send Application')",
+    "button:has-text('Apply')",
+    "input[type='submit'][value*='Submit']",
+    "input[type='submit'][value*='Apply']",
+    ".submit-button",
+    "#submit-button",
+    "[data-testid*='submit']",
+)
+
+CAPTCHA_SELECTORS = (
+    "iframe[src*='recaptcha']",
+    "iframe[src*='captcha']",
+    ".g-recaptcha",
+    "[class*='captcha']",
+    "text='CAPTCHA'",
+    "text='I am not a robot'",
+)
+
+LOGIN_SELECTORS = (
+    "input[type='password']",
+    "text='Sign In'",
+    "text='Log In'",
+    "text='Login'",
+    "text='Create Account'",
+)
+
+CONFIRMATION_SELECTORS = (
+    "text='Thank you'",
+    "text='Application submitted'",
+    "text='Successfully submitted'",
+    "text='Application received'",
+    ".confirmation",
+    ".success-message",
+)
+
+# Intern the literals so selectors repeated across these tables (and the
+# ats_utils ones) share single string objects
+APPLY_SELECTORS = intern_selectors(APPLY_SELECTORS)
+FIELD_SELECTORS = tuple((sys.intern(selector), field) for selector, field in FIELD_SELECTORS)
+RESUME_UPLOAD_SELECTORS = intern_selectors(RESUME_UPLOAD_SELECTORS)
+COVER_LETTER_UPLOAD_SELECTORS = intern_selectors(COVER_LETTER_UPLOAD_SELECTORS)
+NEXT_SELECTORS = intern_selectors(NEXT_SELECTORS)
+SUBMIT_SELECTORS = intern_selectors(SUBMIT_SELECTORS)
+CAPTCHA_SELECTORS = intern_selectors(CAPTCHA_SELECTORS)
+LOGIN_SELECTORS = intern_selectors(LOGIN_SELECTORS)
+CONFIRMATION_SELECTORS = intern_selectors(CONFIRMATION_SELECTORS)
+
+
+# Walks a selector list inside the browser and tags the first visible match
+# with a marker attribute, so finding a button costs one round-trip instead of
+# one is_visible() wait per candidate selector. Playwright's :has-text()
+# pseudo-class is emulated with a textContent scan since querySelector does
+# not understand it.
+_VISIBLE_PROBE_JS = """
+([selectors, attr]) => {
+    // Clear markers left by earlier probes: on multi-step forms that do
+    // not navigate between steps, a stale marker on a now-hidden button
+    // would win the DOM-order race against the freshly tagged one
+    for (const el of document.querySelectorAll('[' + attr + ']')) {
+        el.removeAttribute(attr);
+    }
+    const visible = (el) =>
+        el.checkVisibility ? el.checkVisibility() : el.offsetParent !== null;
+    const hasText = /^(.+?):has-text\\('(.+)'\\)$/;
+    for (const selector of selectors) {
+        let found = null;
+        const m = selector.match(hasText);
+        if (m) {
+            const needle = m[2].toLowerCase();
+            for (const el of document.querySelectorAll(m[1])) {
+                if (visible(el) && (el.textContent || '').toLowerCase().includes(needle)) {
+                    found = el;
+                    break;
+                }
+            }
+        } else {
+            let elements;
+            try {
+                elements = document.querySelectorAll(selector);
+            } catch (e) {
+                continue;
+            }
+            for (const el of elements) {
+                if (visible(el)) {
+                    found = el;
+                    break;
+                }
+            }
+        }
+        if (found) {
+            found.setAttribute(attr, '1');
+            return selector;
+        }
+    }
+    return null;
+}
+"""
+
+
+# Resolves all field probes in one browser round-trip: for each
+# (selector, field) pair, find the first visible empty element and report
+# its selector + index so Python can issue targeted fills.
+_FIELD_PROBE_JS = """
+(probes) => {
+    const result = {};
+    for (const [selector, field] of probes) {
+        if (field in result) continue;
+        let elements;
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        for (let i = 0; i < elements.length; i++) {
+            const el = elements[i];
+            const visible = el.checkVisibility
+                ? el.checkVisibility()
+                : el.offsetParent !== null;
+            if (visible && !(el.value || '').trim()) {
+                result[field] = [selector, i];
+                break;
+            }
+        }
+    }
+    return result;
+}
+"""
+
+
+# Bundles both probes under one window object so contexts that ran
+# install_form_helpers() keep the compiled functions warm in V8 and each
+# evaluate only marshals arguments instead of re-shipping JS source.
+FORM_HELPERS_INIT_JS = (
+    "window.__joblensProbe = {"
+    f"firstVisible: {_VISIBLE_PROBE_JS},"
+    f"fields: {_FIELD_PROBE_JS}"
+    "};"
+)
+
+
+async def install_form_helpers(context) -> None:
+    """Register the form probe helpers on every page of a browser context.
+
+    Call once after creating a context; all detect/fill helpers then reuse
+    the pre-parsed functions instead of re-transporting their source on
+    every call.
+    """
+    await context.add_init_script(FORM_HELPERS_INIT_JS)
+
+
+async def _probe_first_visible(page: Page, selectors, marker: str):
+    """Tag the first visible element matching any selector in one browser call.
+
+    Returns the matching selector (for logging) or None; the tagged element
+    can then be targeted via ``[marker]``.
+    """
+    args = [list(selectors), marker]
+    try:
+        return await page.evaluate("window.__joblensProbe.firstVisible", args)
+    except Exception:
+        pass
+    try:
+        return await page.evaluate(_VISIBLE_PROBE_JS, args)
+    except Exception:
+        return None
+
 
 async def find_and_click_apply_button(page: Page) -> bool:
     """Find and click the apply button using comprehensive selectors."""
-    apply_selectors = [
-        # Standard apply buttons
-        "button:has-text('Apply')",
-        "a:has-text('Apply')",
-        "button:has-text('Apply Now')",
-        "a:has-text('Apply Now')",
-        "input[value*='Apply']",
-        # Data attributes
-        "[data-automation-id*='apply']",
-        "[data-testid*='apply']",
-        "[data-qa*='apply']",
-        # Class-based selectors
-        ".apply-button",
-        ".btn-apply",
-        ".apply-now",
-        "#apply-button",
-        # Submit application variants
-        "button:has-text('Submit Application')",
-        "a:has-text('Submit Application')",
-        # Language variants
-        "button:has-text('Postuler')",  # French
-        "button:has-text('Aplicar')",  # Spanish
-        "button:has-text('Bewerben')",  # German
-    ]
-
-    for selector in apply_selectors:
+    selector = await _probe_first_visible(page, APPLY_SELECTORS, "data-joblens-apply")
+    if selector:
         try:
-            if await page.is_visible(selector, timeout=5000):
-                await page.click(selector)
-                await page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(2)
-                console.print(f"[green]✅ Clicked apply button: {selector}[/green]")
-                return True
+            await page.click("[data-joblens-apply]")
+            await page.wait_for_load_state("domcontentloaded")
+            await asyncio.sleep(2)
+            console.print(f"[green]✅ Clicked apply button: {selector}[/green]")
+            return True
         except Exception:
-            continue
+            pass
 
     console.print("[yellow]⚠️ Could not find apply button[/yellow]")
     return False
 
 
 async def fill_form_fields(page: Page, profile: Dict) -> int:
-    """Fill form fields with profile data."""
+    """Fill form fields with profile data.
+
+    Probing every selector individually costs a websocket round-trip per
+    query/visibility/value check (30+ calls on a typical ATS page), so all
+    candidates are resolved in a single ``page.evaluate`` and only the
+    matched fields are filled afterwards.
+    """
     fields_filled = 0
 
     # Get profile data
@@ -67,43 +298,38 @@ async def fill_form_fields(page: Page, profile: Dict) -> int:
         "last_name",
         profile.get("name", "").split()[-1] if profile.get("name") else "",
     )
-    email = profile.get("email", "")
-    phone = profile.get("phone", "")
-    location = profile.get("location", "")
-
-    # Field mappings
-    field_mappings = {
-        # Name fields
-        "input[name*='firstName'], input[name*='first_name'], input[name*='fname']": first_name,
-        "input[name*='lastName'], input[name*='last_name'], input[name*='lname']": last_name,
-        "input[name*='fullName'], input[name*='full_name'], input[name*='name']:not([name*='first']):not([name*='last'])": profile.get(
-            "name", ""
-        ),
-        # Contact fields
-        "input[type='email'], input[name*='email']": email,
-        "input[type='tel'], input[name*='phone'], input[name*='telephone'], input[name*='mobile']": phone,
-        # Location fields
-        "input[name*='location'], input[name*='address'], input[name*='city']": location,
-        # Common text areas
-        "textarea[name*='cover'], textarea[name*='message'], textarea[name*='note']": generate_cover_letter_text(profile),
+    field_values = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "name": profile.get("name", ""),
+        "email": profile.get("email", ""),
+        "phone": profile.get("phone", ""),
+        "location": profile.get("location", ""),
+        "cover_letter": generate_cover_letter_text(profile),
     }
 
-    for selector, value in field_mappings.items():
-        if value:
-            try:
-                # Try to find and fill the field
-                elements = await page.query_selector_all(selector)
-                for element in elements:
-                    if await element.is_visible():
-                        # Check if field is empty
-                        current_value = await element.input_value() or ""
-                        if not current_value.strip():
-                            await element.fill(str(value))
-                            fields_filled += 1
-                            console.print(f"[green]✅ Filled field with {selector}[/green]")
-                            break
-            except Exception:
-                continue
+    probes = [
+        [selector, field_name]
+        for selector, field_name in FIELD_SELECTORS
+        if field_values[field_name]
+    ]
+
+    try:
+        matches = await page.evaluate("window.__joblensProbe.fields", probes)
+    except Exception:
+        try:
+            matches = await page.evaluate(_FIELD_PROBE_JS, probes)
+        except Exception:
+            return 0
+
+    for field_name, (selector, index) in matches.items():
+        try:
+            elements = await page.query_selector_all(selector)
+            await elements[index].fill(str(field_values[field_name]))
+            fields_filled += 1
+            console.print(f"[green]✅ Filled field with {selector}[/green]")
+        except Exception:
+            continue
 
     return fields_filled
 
@@ -113,27 +339,15 @@ async def upload_resume(page: Page, resume_path: str) -> bool:
     if not resume_path or not Path(resume_path).exists():
         return False
 
-    upload_selectors = [
-        "input[type='file'][name*='resume']",
-        "input[type='file'][name*='cv']",
-        "input[type='file'][id*='resume']",
-        "input[type='file'][id*='cv']",
-        "input[type='file'][accept*='pdf']",
-        "input[type='file'][accept*='doc']",
-        "input[type='file']",  # Generic file input as last resort
-    ]
-
-    for selector in upload_selectors:
+    selector = await _probe_first_visible(page, RESUME_UPLOAD_SELECTORS, "data-joblens-resume")
+    if selector:
         try:
-            elements = await page.query_selector_all(selector)
-            for element in elements:
-                if await element.is_visible():
-                    await element.set_input_files(resume_path)
-                    await asyncio.sleep(2)  # Wait for upload
-                    console.print(f"[green]✅ Uploaded resume via: {selector}[/green]")
-                    return True
+            await page.set_input_files("[data-joblens-resume]", resume_path)
+            await asyncio.sleep(2)  # Wait for upload
+            console.print(f"[green]✅ Uploaded resume via: {selector}[/green]")
+            return True
         except Exception:
-            continue
+            pass
 
     return False
 
@@ -143,101 +357,57 @@ async def upload_cover_letter(page: Page, cover_letter_path: str) -> bool:
     if not cover_letter_path or not Path(cover_letter_path).exists():
         return False
 
-    upload_selectors = [
-        "input[type='file'][name*='cover']",
-        "input[type='file'][name*='letter']",
-        "input[type='file'][id*='cover']",
-        "input[type='file'][id*='letter']",
-        "input[type='file']:nth-of-type(2)",  # Second file input
-    ]
-
-    for selector in upload_selectors:
+    selector = await _probe_first_visible(
+        page, COVER_LETTER_UPLOAD_SELECTORS, "data-joblens-cover-letter"
+    )
+    if selector:
         try:
-            elements = await page.query_selector_all(selector)
-            for element in elements:
-                if await element.is_visible():
-                    await element.set_input_files(cover_letter_path)
-                    await asyncio.sleep(2)
-                    console.print(f"[green]✅ Uploaded cover letter via: {selector}[/green]")
-                    return True
+            await page.set_input_files("[data-joblens-cover-letter]", cover_letter_path)
+            await asyncio.sleep(2)
+            console.print(f"[green]✅ Uploaded cover letter via: {selector}[/green]")
+            return True
         except Exception:
-            continue
+            pass
 
     return False
 
 
 async def click_next_or_continue(page: Page) -> bool:
     """Click next/continue button to proceed to next step."""
-    next_selectors = [
-        "button:has-text('Next')",
-        "button:has-text('Continue')",
-        "button:has-text('Save & Continue')",
-        "button:has-text('Proceed')",
-        "input[type='submit'][value*='Next']",
-        "input[type='submit'][value*='Continue']",
-        ".next-button",
-        "#next-button",
-        "[data-testid*='next']",
-        "[data-testid*='continue']",
-    ]
-
-    for selector in next_selectors:
+    if await _probe_first_visible(page, NEXT_SELECTORS, "data-joblens-next"):
         try:
-            if await page.is_visible(selector, timeout=2000):
-                await page.click(selector)
-                await page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(2)
-                return True
+            await page.click("[data-joblens-next]")
+            await page.wait_for_load_state("domcontentloaded")
+            await asyncio.sleep(2)
+            return True
         except Exception:
-            continue
+            pass
 
     return False
 
 
 async def click_submit_button(page: Page) -> bool:
     """Click final submit button."""
-    submit_selectors = [
-        "button:has-text('Submit')",
-        "button:has-text('Submit Application')",
-        "button:has-text('Send Application')",
-        "button:has-text('Apply')",
-        "input[type='submit'][value*='Submit']",
-        "input[type='submit'][value*='Apply']",
-        ".submit-button",
-        "#submit-button",
-        "[data-testid*='submit']",
-    ]
-
-    for selector in submit_selectors:
+    if await _probe_first_visible(page, SUBMIT_SELECTORS, "data-joblens-submit"):
         try:
-            if await page.is_visible(selector, timeout=2000):
-                await page.click(selector)
-                await page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(3)
+            await page.click("[data-joblens-submit]")
+            await page.wait_for_load_state("domcontentloaded")
+            await asyncio.sleep(3)
 
-                # Check for confirmation
-                if await check_for_confirmation(page):
-                    return True
+            # Check for confirmation
+            if await check_for_confirmation(page):
+                return True
 
-                return True  # Assume success if no error
+            return True  # Assume success if no error
         except Exception:
-            continue
+            pass
 
     return False
 
 
 async def check_for_captcha(page: Page) -> bool:
     """Check if CAPTCHA is present."""
-    captcha_selectors = [
-        "iframe[src*='recaptcha']",
-        "iframe[src*='captcha']",
-        ".g-recaptcha",
-        "[class*='captcha']",
-        "text='CAPTCHA'",
-        "text='I am not a robot'",
-    ]
-
-    for selector in captcha_selectors:
+    for selector in CAPTCHA_SELECTORS:
         try:
             if await page.is_visible(selector, timeout=1000):
                 console.print("[yellow]⚠️ CAPTCHA detected![/yellow]")
@@ -250,15 +420,7 @@ async def check_for_captcha(page: Page) -> bool:
 
 async def check_for_login_required(page: Page) -> bool:
     """Check if login is required."""
-    login_selectors = [
-        "input[type='password']",
-        "text='Sign In'",
-        "text='Log In'",
-        "text='Login'",
-        "text='Create Account'",
-    ]
-
-    for selector in login_selectors:
+    for selector in LOGIN_SELECTORS:
         try:
             if await page.is_visible(selector, timeout=1000):
                 console.print("[yellow]⚠️ Login required![/yellow]")
@@ -271,16 +433,7 @@ async def check_for_login_required(page: Page) -> bool:
 
 async def check_for_confirmation(page: Page) -> bool:
     """Check for application confirmation."""
-    confirmation_selectors = [
-        "text='Thank you'",
-        "text='Application submitted'",
-        "text='Successfully submitted'",
-        "text='Application received'",
-        ".confirmation",
-        ".success-message",
-    ]
-
-    for selector in confirmation_selectors:
+    for selector in CONFIRMATION_SELECTORS:
         try:
             if await page.is_visible(selector, timeout=5000):
                 console.print("[green]✅ Confirmation detected![/green]")
@@ -292,8 +445,18 @@ async def check_for_confirmation(page: Page) -> bool:
 
 
 def generate_cover_letter_text(profile: Dict) -> str:
-    """Generate a simple cover letter text."""
-    name = profile.get("name", "")
+    """Generate a simple cover letter text.
+
+    The letter only depends on the profile name, so generation is cached —
+    fill_form_fields asks for it on every form step of every job, and a
+    batch run should pay for the string build once per profile.
+    """
+    return _cover_letter_for(profile.get("name", ""))
+
+
+@lru_cache(maxsize=8)
+def _cover_letter_for(name: str) -> str:
+    """Build the cover letter body for one applicant name."""
     return f"""Dear Hiring Manager,
 
 I am writing to express my interest in this position. I believe my skills and experience make me a strong candidate for this role.
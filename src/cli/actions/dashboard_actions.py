@@ -47,6 +47,10 @@ class DashboardActions:
             pass
         return success
 
+    async def auto_start_dashboard_action_async(self) -> bool:
+        """Handle auto start dashboard action without blocking the event loop."""
+        return await self.dashboard_handler.auto_start_dashboard_async()
+
     def debug_dashboard_action(self) -> None:
         """Handle debug dashboard action."""
         console.print("[cyan]🔍 Debugging Modern Dashboard...[/cyan]")
@@ -221,9 +221,14 @@ class ScrapingActions:
                 console.print("[yellow]⚠️ No jobs in queue to process[/yellow]")
                 return
 
+            # The session stores done URLs as a list for JSON; membership
+            # checks go through a parallel set so filtering stays O(1)
+            # per job instead of scanning the list each time
+            done_set = set(done_jobs)
+
             # Filter out already processed jobs
             pending_jobs = [
-                job for job in scraped_jobs if job.get("url") and job.get("url") not in done_jobs
+                job for job in scraped_jobs if job.get("url") and job.get("url") not in done_set
             ]
 
             if not pending_jobs:
@@ -232,48 +237,63 @@ class ScrapingActions:
 
             console.print(f"[green]Found {len(pending_jobs)} jobs to process from queue[/green]")
 
-            # Process each job URL
+            # Process each job URL. The session file is rewritten every few
+            # jobs rather than after each one — a full JSON dump per job put
+            # a disk write on the hot path for nothing, since the finally
+            # block below persists whatever is still pending.
             processed_count = 0
-            for i, job in enumerate(pending_jobs, 1):
-                job_url = job.get("url")
-                if not job_url:
-                    continue
-
-                console.print(
-                    f"\n[bold]Processing {i}/{len(pending_jobs)}:[/bold] {job.get('title', 'Unknown')}"
-                )
-                console.print(f"[cyan]URL:[/cyan] {job_url}")
-
-                try:
-                    # Scrape detailed information from the job URL
-                    detailed_job = self._scrape_job_details(job_url)
-
-                    if detailed_job:
-                        # Update the job with detailed information
-                        job.update(detailed_job)
-                        processed_count += 1
-                        console.print("[green]✅ Job details scraped successfully[/green]")
-
-                        # Mark as processed
-                        done_jobs.append(job_url)
-                        self.scraping_handler.session["done"] = done_jobs
-                        self.scraping_handler._save_session(
-                            self.scraping_handler.profile.get("profile_name", "default"),
-                            self.scraping_handler.session,
-                        )
-                    else:
-                        console.print("[yellow]⚠️ Failed to scrape job details[/yellow]")
-
-                    # Add delay between requests
-                    if i < len(pending_jobs):
-                        console.print("[cyan]Waiting 2 seconds before next job...[/cyan]")
-                        import time
-
-                        time.sleep(2)
-
-                except Exception as e:
-                    console.print(f"[red]❌ Error processing job: {e}[/red]")
-                    continue
+            unsaved_count = 0
+            profile_name = self.scraping_handler.profile.get("profile_name", "default")
+
+            try:
+                for i, job in enumerate(pending_jobs, 1):
+                    job_url = job.get("url")
+                    if not job_url:
+                        continue
+
+                    console.print(
+                        f"\n[bold]Processing {i}/{len(pending_jobs)}:[/bold] {job.get('title', 'Unknown')}"
+                    )
+                    console.print(f"[cyan]URL:[/cyan] {job_url}")
+
+                    try:
+                        # Scrape detailed information from the job URL
+                        detailed_job = self._scrape_job_details(job_url)
+
+                        if detailed_job:
+                            # Update the job with detailed information
+                            job.update(detailed_job)
+                            processed_count += 1
+                            console.print("[green]✅ Job details scraped successfully[/green]")
+
+                            # Mark as processed
+                            done_jobs.append(job_url)
+                            done_set.add(job_url)
+                            self.scraping_handler.session["done"] = done_jobs
+                            unsaved_count += 1
+                            if unsaved_count >= 10:
+                                self.scraping_handler._save_session(
+                                    profile_name, self.scraping_handler.session
+                                )
+                                unsaved_count = 0
+                        else:
+                            console.print("[yellow]⚠️ Failed to scrape job details[/yellow]")
+
+                        # Add delay between requests
+                        if i < len(pending_jobs):
+                            console.print("[cyan]Waiting 2 seconds before next job...[/cyan]")
+                            import time
+
+                            time.sleep(2)
+
+                    except Exception as e:
+                        console.print(f"[red]❌ Error processing job: {e}[/red]")
+                        continue
+            finally:
+                if unsaved_count:
+                    self.scraping_handler._save_session(
+                        profile_name, self.scraping_handler.session
+                    )
 
             console.print(
                 f"\n[bold green]✅ Queue processing completed! {processed_count}/{len(pending_jobs)} jobs processed[/bold green]"
@@ -4,12 +4,18 @@ CLI Argument Parser for AutoJobAgent
 """
 
 import argparse
+from functools import lru_cache
 from typing import Dict, Any
 from src.cli.handlers.system_handler import summarize_docs_command
 
 
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
+    """Create and configure the argument parser.
+
+    The definition is static, so the ~15 add_argument calls run once
+    per process; repeated parse_args callers reuse the built parser.
+    """
     parser = argparse.ArgumentParser(
         description="AutoJobAgent - Automated job application tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
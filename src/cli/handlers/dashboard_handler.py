@@ -189,6 +189,59 @@ class DashboardHandler:
             console.print(f"[red]❌ Error starting Clean Dashboard: {e}[/red]")
             return False
 
+    async def auto_start_dashboard_async(self) -> bool:
+        """Start the dashboard without blocking the event loop.
+
+        Spawns the process with asyncio.create_subprocess_exec and overlaps
+        boot with a readiness poll, instead of Popen plus a fixed 3s sleep.
+        """
+        import asyncio
+
+        console.print("[cyan]🚀 Starting Dashboard...[/cyan]")
+
+        try:
+            # Check if already running (requests call stays off the loop)
+            if await asyncio.to_thread(self._is_dashboard_running):
+                console.print("[yellow]⚠️ Dashboard already running![/yellow]")
+                console.print(f"[cyan]🌐 Dashboard URL: http://localhost:{self.port}[/cyan]")
+                webbrowser.open(f"http://localhost:{self.port}")
+                return True
+
+            dash_app_path = Path("src/dashboard/dash_app/app.py")
+            if not dash_app_path.exists():
+                console.print("[red]❌ No dashboard found at:[/red]")
+                console.print(f"  - {dash_app_path}")
+                return False
+
+            self.port = 8050  # Update port for Dash
+            console.print("[cyan]🚀 Starting Dash Dashboard on port 8050...[/cyan]")
+            await asyncio.create_subprocess_exec(
+                sys.executable,
+                str(dash_app_path),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=os.getcwd(),
+            )
+
+            # Poll readiness instead of sleeping a fixed interval
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 10.0
+            while loop.time() < deadline:
+                if await asyncio.to_thread(self._is_dashboard_running):
+                    console.print("[green]✅ Clean Dashboard started successfully![/green]")
+                    console.print(f"[cyan]🌐 Dashboard URL: http://localhost:{self.port}[/cyan]")
+                    console.print("[yellow]💡 Use 'shutdown' action to stop the dashboard.[/yellow]")
+                    webbrowser.open(f"http://localhost:{self.port}")
+                    return True
+                await asyncio.sleep(0.25)
+
+            console.print("[red]❌ Clean Dashboard failed to start.[/red]")
+            return False
+
+        except Exception as e:
+            console.print(f"[red]❌ Error starting Clean Dashboard: {e}[/red]")
+            return False
+
     def stop_dashboard(self) -> bool:
         """Stop the running Clean Dashboard process."""
         try:
@@ -22,6 +22,11 @@ from rich.table import Table
 from src.core.session import SessionManager
 from src.utils.job_analysis_engine import run_Automated_scraping
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 logger = logging.getLogger(__name__)
 
@@ -100,8 +105,16 @@ class ScrapingHandler:
             session_file = Path(f"profiles/{profile_name}/session.json")
             session_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(session_file, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            # orjson serializes straight to UTF-8 bytes several times
+            # faster than stdlib json; the session grows with every
+            # scraped job, so the encode is on the hot path
+            if orjson is not None:
+                session_file.write_bytes(
+                    orjson.dumps(session_data, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(session_file, "w", encoding="utf-8") as f:
+                    json.dump(session_data, f, indent=2, ensure_ascii=False)
 
             logger.info(f"✅ Saved session for profile: {profile_name}")
             return True
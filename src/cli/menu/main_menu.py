@@ -487,3 +487,19 @@ class MainMenu:
                 break
 
         return 0
+
+    async def run_interactive_mode_async(self, args) -> int:
+        """Run the interactive menu without blocking the event loop.
+
+        Prompts and action handlers execute in a worker thread, so background
+        tasks on the shared loop (dashboard health polling, queue refresh)
+        keep running while the menu waits for input.
+        """
+        import asyncio
+
+        while True:
+            choice = await asyncio.to_thread(self.show_interactive_menu)
+            if not await asyncio.to_thread(self.handle_menu_choice, choice, args):
+                break
+
+        return 0
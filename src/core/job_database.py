@@ -45,6 +45,18 @@ class ModernJobDatabase:
         for _ in range(5):
             conn = sqlite3.connect(self.db_path, check_same_thread=False)
             conn.row_factory = sqlite3.Row
+            try:
+                # WAL lets readers run during writes and, with synchronous=NORMAL,
+                # drops the per-commit fsync (pairs with the write batcher's
+                # group commits). Both settings are durable across connections.
+                conn.executescript(
+                    "PRAGMA journal_mode=WAL;"
+                    "PRAGMA synchronous=NORMAL;"
+                    "PRAGMA temp_store=MEMORY;"
+                    "PRAGMA mmap_size=268435456;"
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not apply connection pragmas: {e}")
             self._connection_pool.put(conn)
 
     @contextmanager
@@ -793,6 +805,55 @@ class ModernJobDatabase:
             logger.error(f"Error updating job status: {e}")
             return False
 
+    def update_job_statuses_batch(self, updates: List[tuple]) -> int:
+        """Update many job statuses in one transaction.
+
+        Args:
+            updates: (job_id, new_status) pairs.
+
+        Returns:
+            Number of updates applied (0 on error).
+        """
+        if not updates:
+            return 0
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    "UPDATE jobs SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    [(new_status, job_id) for job_id, new_status in updates],
+                )
+                conn.commit()
+                return len(updates)
+        except Exception as e:
+            logger.error(f"Error batch-updating job statuses: {e}")
+            return 0
+
+    def update_application_statuses_batch(self, updates: List[tuple]) -> int:
+        """Update many application statuses in one transaction.
+
+        Args:
+            updates: (job_id, status, notes) tuples; notes may be None to
+                keep the existing processing notes.
+
+        Returns:
+            Number of updates applied (0 on error).
+        """
+        if not updates:
+            return 0
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    "UPDATE jobs SET application_status = ?, "
+                    "processing_notes = COALESCE(?, processing_notes), "
+                    "updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    [(status, notes, job_id) for job_id, status, notes in updates],
+                )
+                conn.commit()
+                return len(updates)
+        except Exception as e:
+            logger.error(f"Error batch-updating application statuses: {e}")
+            return 0
+
     def update_job_url(self, job_id: int, new_url: str) -> bool:
         """Update job URL by ID."""
         try:
@@ -0,0 +1,79 @@
+"""
+Asynchronous write batcher for group-committing database updates.
+
+Accumulates submitted rows and flushes them in batches (size- or
+time-triggered), so callers pay one transaction/fsync per batch instead
+of one per row.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, List, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class WriteBatcher:
+    """Queue writes and flush them in groups via a background task.
+
+    The flush callable receives a list of submitted items and runs in a
+    worker thread, so synchronous database code (sqlite executemany) never
+    blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[Any]], Any],
+        max_batch_size: int = 50,
+        flush_interval: float = 0.2,
+    ):
+        self._flush_fn = flush_fn
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> None:
+        """Queue one item for the next batched flush."""
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self._drain())
+        await self._queue.put(item)
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await asyncio.to_thread(self._flush_fn, batch)
+            except Exception as e:
+                logger.error(f"Error flushing write batch of {len(batch)}: {e}")
+            finally:
+                # Always mark items done so flush()/join() cannot hang
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every item submitted so far has been written."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush remaining items and stop the background drain task."""
+        await self.flush()
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
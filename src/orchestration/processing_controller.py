@@ -12,25 +12,21 @@ console = Console()
 
 
 async def _process_in_batches(jobs: List[Dict[str, Any]], cpu_workers: int, max_concurrent_stage2: int, batch_size: int) -> List[TwoStageResult]:
-    """Process jobs in bounded batches using the Two-Stage Processor."""
-    from math import ceil
-
+    """Process all jobs in one streaming pass through the Two-Stage Processor.
+
+    The processor pulls jobs through a semaphore-bounded TaskGroup, so free
+    workers refuel from the shared pool immediately. Slicing into fixed
+    batches here would reintroduce the straggler problem: one slow job
+    stalling an entire slice while workers idle. batch_size is kept for
+    config compatibility but no longer gates concurrency — the
+    max_concurrent_stage2 semaphore does.
+    """
     processor = get_two_stage_processor({"profile_name": "auto"}, cpu_workers=cpu_workers, max_concurrent_stage2=max_concurrent_stage2)
 
-    total = len(jobs)
-    if total == 0:
+    if not jobs:
         return []
 
-    all_results: List[TwoStageResult] = []
-    batches = ceil(total / batch_size)
-
-    for i in range(0, total, batch_size):
-        batch = jobs[i : i + batch_size]
-        results = await processor.process_jobs(batch)
-        all_results.extend(results)
-        del results
-
-    return all_results
+    return await processor.process_jobs(jobs)
 
 
 def run_processing_batches(jobs: List[Dict[str, Any]], cfg: OrchestratorConfig) -> List[TwoStageResult]:
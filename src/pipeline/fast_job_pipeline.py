@@ -46,6 +46,7 @@ class FastJobPipeline:
             "save_to_database": True,
             "enable_duplicate_check": True,
             "timeout_seconds": 1800,  # 30 minutes total timeout
+            "max_concurrent": 6,  # Bound on concurrent page navigations
         }
         self.config = {**default_config, **(config or {})}
         
@@ -120,6 +121,11 @@ class FastJobPipeline:
                 "pages": self.config["eluta_pages"],
                 "jobs": limit or self.config["eluta_jobs"],
                 "headless": False,  # Disabled to handle popups
+                "max_concurrent": self.config.get("max_concurrent", 6),
+                # Pre-warmed browser endpoint from the pool daemon, when one
+                # was acquired by the caller; the scraper connects over CDP
+                # instead of cold-starting Chromium
+                "cdp_endpoint": self.config.get("cdp_endpoint"),
             }
             
             self.eluta_scraper = ElutaScraper(self.profile_name, eluta_config)
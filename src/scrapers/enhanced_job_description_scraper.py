@@ -16,6 +16,10 @@ from rich.panel import Panel
 
 console = Console()
 
+# ATS vendors detectable from the job URL, compiled once: one scan replaces
+# five sequential substring checks (each of which re-lowered the URL)
+_ATS_URL_RE = re.compile(r"(workday|lever|greenhouse|bamboohr|icims)", re.IGNORECASE)
+
 
 class ImprovedJobDescriptionScraper:
     """Improved scraper for detailed job descriptions and experience requirements."""
@@ -573,29 +577,23 @@ class ImprovedJobDescriptionScraper:
 
         try:
             # Detect ATS system from URL or page content
-            url = page.url
-            if "workday" in url.lower():
-                metadata["ats_system"] = "workday"
-            elif "lever" in url.lower():
-                metadata["ats_system"] = "lever"
-            elif "greenhouse" in url.lower():
-                metadata["ats_system"] = "greenhouse"
-            elif "bamboohr" in url.lower():
-                metadata["ats_system"] = "bamboohr"
-            elif "icims" in url.lower():
-                metadata["ats_system"] = "icims"
+            match = _ATS_URL_RE.search(page.url)
+            if match:
+                metadata["ats_system"] = match.group(1).lower()
+
+            # Lowercase the page once for both keyword scans below
+            page_content = (await page.content()).lower()
 
             # Check for remote work indicators
-            page_content = await page.content()
             if any(
-                term in page_content.lower()
+                term in page_content
                 for term in ["remote", "work from home", "wfh", "telecommute"]
             ):
                 metadata["remote_work"] = True
 
             # Check for relocation assistance
             if any(
-                term in page_content.lower()
+                term in page_content
                 for term in ["relocation", "relocate", "moving assistance"]
             ):
                 metadata["relocation"] = True
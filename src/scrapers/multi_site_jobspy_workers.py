@@ -389,7 +389,8 @@ class MultiSiteJobSpyWorkers:
                 return None
             try:
                 async with semaphore:
-                    async with session.get(url, timeout=timeout_seconds, headers=headers, allow_redirects=True) as resp:
+                    per_request_timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+                    async with session.get(url, timeout=per_request_timeout, headers=headers, allow_redirects=True) as resp:
                         if resp.status != 200:
                             return None
                         html = await resp.text(errors='ignore')
@@ -404,10 +405,13 @@ class MultiSiteJobSpyWorkers:
             except Exception:
                 return None
         
-        connector = aiohttp.TCPConnector(limit=max(32, max_concurrency))
-        async with aiohttp.ClientSession(connector=connector) as session:
-            tasks = [asyncio.create_task(fetch_and_parse(session, str(row.get('job_url', '')))) for _, row in to_fetch.iterrows()]
-            fetched_texts = await asyncio.gather(*tasks, return_exceptions=True)
+        # Reuse the process-wide session so keepalive sockets and DNS cache
+        # survive across fetch rounds instead of rebuilding a pool each call
+        from ..utils.http_session import get_shared_session
+
+        session = await get_shared_session()
+        tasks = [asyncio.create_task(fetch_and_parse(session, str(row.get('job_url', '')))) for _, row in to_fetch.iterrows()]
+        fetched_texts = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Apply fetched descriptions
         filled = 0
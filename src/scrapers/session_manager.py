@@ -5,16 +5,30 @@ This module provides session management functionality for maintaining
 browser sessions, cookies, and state across scraping operations.
 """
 
+import atexit
 import json
 import logging
+
+try:
+    import orjson  # C-backed JSON serializer, much faster than stdlib json
+except ImportError:
+    orjson = None
+import threading
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Single background worker for session writes: the JSON dump and file write
+# are I/O-bound, so pushing them here hides disk latency from the scraping
+# loop. One worker keeps writes for a given file in submission order.
+_SAVE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-save")
+atexit.register(_SAVE_POOL.shutdown, wait=True)
+
 
 class SessionManager:
     """Manages browser sessions and state for scraping operations."""
@@ -28,6 +42,8 @@ class SessionManager:
         self.session_dir.mkdir(parents=True, exist_ok=True)
         self.current_session = {}
         self.session_history = []
+        # Serializes background writes to this manager's session files
+        self._save_lock = threading.Lock()
 
     def create_session(self, session_name: str = None) -> str:
         """
@@ -86,8 +102,11 @@ class SessionManager:
 
     def save_session_data(self, session_data):
         try:
-            with open(self.session_file, "w") as f:
-                json.dump(session_data, f)
+            if orjson is not None:
+                Path(self.session_file).write_bytes(orjson.dumps(session_data))
+            else:
+                with open(self.session_file, "w") as f:
+                    json.dump(session_data, f)
             return True
         except Exception:
             return False
@@ -120,14 +139,24 @@ class SessionManager:
             logger.info(f"✅ Ended session: {self.current_session['session_id']}")
 
     def _save_session(self) -> None:
-        """Save current session to file."""
-        try:
-            if self.current_session:
-                session_id = self.current_session["session_id"]
-                session_file = self.session_dir / f"{session_id}.json"
+        """Queue a save of the current session on the background worker.
 
-                with open(session_file, "w") as f:
-                    json.dump(self.current_session, f, indent=2)
+        A snapshot is submitted so later mutations of current_session don't
+        race the write; the pool's atexit shutdown waits for pending saves.
+        """
+        if self.current_session:
+            _SAVE_POOL.submit(self._save_session_sync, dict(self.current_session))
+
+    def _save_session_sync(self, session: Dict) -> None:
+        """Write one session snapshot to its file (runs on the save worker)."""
+        try:
+            session_file = self.session_dir / f"{session['session_id']}.json"
+            with self._save_lock:
+                if orjson is not None:
+                    session_file.write_bytes(orjson.dumps(session, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(session_file, "w") as f:
+                        json.dump(session, f, indent=2)
 
         except Exception as e:
             logger.error(f"❌ Error saving session: {e}")
@@ -70,6 +70,16 @@ class ElutaScraper:
         self.delay_between_requests = config.get("delay", 1.0) if config else 1.0
         self.headless = config.get("headless", False) if config else False
         self.max_tabs_threshold = config.get("max_tabs", 5) if config else 5
+
+        # Concurrency guard: bound in-flight page navigations so many-keyword
+        # scrapes cannot thrash the network stack or pile up Playwright pages
+        self.max_concurrent = config.get("max_concurrent", 4) if config else 4
+        self.semaphore = (config.get("semaphore") if config else None) or asyncio.BoundedSemaphore(
+            self.max_concurrent
+        )
+
+        # Optional pre-warmed browser endpoint from the pool daemon
+        self.cdp_endpoint = config.get("cdp_endpoint") if config else None
         
         # Results tracking
         self.processed_urls = set()
@@ -114,8 +124,13 @@ class ElutaScraper:
         all_jobs = []
         
         async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            
+            if self.cdp_endpoint:
+                # Attach to a pre-warmed pooled browser; close() below only
+                # disconnects, leaving the browser warm for the next run
+                browser = await p.chromium.connect_over_cdp(self.cdp_endpoint)
+            else:
+                browser = await p.chromium.launch(headless=self.headless)
+
             try:
                 with Progress() as progress:
                     main_task = progress.add_task(
@@ -273,16 +288,17 @@ class ElutaScraper:
         search_url = f"{self.base_url}?q={keyword.replace(' ', '+')}+sort%3Arank&page={page_num}"
         
         try:
-            # Navigate to page with retries
-            for attempt in range(3):
-                try:
-                    await page.goto(search_url, wait_until="networkidle", timeout=30000)
-                    break
-                except Exception as nav_error:
-                    if attempt == 2:
-                        raise nav_error
-                    logger.warning(f"Navigation attempt {attempt + 1} failed: {nav_error}")
-                    await asyncio.sleep(2)
+            # Navigate to page with retries (bounded by the shared semaphore)
+            async with self.semaphore:
+                for attempt in range(3):
+                    try:
+                        await page.goto(search_url, wait_until="networkidle", timeout=30000)
+                        break
+                    except Exception as nav_error:
+                        if attempt == 2:
+                            raise nav_error
+                        logger.warning(f"Navigation attempt {attempt + 1} failed: {nav_error}")
+                        await asyncio.sleep(2)
             
             # Handle popups and remove target="_blank"
             await self._handle_page_interactions(page)
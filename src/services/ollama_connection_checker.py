@@ -50,11 +50,13 @@ class OllamaConnectionChecker:
             'total_checks': 0,
             'successful_checks': 0,
             'failed_checks': 0,
-            'average_response_time': 0.0,
             'last_successful_check': None,
             'consecutive_failures': 0
         }
-    
+        # Raw sum of successful response times; the average is derived in
+        # get_statistics() so the hot path is one add with no drift
+        self._response_time_sum = 0.0
+
     def is_available(self, force_check: bool = False) -> bool:
         """
         Check if Ollama is available with caching.
@@ -113,12 +115,8 @@ class OllamaConnectionChecker:
                 self.stats['last_successful_check'] = datetime.now().isoformat()
                 self.stats['consecutive_failures'] = 0
                 
-                # Update average response time
-                total_successful = self.stats['successful_checks']
-                current_avg = self.stats['average_response_time']
-                self.stats['average_response_time'] = (
-                    (current_avg * (total_successful - 1) + response_time) / total_successful
-                )
+                # Accumulate response time; the mean is derived on demand
+                self._response_time_sum += response_time
                 
                 logger.debug(f"Ollama health check successful: {response_time:.1f}ms, {len(models)} models available")
                 return True
@@ -167,6 +165,9 @@ class OllamaConnectionChecker:
         """Get connection statistics."""
         return {
             **self.stats,
+            'average_response_time': (
+                self._response_time_sum / max(self.stats['successful_checks'], 1)
+            ),
             'success_rate': (
                 self.stats['successful_checks'] / max(self.stats['total_checks'], 1) * 100
             ),
@@ -189,10 +190,10 @@ class OllamaConnectionChecker:
             'total_checks': 0,
             'successful_checks': 0,
             'failed_checks': 0,
-            'average_response_time': 0.0,
             'last_successful_check': None,
             'consecutive_failures': 0
         }
+        self._response_time_sum = 0.0
         logger.info("Ollama connection statistics reset")
     
     def get_diagnostic_info(self) -> Dict[str, Any]:
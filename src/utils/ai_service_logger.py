@@ -71,7 +71,11 @@ class AIServiceLogger:
             'errors': 0,
             'average_response_time': 0.0
         }
-        
+
+        # Running duration accumulators so the average is O(1) per event
+        self._duration_sum = 0.0
+        self._duration_count = 0
+
         logger.info("AI Service Logger initialized")
     
     def log_connection_check(self, service_name: str, success: bool, 
@@ -221,17 +225,20 @@ class AIServiceLogger:
         # Add to memory (with size limit)
         self.events.append(event)
         if len(self.events) > self.max_events:
-            self.events.pop(0)
-        
+            evicted = self.events.pop(0)
+            if evicted.duration_ms:
+                self._duration_sum -= evicted.duration_ms
+                self._duration_count -= 1
+
         # Update metrics
         self.metrics['total_events'] += 1
-        
-        # Update average response time
+
+        # Update average response time from the running sums instead of
+        # rescanning every buffered event
         if event.duration_ms:
-            total_with_duration = sum(1 for e in self.events if e.duration_ms)
-            if total_with_duration > 0:
-                avg_duration = sum(e.duration_ms for e in self.events if e.duration_ms) / total_with_duration
-                self.metrics['average_response_time'] = avg_duration
+            self._duration_sum += event.duration_ms
+            self._duration_count += 1
+            self.metrics['average_response_time'] = self._duration_sum / self._duration_count
         
         # Write to file
         try:
@@ -400,6 +407,8 @@ class AIServiceLogger:
             'errors': 0,
             'average_response_time': 0.0
         }
+        self._duration_sum = 0.0
+        self._duration_count = 0
         logger.info("AI service metrics reset")
 
 
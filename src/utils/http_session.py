@@ -0,0 +1,48 @@
+"""
+Shared aiohttp session management for AutoJobAgent.
+One process-wide session means one connection pool: keepalive sockets,
+the DNS cache, and TLS handshakes are reused across every fetch instead
+of being rebuilt per action.
+"""
+
+from typing import Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+_session = None
+
+
+async def get_shared_session():
+    """Return the process-wide aiohttp session, creating it on first use.
+
+    Must be called from the event loop the session should live on (the CLI
+    uses one persistent loop, so this is the natural fit).
+
+    Raises:
+        RuntimeError: If aiohttp is not installed.
+    """
+    global _session
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is not installed")
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _session
+
+
+async def close_shared_session() -> None:
+    """Close the shared session if one was created."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
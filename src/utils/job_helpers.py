@@ -1,5 +1,6 @@
 import re
 import hashlib
+from collections import Counter
 from typing import List, Dict
 from urllib.parse import urlparse
 # Removed self-import: from src.utils.job_helpers import generate_job_hash
@@ -57,8 +58,8 @@ def get_job_stats(jobs: List[Dict]) -> Dict:
         }
 
     companies = set()
-    locations = {}
-    job_types = {}
+    locations = Counter()
+    job_types = Counter()
     total_salary = 0
     salary_count = 0
 
@@ -68,19 +69,18 @@ def get_job_stats(jobs: List[Dict]) -> Dict:
             companies.add(job["company"])
 
         # Count locations
-        location = job.get("location", "Unknown")
-        locations[location] = locations.get(location, 0) + 1
+        locations[job.get("location", "Unknown")] += 1
 
         # Count job types (based on title keywords)
         title = job.get("title", "").lower()
         if any(keyword in title for keyword in ["analyst", "analysis"]):
-            job_types["Analyst"] = job_types.get("Analyst", 0) + 1
+            job_types["Analyst"] += 1
         elif any(keyword in title for keyword in ["developer", "engineer", "programmer"]):
-            job_types["Developer"] = job_types.get("Developer", 0) + 1
+            job_types["Developer"] += 1
         elif any(keyword in title for keyword in ["manager", "lead", "supervisor"]):
-            job_types["Manager"] = job_types.get("Manager", 0) + 1
+            job_types["Manager"] += 1
         else:
-            job_types["Other"] = job_types.get("Other", 0) + 1
+            job_types["Other"] += 1
 
         # Calculate average salary (if available)
         salary = job.get("salary")
@@ -98,7 +98,7 @@ def get_job_stats(jobs: List[Dict]) -> Dict:
     return {
         "total_jobs": len(jobs),
         "unique_companies": len(companies),
-        "locations": locations,
-        "job_types": job_types,
+        "locations": dict(locations),
+        "job_types": dict(job_types),
         "avg_salary": total_salary / salary_count if salary_count > 0 else 0,
     }
@@ -1,12 +1,53 @@
 import logging
 import sys
 
-def get_logger(name):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Emit one orjson-encoded JSON object per record.
+
+    Machine-parseable and much cheaper to produce than styled console
+    output, so it is the default for non-interactive (piped/CI) runs.
+    Falls back to the standard formatter when orjson is unavailable.
+    """
+
+    def format(self, record):
+        if orjson is None:
+            return super().format(record)
+        payload = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+
+def get_logger(name, json_output=None):
+    """Return a configured logger.
+
+    Args:
+        name: Logger name.
+        json_output: Force JSON-line output on/off; defaults to JSON when
+            stdout is not a TTY (logs being captured) and human-readable
+            text otherwise.
+    """
     logger = logging.getLogger(name)
     if not logger.handlers:
         logger.setLevel(logging.INFO)
         handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        if json_output is None:
+            json_output = not sys.stdout.isatty()
+        if json_output:
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
         logger.addHandler(handler)
     return logger
@@ -5,15 +5,58 @@ Provides a comprehensive system for tracking and resolving manual review items.
 """
 
 import json
+import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
 
 from src.core.job_database import get_job_db
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _console():
+    """Build the Rich console on first use.
+
+    Rich (and the Pygments machinery it drags in) dominates import time
+    for this module; headless callers that only resolve or query items
+    never pay for it.
+    """
+    from rich.console import Console
+
+    return Console()
+
+# Priority labels for queue rendering; built once instead of per row
+_PRIORITY_MAP = {1: "Low", 2: "Med", 3: "High", 4: "URGENT"}
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to the limit with an ellipsis, for table cells."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# Hot UPDATE statements as shared literals: passing the identical string
+# every call lets SQLite's per-connection statement cache skip re-parsing
+# and re-planning the query
+_SQL_RESOLVE = """
+    UPDATE manual_review_queue
+    SET status = 'resolved',
+        resolution = ?,
+        reviewer = ?,
+        reviewed_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+_SQL_SKIP = """
+    UPDATE manual_review_queue
+    SET status = 'skipped',
+        resolution = ?,
+        reviewer = ?,
+        reviewed_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+# Bound once for the bulk-fetch loop
+_loads = json.loads
 
 
 class ManualReviewManager:
@@ -30,6 +73,39 @@ class ManualReviewManager:
         """
         self.profile_name = profile_name
         self.db = get_job_db(profile_name)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        Return the shared SQLite connection, opening it on first use.
+
+        Reconnecting per method call re-paid connection setup and threw
+        away SQLite's page cache between queue operations; one lazy
+        connection keeps the cache hot across an interactive session.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-8000")  # 8 MB page cache
+            try:
+                # Makes status-filtered, priority-ordered queue queries an
+                # index range scan instead of a full table scan
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_mrq_status_priority "
+                    "ON manual_review_queue(status, priority DESC)"
+                )
+            except sqlite3.OperationalError:
+                pass  # queue table not created yet
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the shared database connection if it was opened."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def add_review_item(
         self,
@@ -61,20 +137,27 @@ class ManualReviewManager:
             context = {}
         review_id = 1  # Dummy ID
         safe_title = title if title is not None else "(no title)"
-        console.print(
+        _console().print(
             f"[yellow]📋 [STUB] Added to manual review queue (ID: {review_id}): {safe_title}[/yellow]"
         )
         return review_id
 
-    def get_pending_reviews(self) -> List[Dict]:
+    def get_pending_reviews(
+        self, review_type: Optional[str] = None, min_priority: Optional[int] = None
+    ) -> List[Dict]:
         """
         Get all pending manual review items.
 
+        Args:
+            review_type: Only return items of this review type
+            min_priority: Only return items at or above this priority
+
         Returns:
             List of pending review items
         """
-        # TODO: Implement real DB support for manual review queue
-        return []
+        return self.get_review_queue_page(
+            "pending", limit=None, review_type=review_type, min_priority=min_priority
+        )
 
     def get_all_reviews(self) -> List[Dict]:
         """
@@ -83,21 +166,83 @@ class ManualReviewManager:
         Returns:
             List of all review items
         """
-        # TODO: Implement real DB support for manual review queue
-        return []
+        return self.get_review_queue_page(status=None, limit=None)
 
-    def display_review_queue(self, status: str = "pending") -> None:
+    def get_review_queue_page(
+        self,
+        status: Optional[str] = "pending",
+        limit: Optional[int] = 50,
+        offset: int = 0,
+        review_type: Optional[str] = None,
+        min_priority: Optional[int] = None,
+    ) -> List[Dict]:
         """
-        Display the manual review queue in a formatted table.
+        Get one page of the review queue, highest priority first.
+
+        Filters and pagination all run inside SQLite, so only the rows a
+        caller actually needs cross into Python; with the (status,
+        priority) index, status-filtered queries are index range scans.
+
+        Args:
+            status: Status filter, or None for all statuses
+            limit: Maximum number of items per page, or None for all
+            offset: Number of items to skip
+            review_type: Only return items of this review type
+            min_priority: Only return items at or above this priority
+
+        Returns:
+            List of review items for the requested page
+        """
+        try:
+            clauses = []
+            params: List = []
+            if status is not None:
+                clauses.append("mrq.status = ?")
+                params.append(status)
+            if review_type is not None:
+                clauses.append("mrq.review_type = ?")
+                params.append(review_type)
+            if min_priority is not None:
+                clauses.append("mrq.priority >= ?")
+                params.append(min_priority)
+
+            sql = (
+                "SELECT mrq.id, mrq.priority, mrq.review_type, mrq.title, "
+                "mrq.created_at, j.title AS job_title, j.company "
+                "FROM manual_review_queue mrq "
+                "JOIN jobs j ON mrq.job_id = j.id"
+            )
+            if clauses:
+                sql += " WHERE " + " AND ".join(clauses)
+            sql += " ORDER BY mrq.priority DESC, mrq.created_at DESC"
+            if limit is not None:
+                sql += " LIMIT ? OFFSET ?"
+                params.extend([limit, offset])
+
+            cursor = self._get_conn().execute(sql, tuple(params))
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            _console().print(f"[red]❌ Error getting review queue: {e}[/red]")
+            return []
+
+    def display_review_queue(
+        self, status: str = "pending", limit: int = 50, offset: int = 0
+    ) -> None:
+        """
+        Display one page of the manual review queue in a formatted table.
 
         Args:
             status: Status filter for items to display
+            limit: Maximum number of items to render
+            offset: Number of items to skip (for paging)
         """
-        # TODO: Implement real DB support for manual review queue
-        items = []
+        from rich.table import Table
+
+        items = self.get_review_queue_page(status, limit, offset)
 
         if not items:
-            console.print(f"[green]✅ No {status} manual review items found![/green]")
+            _console().print(f"[green]✅ No {status} manual review items found![/green]")
             return
 
         table = Table(title=f"Manual Review Queue - {status.title()} Items")
@@ -109,27 +254,22 @@ class ManualReviewManager:
         table.add_column("Issue", style="white")
         table.add_column("Created", style="dim", no_wrap=True)
 
+        add_row = table.add_row
         for item in items:
-            priority_map = {1: "Low", 2: "Med", 3: "High", 4: "URGENT"}
-            priority_str = priority_map.get(item["priority"], str(item["priority"]))
-
+            priority_str = _PRIORITY_MAP.get(item["priority"], str(item["priority"]))
             created_date = datetime.fromisoformat(item["created_at"]).strftime("%m/%d %H:%M")
 
-            table.add_row(
+            add_row(
                 str(item["id"]),
                 priority_str,
                 item["review_type"],
-                (
-                    item["job_title"][:30] + "..."
-                    if len(item["job_title"]) > 30
-                    else item["job_title"]
-                ),
-                item["company"][:20] + "..." if len(item["company"]) > 20 else item["company"],
-                item["title"][:40] + "..." if len(item["title"]) > 40 else item["title"],
+                _truncate(item["job_title"], 30),
+                _truncate(item["company"], 20),
+                _truncate(item["title"], 40),
                 created_date,
             )
 
-        console.print(table)
+        _console().print(table)
 
     def get_review_details(self, review_id: int) -> Dict:
         """
@@ -141,35 +281,56 @@ class ManualReviewManager:
         Returns:
             Dictionary with review details
         """
+        return self.get_review_details_bulk([review_id]).get(review_id, {})
+
+    def get_review_details_bulk(self, review_ids: Sequence[int]) -> Dict[int, Dict]:
+        """
+        Get detailed information for several review items in one query.
+
+        Fetching items one by one re-paid a connection and a JOIN per
+        item; a single IN query keeps queue listings at one round trip
+        no matter how many items are shown.
+
+        Args:
+            review_ids: Review queue IDs to fetch
+
+        Returns:
+            Dictionary mapping each found review ID to its details
+        """
+        if not review_ids:
+            return {}
+
         try:
-            import sqlite3
-
-            with sqlite3.connect(self.db.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-
-                cursor = conn.execute(
-                    """
-                    SELECT mrq.*, j.title, j.company, j.url, j.location, j.summary
-                    FROM manual_review_queue mrq
-                    JOIN jobs j ON mrq.job_id = j.id
-                    WHERE mrq.id = ?
-                """,
-                    (review_id,),
-                )
+            placeholders = ",".join("?" * len(review_ids))
+            cursor = self._get_conn().execute(
+                f"""
+                SELECT mrq.*, j.title, j.company, j.url, j.location, j.summary
+                FROM manual_review_queue mrq
+                JOIN jobs j ON mrq.job_id = j.id
+                WHERE mrq.id IN ({placeholders})
+            """,
+                tuple(review_ids),
+            )
 
-                row = cursor.fetchone()
-                if row:
-                    details = dict(row)
-                    # Parse JSON context data
-                    if details.get("context_data"):
-                        try:
-                            details["context_data"] = json.loads(details["context_data"])
-                        except:
-                            pass
-                    return details
+            details_by_id = {}
+            for row in cursor.fetchall():
+                details = dict(row)
+                # Parse JSON context data; the first-character check skips
+                # the parser (and its exception machinery) for empty or
+                # plain-text values, and only real decode errors are
+                # swallowed - not KeyboardInterrupt and friends like the
+                # old bare except did
+                context_data = details.get("context_data")
+                if isinstance(context_data, str) and context_data[:1] in "{[":
+                    try:
+                        details["context_data"] = _loads(context_data)
+                    except json.JSONDecodeError:
+                        pass
+                details_by_id[details["id"]] = details
+            return details_by_id
 
         except Exception as e:
-            console.print(f"[red]❌ Error getting review details: {e}[/red]")
+            _console().print(f"[red]❌ Error getting review details: {e}[/red]")
 
         return {}
 
@@ -180,10 +341,12 @@ class ManualReviewManager:
         Args:
             review_id: Review queue ID
         """
+        from rich.panel import Panel
+
         details = self.get_review_details(review_id)
 
         if not details:
-            console.print(f"[red]❌ Review item {review_id} not found[/red]")
+            _console().print(f"[red]❌ Review item {review_id} not found[/red]")
             return
 
         # Create detailed panel
@@ -196,7 +359,12 @@ class ManualReviewManager:
         safe_status = details.get("status") or ""
         safe_created = details.get("created_at") or ""
         safe_description = details.get("description") or ""
-        safe_context = json.dumps(details.get("context_data", {}), indent=2)
+        # Only pretty-print context when there is any; an empty or missing
+        # context skips the O(context size) dumps pass entirely
+        context_data = details.get("context_data")
+        safe_context = (
+            json.dumps(context_data, indent=2, ensure_ascii=False) if context_data else "{}"
+        )
         content = f"""
 [bold blue]Job Information:[/bold blue]
 • Title: {safe_title}
@@ -223,7 +391,7 @@ class ManualReviewManager:
             safe_title = "(no title)"
         panel_title = f"Manual Review #{review_id} - {safe_title[:50]}"
         panel = Panel(content, title=panel_title)
-        console.print(panel)
+        _console().print(panel)
 
     def resolve_review_item(self, review_id: int, resolution: str, reviewer: str = None) -> bool:
         """
@@ -237,29 +405,43 @@ class ManualReviewManager:
         Returns:
             True if successful
         """
-        try:
-            import sqlite3
+        if self.resolve_review_items([(review_id, resolution)], reviewer) == 0:
+            return False
+        _console().print(f"[green]✅ Review item {review_id} marked as resolved[/green]")
+        return True
 
-            with sqlite3.connect(self.db.db_path) as conn:
-                conn.execute(
-                    """
-                    UPDATE manual_review_queue 
-                    SET status = 'resolved', 
-                        resolution = ?, 
-                        reviewer = ?,
-                        reviewed_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """,
-                    (resolution, reviewer or self.profile_name, review_id),
-                )
+    def resolve_review_items(
+        self, resolutions: Sequence[tuple], reviewer: Optional[str] = None
+    ) -> int:
+        """
+        Mark several review items as resolved in one transaction.
+
+        Resolving item by item paid one commit (and WAL fsync) per row;
+        executemany inside a single transaction pays it once for the
+        whole batch.
+
+        Args:
+            resolutions: (review_id, resolution) pairs
+            reviewer: Who resolved them (defaults to the profile name)
 
-                conn.commit()
-                console.print(f"[green]✅ Review item {review_id} marked as resolved[/green]")
-                return True
+        Returns:
+            Number of rows updated
+        """
+        if not resolutions:
+            return 0
+
+        try:
+            reviewer = reviewer or self.profile_name
+            with self._get_conn() as conn:
+                cursor = conn.executemany(
+                    _SQL_RESOLVE,
+                    [(resolution, reviewer, review_id) for review_id, resolution in resolutions],
+                )
+                return cursor.rowcount
 
         except Exception as e:
-            console.print(f"[red]❌ Error resolving review item: {e}[/red]")
-            return False
+            _console().print(f"[red]❌ Error resolving review items: {e}[/red]")
+            return 0
 
     def skip_review_item(self, review_id: int, reason: str = "") -> bool:
         """
@@ -272,29 +454,38 @@ class ManualReviewManager:
         Returns:
             True if successful
         """
-        try:
-            import sqlite3
+        if self.skip_review_items([(review_id, reason)]) == 0:
+            return False
+        _console().print(f"[yellow]⏭️ Review item {review_id} skipped[/yellow]")
+        return True
 
-            with sqlite3.connect(self.db.db_path) as conn:
-                conn.execute(
-                    """
-                    UPDATE manual_review_queue 
-                    SET status = 'skipped', 
-                        resolution = ?, 
-                        reviewer = ?,
-                        reviewed_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """,
-                    (f"Skipped: {reason}", self.profile_name, review_id),
-                )
+    def skip_review_items(self, skips: Sequence[tuple]) -> int:
+        """
+        Skip several review items in one transaction.
+
+        Args:
+            skips: (review_id, reason) pairs
 
-                conn.commit()
-                console.print(f"[yellow]⏭️ Review item {review_id} skipped[/yellow]")
-                return True
+        Returns:
+            Number of rows updated
+        """
+        if not skips:
+            return 0
+
+        try:
+            with self._get_conn() as conn:
+                cursor = conn.executemany(
+                    _SQL_SKIP,
+                    [
+                        (f"Skipped: {reason}", self.profile_name, review_id)
+                        for review_id, reason in skips
+                    ],
+                )
+                return cursor.rowcount
 
         except Exception as e:
-            console.print(f"[red]❌ Error skipping review item: {e}[/red]")
-            return False
+            _console().print(f"[red]❌ Error skipping review items: {e}[/red]")
+            return 0
 
     def get_review_statistics(self) -> Dict:
         """
@@ -304,34 +495,36 @@ class ManualReviewManager:
             Dictionary with review statistics
         """
         try:
-            import sqlite3
-
-            with sqlite3.connect(self.db.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT 
-                        status,
-                        review_type,
-                        priority,
-                        COUNT(*) as count
-                    FROM manual_review_queue
-                    GROUP BY status, review_type, priority
-                """
-                )
-
-                stats = {"by_status": {}, "by_type": {}, "by_priority": {}, "total": 0}
+            conn = self._get_conn()
 
-                for row in cursor.fetchall():
-                    status, review_type, priority, count = row
-                    stats["by_status"][status] = stats["by_status"].get(status, 0) + count
-                    stats["by_type"][review_type] = stats["by_type"].get(review_type, 0) + count
-                    stats["by_priority"][priority] = stats["by_priority"].get(priority, 0) + count
-                    stats["total"] += count
+            # One narrow GROUP BY per dimension keeps the aggregation in
+            # SQLite: at most a handful of rows cross into Python instead
+            # of the full status x type x priority cross-product
+            by_status = dict(
+                conn.execute(
+                    "SELECT status, COUNT(*) FROM manual_review_queue GROUP BY status"
+                ).fetchall()
+            )
+            by_type = dict(
+                conn.execute(
+                    "SELECT review_type, COUNT(*) FROM manual_review_queue GROUP BY review_type"
+                ).fetchall()
+            )
+            by_priority = dict(
+                conn.execute(
+                    "SELECT priority, COUNT(*) FROM manual_review_queue GROUP BY priority"
+                ).fetchall()
+            )
 
-                return stats
+            return {
+                "by_status": by_status,
+                "by_type": by_type,
+                "by_priority": by_priority,
+                "total": sum(by_status.values()),
+            }
 
         except Exception as e:
-            console.print(f"[red]❌ Error getting review statistics: {e}[/red]")
+            _console().print(f"[red]❌ Error getting review statistics: {e}[/red]")
             return {"by_status": {}, "by_type": {}, "by_priority": {}, "total": 0}
 
     def add_job_for_review(self, job: dict) -> bool:
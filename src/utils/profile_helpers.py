@@ -6,6 +6,11 @@ Handles loading, validation, and management of user profiles.
 import json
 import os
 from pathlib import Path
+
+try:
+    import orjson  # C-backed JSON parser, 2-5x faster than stdlib json
+except ImportError:
+    orjson = None
 from typing import List, Dict, Optional, Union
 from rich.console import Console
 
@@ -86,8 +91,11 @@ def _load_profile_from_file(profile_name: str) -> Optional[Dict]:
     try:
         profile_path = Path(f"profiles/{profile_name}/{profile_name}.json")
         if profile_path.exists():
-            with open(profile_path, "r", encoding="utf-8") as f:
-                profile_data = json.load(f)
+            if orjson is not None:
+                profile_data = orjson.loads(profile_path.read_bytes())
+            else:
+                with open(profile_path, "r", encoding="utf-8") as f:
+                    profile_data = json.load(f)
             return profile_data
         else:
             return None
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the CSV applicator.
+Covers streaming CSV iteration and applied-job filtering.
+"""
+
+import csv
+
+import pytest
+
+from src.ats.csv_applicator import CSVApplicator
+from src.utils.job_helpers import generate_job_hash
+
+
+def _write_csv(path, rows, headers=("title", "company", "url", "ats_type")):
+    """Write a small jobs CSV and return its path as a string."""
+    with open(path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(headers)
+        writer.writerows(rows)
+    return str(path)
+
+
+@pytest.mark.unit
+class TestIterCsvJobs:
+    """Test streaming iteration over CSV job rows."""
+
+    def test_yields_one_dict_per_row_in_order(self, temp_dir):
+        """Rows come back lazily, in file order."""
+        path = _write_csv(
+            temp_dir / "jobs.csv",
+            [
+                ("Developer", "Acme", "https://example.com/1", "workday"),
+                ("Analyst", "Globex", "https://example.com/2", "lever"),
+            ],
+        )
+        applicator = CSVApplicator("test_profile", path)
+
+        jobs = list(applicator.iter_csv_jobs())
+
+        assert [job["title"] for job in jobs] == ["Developer", "Analyst"]
+        assert jobs[0]["company"] == "Acme"
+
+    def test_missing_columns_default_to_empty_strings(self, temp_dir):
+        """Guaranteed fields exist even when the CSV omits their columns."""
+        path = _write_csv(
+            temp_dir / "jobs.csv",
+            [("Developer", "Acme", "https://example.com/1")],
+            headers=("title", "company", "url"),
+        )
+        applicator = CSVApplicator("test_profile", path)
+
+        job = next(applicator.iter_csv_jobs())
+
+        assert job["location"] == ""
+        assert job["description"] == ""
+        assert job["ats_type"] == "unknown"
+
+    def test_rows_carry_a_precomputed_hash(self, temp_dir):
+        """Each row is hashed once at read time, matching generate_job_hash."""
+        path = _write_csv(
+            temp_dir / "jobs.csv",
+            [("Developer", "Acme", "https://example.com/1", "workday")],
+        )
+        applicator = CSVApplicator("test_profile", path)
+
+        job = next(applicator.iter_csv_jobs())
+
+        assert job["_hash"] == generate_job_hash(job)
+
+    def test_missing_file_yields_nothing(self, temp_dir):
+        """A nonexistent CSV produces an empty iterator, not an exception."""
+        applicator = CSVApplicator("test_profile", str(temp_dir / "missing.csv"))
+
+        assert list(applicator.iter_csv_jobs()) == []
+
+
+@pytest.mark.unit
+class TestFilterAppliedJobs:
+    """Test dropping jobs already applied to by hash."""
+
+    def _jobs(self, temp_dir, count=3):
+        path = _write_csv(
+            temp_dir / "jobs.csv",
+            [
+                (f"Job {i}", f"Company {i}", f"https://example.com/{i}", "workday")
+                for i in range(count)
+            ],
+        )
+        applicator = CSVApplicator("test_profile", path)
+        return applicator, list(applicator.iter_csv_jobs())
+
+    def test_drops_jobs_with_applied_hashes(self, temp_dir):
+        """Jobs whose hash is in the applied set are removed."""
+        applicator, jobs = self._jobs(temp_dir)
+
+        remaining = applicator.filter_applied_jobs(jobs, {jobs[1]["_hash"]})
+
+        assert [job["title"] for job in remaining] == ["Job 0", "Job 2"]
+
+    def test_empty_applied_set_keeps_all_jobs(self, temp_dir):
+        """With nothing applied yet, every job survives, in order."""
+        applicator, jobs = self._jobs(temp_dir)
+
+        remaining = applicator.filter_applied_jobs(jobs, set())
+
+        assert remaining == jobs
+
+    def test_jobs_without_precomputed_hash_are_hashed_on_the_fly(self, temp_dir):
+        """Filtering works for job dicts that never went through the CSV reader."""
+        applicator, jobs = self._jobs(temp_dir, count=1)
+        bare = {k: v for k, v in jobs[0].items() if k != "_hash"}
+
+        remaining = applicator.filter_applied_jobs([bare], {jobs[0]["_hash"]})
+
+        assert remaining == []
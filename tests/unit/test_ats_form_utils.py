@@ -11,6 +11,7 @@ from pathlib import Path
 from playwright.async_api import Page
 
 from src.ats.form_utils import (
+    FIELD_SELECTORS,
     find_and_click_apply_button,
     fill_form_fields,
     upload_resume,
@@ -23,6 +24,12 @@ from src.ats.form_utils import (
     generate_cover_letter_text,
 )
 
+# Selectors the batched probe reports for name/email matches, as the
+# browser-side helper would return them
+FIRST_NAME_SELECTOR = FIELD_SELECTORS[0][0]
+LAST_NAME_SELECTOR = FIELD_SELECTORS[1][0]
+EMAIL_SELECTOR = FIELD_SELECTORS[3][0]
+
 
 class TestFindAndClickApplyButton:
     """Test the find_and_click_apply_button function."""
@@ -35,9 +42,9 @@ class TestFindAndClickApplyButton:
 
     @pytest.mark.asyncio
     async def test_find_apply_button_success_standard_button(self, mock_page):
-        """Test finding and clicking a standard apply button."""
-        # Arrange
-        mock_page.is_visible.return_value = True
+        """Test finding and clicking a probe-tagged apply button."""
+        # Arrange: the probe tags a visible button and reports its selector
+        mock_page.evaluate.return_value = "button:has-text('Apply')"
         mock_page.click = AsyncMock()
         mock_page.wait_for_load_state = AsyncMock()
 
@@ -46,14 +53,14 @@ class TestFindAndClickApplyButton:
 
         # Assert
         assert result is True
-        mock_page.click.assert_called_once()
+        mock_page.click.assert_called_once_with("[data-joblens-apply]")
         mock_page.wait_for_load_state.assert_called_once_with("domcontentloaded")
 
     @pytest.mark.asyncio
     async def test_find_apply_button_no_button_found(self, mock_page):
-        """Test when no apply button is found."""
+        """Test when the probe finds no visible apply button."""
         # Arrange
-        mock_page.is_visible.return_value = False
+        mock_page.evaluate.return_value = None
 
         # Act
         result = await find_and_click_apply_button(mock_page)
@@ -62,17 +69,37 @@ class TestFindAndClickApplyButton:
         assert result is False
         mock_page.click.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_find_apply_button_falls_back_to_inline_probe(self, mock_page):
+        """Test the inline-source retry when the warm helper is absent."""
+        # Arrange: window.__joblensProbe is missing, the raw source works
+        mock_page.evaluate.side_effect = [
+            Exception("window.__joblensProbe is not defined"),
+            "button:has-text('Apply')",
+        ]
+        mock_page.click = AsyncMock()
+        mock_page.wait_for_load_state = AsyncMock()
+
+        # Act
+        result = await find_and_click_apply_button(mock_page)
+
+        # Assert
+        assert result is True
+        assert mock_page.evaluate.call_count == 2
+        mock_page.click.assert_called_once_with("[data-joblens-apply]")
+
     @pytest.mark.asyncio
     async def test_find_apply_button_handles_exception(self, mock_page):
-        """Test exception handling when clicking fails."""
+        """Test exception handling when both probe paths fail."""
         # Arrange
-        mock_page.is_visible.side_effect = Exception("Page error")
+        mock_page.evaluate.side_effect = Exception("Page error")
 
         # Act
         result = await find_and_click_apply_button(mock_page)
 
         # Assert
         assert result is False
+        mock_page.click.assert_not_called()
 
 
 class TestFillFormFields:
@@ -98,13 +125,12 @@ class TestFillFormFields:
 
     @pytest.mark.asyncio
     async def test_fill_form_fields_success(self, mock_page, sample_profile):
-        """Test successful form field filling."""
-        # Arrange
+        """Test successful form field filling via the batched probe."""
+        # Arrange: the probe reports one visible empty email field
         mock_element = AsyncMock()
-        mock_element.is_visible.return_value = True
-        mock_element.input_value.return_value = ""  # Empty field
         mock_element.fill = AsyncMock()
-        
+
+        mock_page.evaluate.return_value = {"email": [EMAIL_SELECTOR, 0]}
         mock_page.query_selector_all.return_value = [mock_element]
 
         # Act
@@ -112,37 +138,40 @@ class TestFillFormFields:
 
         # Assert
         assert fields_filled > 0
-        mock_element.fill.assert_called()
+        mock_element.fill.assert_called_once_with(sample_profile["email"])
+        mock_page.query_selector_all.assert_called_once_with(EMAIL_SELECTOR)
 
     @pytest.mark.asyncio
     async def test_fill_form_fields_skips_filled_fields(self, mock_page, sample_profile):
         """Test that already filled fields are skipped."""
-        # Arrange
-        mock_element = AsyncMock()
-        mock_element.is_visible.return_value = True
-        mock_element.input_value.return_value = "existing value"  # Already filled
-        mock_element.fill = AsyncMock()
-        
-        mock_page.query_selector_all.return_value = [mock_element]
+        # Arrange: the probe only reports empty fields, so a page whose
+        # fields all carry values produces no matches
+        mock_page.evaluate.return_value = {}
+        mock_page.query_selector_all.return_value = []
 
         # Act
         fields_filled = await fill_form_fields(mock_page, sample_profile)
 
         # Assert
-        mock_element.fill.assert_not_called()
+        assert fields_filled == 0
+        mock_page.query_selector_all.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_fill_form_fields_handles_empty_profile(self, mock_page):
         """Test handling of empty profile data."""
         # Arrange
         empty_profile = {}
-        mock_page.query_selector_all.return_value = []
+        mock_page.evaluate.return_value = {}
 
         # Act
         fields_filled = await fill_form_fields(mock_page, empty_profile)
 
         # Assert
         assert fields_filled == 0
+        # An empty profile still generates a cover letter, so the probe
+        # runs — but with no name/email/phone probes in its payload
+        probes = mock_page.evaluate.call_args[0][1]
+        assert all(field == "cover_letter" for _, field in probes)
 
     @pytest.mark.asyncio
     async def test_fill_form_fields_name_splitting(self, mock_page):
@@ -150,18 +179,55 @@ class TestFillFormFields:
         # Arrange
         profile_with_full_name = {"name": "Jane Elizabeth Smith"}
         mock_element = AsyncMock()
-        mock_element.is_visible.return_value = True
-        mock_element.input_value.return_value = ""
         mock_element.fill = AsyncMock()
-        
+
+        mock_page.evaluate.return_value = {
+            "first_name": [FIRST_NAME_SELECTOR, 0],
+            "last_name": [LAST_NAME_SELECTOR, 0],
+        }
         mock_page.query_selector_all.return_value = [mock_element]
 
         # Act
         await fill_form_fields(mock_page, profile_with_full_name)
 
+        # Assert: filled with first name "Jane" and last name "Smith"
+        filled_values = {call.args[0] for call in mock_element.fill.call_args_list}
+        assert filled_values == {"Jane", "Smith"}
+
+    @pytest.mark.asyncio
+    async def test_fill_form_fields_falls_back_to_inline_probe(self, mock_page, sample_profile):
+        """Test the inline-source fallback when the warm helper is absent."""
+        # Arrange: the window.__joblensProbe call fails (context never ran
+        # install_form_helpers), the raw-source retry succeeds
+        mock_element = AsyncMock()
+        mock_element.fill = AsyncMock()
+
+        mock_page.evaluate.side_effect = [
+            Exception("window.__joblensProbe is not defined"),
+            {"email": [EMAIL_SELECTOR, 0]},
+        ]
+        mock_page.query_selector_all.return_value = [mock_element]
+
+        # Act
+        fields_filled = await fill_form_fields(mock_page, sample_profile)
+
+        # Assert
+        assert fields_filled == 1
+        assert mock_page.evaluate.call_count == 2
+        mock_element.fill.assert_called_once_with(sample_profile["email"])
+
+    @pytest.mark.asyncio
+    async def test_fill_form_fields_returns_zero_when_both_probes_fail(self, mock_page, sample_profile):
+        """Test that probe failure on both paths yields zero fills."""
+        # Arrange
+        mock_page.evaluate.side_effect = Exception("Execution context destroyed")
+
+        # Act
+        fields_filled = await fill_form_fields(mock_page, sample_profile)
+
         # Assert
-        # Should have called fill with first name "Jane" and last name "Smith"
-        assert mock_element.fill.call_count > 0
+        assert fields_filled == 0
+        mock_page.query_selector_all.assert_not_called()
 
 
 class TestFileUpload:
@@ -189,20 +255,19 @@ class TestFileUpload:
 
     @pytest.mark.asyncio
     async def test_upload_resume_success(self, mock_page, temp_resume_file):
-        """Test successful resume upload."""
-        # Arrange
-        mock_element = AsyncMock()
-        mock_element.is_visible.return_value = True
-        mock_element.set_input_files = AsyncMock()
-        
-        mock_page.query_selector_all.return_value = [mock_element]
+        """Test successful resume upload via the probe-tagged input."""
+        # Arrange: the probe tags a visible file input
+        mock_page.evaluate.return_value = "input[type='file'][name*='resume']"
+        mock_page.set_input_files = AsyncMock()
 
         # Act
         result = await upload_resume(mock_page, temp_resume_file)
 
         # Assert
         assert result is True
-        mock_element.set_input_files.assert_called_once_with(temp_resume_file)
+        mock_page.set_input_files.assert_called_once_with(
+            "[data-joblens-resume]", temp_resume_file
+        )
 
     @pytest.mark.asyncio
     async def test_upload_resume_file_not_found(self, mock_page):
@@ -227,20 +292,33 @@ class TestFileUpload:
 
     @pytest.mark.asyncio
     async def test_upload_cover_letter_success(self, mock_page, temp_cover_letter_file):
-        """Test successful cover letter upload."""
+        """Test successful cover letter upload via the probe-tagged input."""
         # Arrange
-        mock_element = AsyncMock()
-        mock_element.is_visible.return_value = True
-        mock_element.set_input_files = AsyncMock()
-        
-        mock_page.query_selector_all.return_value = [mock_element]
+        mock_page.evaluate.return_value = "input[type='file'][name*='cover']"
+        mock_page.set_input_files = AsyncMock()
 
         # Act
         result = await upload_cover_letter(mock_page, temp_cover_letter_file)
 
         # Assert
         assert result is True
-        mock_element.set_input_files.assert_called_once_with(temp_cover_letter_file)
+        mock_page.set_input_files.assert_called_once_with(
+            "[data-joblens-cover-letter]", temp_cover_letter_file
+        )
+
+    @pytest.mark.asyncio
+    async def test_upload_resume_no_input_found(self, mock_page, temp_resume_file):
+        """Test resume upload when the probe finds no visible file input."""
+        # Arrange
+        mock_page.evaluate.return_value = None
+        mock_page.set_input_files = AsyncMock()
+
+        # Act
+        result = await upload_resume(mock_page, temp_resume_file)
+
+        # Assert
+        assert result is False
+        mock_page.set_input_files.assert_not_called()
 
 
 class TestNavigationButtons:
@@ -256,7 +334,7 @@ class TestNavigationButtons:
     async def test_click_next_or_continue_success(self, mock_page):
         """Test successful next/continue button click."""
         # Arrange
-        mock_page.is_visible.return_value = True
+        mock_page.evaluate.return_value = "button:has-text('Next')"
         mock_page.click = AsyncMock()
         mock_page.wait_for_load_state = AsyncMock()
 
@@ -265,28 +343,29 @@ class TestNavigationButtons:
 
         # Assert
         assert result is True
-        mock_page.click.assert_called_once()
+        mock_page.click.assert_called_once_with("[data-joblens-next]")
 
     @pytest.mark.asyncio
     async def test_click_next_or_continue_no_button(self, mock_page):
-        """Test when no next/continue button is found."""
+        """Test when the probe finds no visible next/continue button."""
         # Arrange
-        mock_page.is_visible.return_value = False
+        mock_page.evaluate.return_value = None
 
         # Act
         result = await click_next_or_continue(mock_page)
 
         # Assert
         assert result is False
+        mock_page.click.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_click_submit_button_with_confirmation(self, mock_page):
         """Test submit button click with confirmation."""
         # Arrange
-        mock_page.is_visible.return_value = True
+        mock_page.evaluate.return_value = "button:has-text('Submit')"
         mock_page.click = AsyncMock()
         mock_page.wait_for_load_state = AsyncMock()
-        
+
         # Mock confirmation check
         with patch('src.ats.form_utils.check_for_confirmation', return_value=True):
             # Act
@@ -294,7 +373,7 @@ class TestNavigationButtons:
 
         # Assert
         assert result is True
-        mock_page.click.assert_called_once()
+        mock_page.click.assert_called_once_with("[data-joblens-submit]")
 
 
 class TestPageChecks:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batched status updates on the job database.
+Covers update_job_statuses_batch and update_application_statuses_batch.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.core.job_database import ModernJobDatabase
+
+
+def _seed_jobs(db, count=3):
+    """Insert `count` jobs and return their database ids in insertion order."""
+    for i in range(count):
+        db.add_job(
+            {
+                "title": f"Developer {i}",
+                "company": f"Company {i}",
+                "url": f"https://example.com/job/{i}",
+            }
+        )
+    conn = sqlite3.connect(str(db.db_path))
+    try:
+        rows = conn.execute("SELECT id FROM jobs ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    return [row[0] for row in rows]
+
+
+def _fetch_columns(db, columns):
+    """Return the requested columns for all jobs, ordered by id."""
+    conn = sqlite3.connect(str(db.db_path))
+    try:
+        return conn.execute(f"SELECT {', '.join(columns)} FROM jobs ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.mark.unit
+class TestUpdateJobStatusesBatch:
+    """Test one-transaction batch updates of job status."""
+
+    def test_updates_every_listed_job(self, temp_dir):
+        """Each (job_id, status) pair lands on its row."""
+        db = ModernJobDatabase(str(temp_dir / "test.db"))
+        ids = _seed_jobs(db)
+
+        applied = db.update_job_statuses_batch(
+            [(ids[0], "applied"), (ids[2], "rejected")]
+        )
+
+        assert applied == 2
+        statuses = dict(_fetch_columns(db, ["id", "status"]))
+        assert statuses[ids[0]] == "applied"
+        assert statuses[ids[2]] == "rejected"
+        db.close()
+
+    def test_untouched_jobs_keep_their_status(self, temp_dir):
+        """Jobs absent from the batch are not modified."""
+        db = ModernJobDatabase(str(temp_dir / "test.db"))
+        ids = _seed_jobs(db)
+        before = dict(_fetch_columns(db, ["id", "status"]))
+
+        db.update_job_statuses_batch([(ids[0], "applied")])
+
+        after = dict(_fetch_columns(db, ["id", "status"]))
+        assert after[ids[1]] == before[ids[1]]
+        assert after[ids[2]] == before[ids[2]]
+        db.close()
+
+    def test_empty_batch_is_a_no_op(self, temp_dir):
+        """An empty update list returns 0 without touching the database."""
+        db = ModernJobDatabase(str(temp_dir / "test.db"))
+        _seed_jobs(db)
+
+        assert db.update_job_statuses_batch([]) == 0
+        db.close()
+
+
+@pytest.mark.unit
+class TestUpdateApplicationStatusesBatch:
+    """Test one-transaction batch updates of application status."""
+
+    def test_updates_status_and_notes(self, temp_dir):
+        """Status and processing notes are both written for each tuple."""
+        db = ModernJobDatabase(str(temp_dir / "test.db"))
+        ids = _seed_jobs(db)
+
+        applied = db.update_application_statuses_batch(
+            [(ids[0], "submitted", "via workday"), (ids[1], "failed", "captcha")]
+        )
+
+        assert applied == 2
+        rows = dict(
+            (row[0], (row[1], row[2]))
+            for row in _fetch_columns(db, ["id", "application_status", "processing_notes"])
+        )
+        assert rows[ids[0]] == ("submitted", "via workday")
+        assert rows[ids[1]] == ("failed", "captcha")
+        db.close()
+
+    def test_none_notes_keep_existing_notes(self, temp_dir):
+        """Passing None for notes preserves the row's current notes."""
+        db = ModernJobDatabase(str(temp_dir / "test.db"))
+        ids = _seed_jobs(db, count=1)
+        db.update_application_statuses_batch([(ids[0], "submitted", "first attempt")])
+
+        db.update_application_statuses_batch([(ids[0], "confirmed", None)])
+
+        rows = _fetch_columns(db, ["application_status", "processing_notes"])
+        assert rows[0] == ("confirmed", "first attempt")
+        db.close()
+
+    def test_empty_batch_is_a_no_op(self, temp_dir):
+        """An empty update list returns 0."""
+        db = ModernJobDatabase(str(temp_dir / "test.db"))
+        _seed_jobs(db, count=1)
+
+        assert db.update_application_statuses_batch([]) == 0
+        db.close()
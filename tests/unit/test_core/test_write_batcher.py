@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the asynchronous write batcher.
+Covers flush triggering, batch sizing, error handling, and shutdown.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.write_batcher import WriteBatcher
+
+
+@pytest.mark.unit
+class TestWriteBatcher:
+    """Test WriteBatcher batching and lifecycle behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_all_submitted_items(self):
+        """flush() returns only after every submitted item was written."""
+        flushed = []
+        batcher = WriteBatcher(flushed.extend, max_batch_size=50, flush_interval=0.01)
+
+        for i in range(10):
+            await batcher.submit(i)
+        await batcher.flush()
+
+        assert sorted(flushed) == list(range(10))
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_batches_never_exceed_max_batch_size(self):
+        """No single flush call receives more than max_batch_size items."""
+        batches = []
+        batcher = WriteBatcher(
+            lambda batch: batches.append(list(batch)), max_batch_size=4, flush_interval=0.5
+        )
+
+        for i in range(10):
+            await batcher.submit(i)
+        await batcher.flush()
+
+        assert all(len(batch) <= 4 for batch in batches)
+        # Every item arrives exactly once, in submission order
+        assert [item for batch in batches for item in batch] == list(range(10))
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_items_group_into_fewer_flushes_than_submissions(self):
+        """Group commit: many submissions produce few flush_fn calls."""
+        batches = []
+        batcher = WriteBatcher(
+            lambda batch: batches.append(list(batch)), max_batch_size=50, flush_interval=0.05
+        )
+
+        for i in range(20):
+            await batcher.submit(i)
+        await batcher.flush()
+
+        assert len(batches) < 20
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_remaining_and_stops_drain_task(self):
+        """close() writes queued items, then cancels the background task."""
+        flushed = []
+        batcher = WriteBatcher(flushed.extend, max_batch_size=50, flush_interval=0.01)
+
+        await batcher.submit("row")
+        await batcher.close()
+
+        assert flushed == ["row"]
+        assert batcher._drain_task is None
+
+    @pytest.mark.asyncio
+    async def test_flush_does_not_hang_when_flush_fn_raises(self):
+        """A failing flush_fn still marks its batch done, so flush() returns."""
+
+        def boom(batch):
+            raise RuntimeError("disk full")
+
+        batcher = WriteBatcher(boom, max_batch_size=2, flush_interval=0.01)
+        await batcher.submit(1)
+        await batcher.submit(2)
+
+        await asyncio.wait_for(batcher.flush(), timeout=2.0)
+        await batcher.close()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the manual review queue manager.
+Covers SQL-side filtering, ordering, and pagination of the review queue.
+"""
+
+import sqlite3
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.manual_review_manager import ManualReviewManager
+
+
+def _make_queue_db(db_path):
+    """Create a jobs + manual_review_queue schema with a small seeded queue."""
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(
+        """
+        CREATE TABLE jobs (
+            id INTEGER PRIMARY KEY,
+            title TEXT,
+            company TEXT
+        );
+        CREATE TABLE manual_review_queue (
+            id INTEGER PRIMARY KEY,
+            job_id INTEGER,
+            review_type TEXT,
+            title TEXT,
+            description TEXT,
+            status TEXT DEFAULT 'pending',
+            priority INTEGER DEFAULT 2,
+            resolution TEXT,
+            reviewer TEXT,
+            reviewed_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+    )
+    conn.execute("INSERT INTO jobs (id, title, company) VALUES (1, 'Dev', 'Acme')")
+    rows = [
+        # (id, review_type, title, status, priority)
+        (1, "captcha", "Solve captcha", "pending", 4),
+        (2, "form_error", "Missing field", "pending", 2),
+        (3, "captcha", "Solve captcha again", "pending", 3),
+        (4, "form_error", "Bad upload", "resolved", 4),
+        (5, "login", "Session expired", "pending", 1),
+    ]
+    conn.executemany(
+        "INSERT INTO manual_review_queue (id, job_id, review_type, title, status, priority) "
+        "VALUES (?, 1, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def _make_manager(temp_dir):
+    """Build a ManualReviewManager wired to a seeded temp database."""
+    db_path = temp_dir / "review_test.db"
+    _make_queue_db(db_path)
+    with patch(
+        "src.utils.manual_review_manager.get_job_db",
+        return_value=SimpleNamespace(db_path=str(db_path)),
+    ):
+        return ManualReviewManager("test_profile")
+
+
+@pytest.mark.unit
+class TestReviewQueuePage:
+    """Test get_review_queue_page filtering and pagination in SQL."""
+
+    def test_status_filter_excludes_other_statuses(self, temp_dir):
+        """Only rows matching the status filter come back."""
+        manager = _make_manager(temp_dir)
+
+        pending = manager.get_review_queue_page(status="pending", limit=None)
+
+        assert [item["id"] for item in pending] == [1, 3, 2, 5]
+        manager.close()
+
+    def test_results_ordered_by_priority_descending(self, temp_dir):
+        """Highest-priority items lead the page."""
+        manager = _make_manager(temp_dir)
+
+        items = manager.get_review_queue_page(status="pending", limit=None)
+
+        priorities = [item["priority"] for item in items]
+        assert priorities == sorted(priorities, reverse=True)
+        manager.close()
+
+    def test_limit_and_offset_page_through_the_queue(self, temp_dir):
+        """Consecutive pages cover the queue without overlap."""
+        manager = _make_manager(temp_dir)
+
+        page_one = manager.get_review_queue_page(status="pending", limit=2, offset=0)
+        page_two = manager.get_review_queue_page(status="pending", limit=2, offset=2)
+
+        assert [item["id"] for item in page_one] == [1, 3]
+        assert [item["id"] for item in page_two] == [2, 5]
+        manager.close()
+
+    def test_review_type_and_min_priority_filters(self, temp_dir):
+        """review_type and min_priority combine with the status filter."""
+        manager = _make_manager(temp_dir)
+
+        captchas = manager.get_review_queue_page(
+            status="pending", limit=None, review_type="captcha"
+        )
+        urgent = manager.get_review_queue_page(
+            status="pending", limit=None, min_priority=3
+        )
+
+        assert [item["id"] for item in captchas] == [1, 3]
+        assert [item["id"] for item in urgent] == [1, 3]
+        manager.close()
+
+    def test_none_status_returns_all_rows(self, temp_dir):
+        """status=None disables the status filter entirely."""
+        manager = _make_manager(temp_dir)
+
+        everything = manager.get_review_queue_page(status=None, limit=None)
+
+        assert len(everything) == 5
+        manager.close()
+
+    def test_get_pending_reviews_delegates_to_page_query(self, temp_dir):
+        """get_pending_reviews returns the full pending set, unpaginated."""
+        manager = _make_manager(temp_dir)
+
+        pending = manager.get_pending_reviews()
+
+        assert {item["id"] for item in pending} == {1, 2, 3, 5}
+        manager.close()